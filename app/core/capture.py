@@ -0,0 +1,249 @@
+# app/core/capture.py
+#
+# Opt-in capture of /api/v1 traffic for replay (PHOENIX_CAPTURE_PATH).
+#
+# A sampled share of requests (PHOENIX_CAPTURE_SAMPLE_RATE) is appended to a
+# JSONL file, one request per line: method, path, query, Content-Type and
+# Accept, the decoded body, plus the status and server time it got. The
+# file rotates past PHOENIX_CAPTURE_MAX_BYTES, keeping
+# PHOENIX_CAPTURE_BACKUPS old files (capture.jsonl.1, .2, ...).
+# benchmarks/bench_replay.py fires the captured traffic at an app instance.
+#
+# Bodies are sanitized before they are written:
+#   - subject names (a flat body's "name", any object with "name" and
+#     "year", including the subjects inside kerykeion_data) become "subject-<hash>". The hash is
+#     keyed by PHOENIX_CAPTURE_SALT, so a repeated request stays identical
+#     and still hits the render cache on replay
+#   - coordinates of those subjects are rounded to 0.1 degree
+#   - batch subject keys are hashed the same way, and job ids are replaced
+#     by their position
+# Headers other than Content-Type and Accept are never captured.
+#
+# Parsing, sanitizing and writing happen on a worker thread after the
+# response has been sent. Several workers must not share one file (rotation
+# is per process): put "{pid}" in the path when running app.server.
+
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.metrics import counter, incr
+from app.core.msgpack_codec import MSGPACK_REQUEST_TYPES, msgpack_available, unpackb
+
+logger = logging.getLogger("phoenix_charts.capture")
+
+CAPTURED_REQUESTS = counter(
+    "phoenix_requests_captured_total",
+    "Sampled /api/v1 requests by capture outcome (PHOENIX_CAPTURE_PATH).",
+    "result",
+)
+
+CAPTURE_PREFIX = "/api/v1/"
+# Batch job fields that may name an entry of BatchRequest.subjects
+_BATCH_SUBJECT_REFS = ("first", "second", "natal", "transit", "subject")
+
+
+def pseudonym(value: str) -> str:
+    key = settings.capture_salt.encode("utf-8")[:64]
+    return "subject-" + hashlib.blake2b(value.encode("utf-8"), key=key, digest_size=4).hexdigest()
+
+
+def _sanitize(node: Any) -> Any:
+    if isinstance(node, list):
+        return [_sanitize(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+    out = {key: _sanitize(value) for key, value in node.items()}
+    if isinstance(out.get("name"), str) and "year" in out:
+        out["name"] = pseudonym(out["name"])
+        for coord in ("lat", "lng"):
+            if isinstance(out.get(coord), (int, float)) and not isinstance(out[coord], bool):
+                out[coord] = round(out[coord], 1)
+    return out
+
+
+def _sanitize_batch(body: dict) -> dict:
+    subjects = body.get("subjects")
+    if isinstance(subjects, dict):
+        body["subjects"] = {pseudonym(key): value for key, value in subjects.items()}
+    jobs = body.get("jobs")
+    if isinstance(jobs, list):
+        for i, job in enumerate(jobs):
+            if not isinstance(job, dict):
+                continue
+            if "id" in job:
+                job["id"] = f"job-{i}"
+            payload = job.get("payload")
+            if isinstance(payload, dict):
+                for field in _BATCH_SUBJECT_REFS:
+                    if isinstance(payload.get(field), str):
+                        payload[field] = pseudonym(payload[field])
+    return body
+
+
+def sanitize_body(path: str, body: Any) -> Any:
+    """`body` of a request to `path` with names and precise locations removed."""
+    body = _sanitize(body)
+    if isinstance(body, dict) and isinstance(body.get("name"), str) and "year" not in body:
+        # Flat natal / wheel bodies are the subject even when incomplete
+        body["name"] = pseudonym(body["name"])
+    if path.rstrip("/").endswith("/batch") and isinstance(body, dict):
+        body = _sanitize_batch(body)
+    return body
+
+
+class CaptureFile:
+    """Append-only JSONL file rotated by size; safe to share between threads."""
+
+    def __init__(self, path: str, max_bytes: int, backups: int):
+        self.template = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._file = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        # Resolved per write: app.server forks its workers after import
+        return Path(self.template.replace("{pid}", str(os.getpid())))
+
+    def append(self, line: str) -> None:
+        data = line.encode("utf-8") + b"\n"
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "ab")
+            size = self._file.tell()
+            if size and self.max_bytes > 0 and size + len(data) > self.max_bytes:
+                self._rotate()
+            self._file.write(data)
+            self._file.flush()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        path = self.path
+        if self.backups > 0:
+            for i in range(self.backups - 1, 0, -1):
+                older = path.with_name(f"{path.name}.{i}")
+                if older.exists():
+                    older.replace(path.with_name(f"{path.name}.{i + 1}"))
+            path.replace(path.with_name(f"{path.name}.1"))
+        else:
+            path.unlink()
+        self._file = open(path, "ab")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _header(scope, name: bytes) -> str:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
+
+def _decode_body(content_type: str, body: bytes) -> Any:
+    """The request body as JSON-compatible data, or raises ValueError."""
+    if not body:
+        return None
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type in MSGPACK_REQUEST_TYPES:
+        if not msgpack_available():
+            raise ValueError("msgpack is not installed")
+        return unpackb(body)
+    return json.loads(body)
+
+
+class RequestCaptureMiddleware:
+    """ASGI middleware appending sampled, sanitized /api/v1 requests to a CaptureFile."""
+
+    def __init__(self, app, capture_file: CaptureFile | None = None):
+        self.app = app
+        self.capture_file = capture_file or CaptureFile(
+            settings.capture_path, settings.capture_max_bytes, settings.capture_backups
+        )
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not scope["path"].startswith(CAPTURE_PREFIX)
+            or random.random() >= settings.capture_sample_rate
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        chunks: list[bytes] = []
+        state = {"size": 0, "complete": False, "status": 0}
+
+        async def receive_and_keep():
+            message = await receive()
+            if message["type"] == "http.request":
+                body = message.get("body", b"")
+                state["size"] += len(body)
+                if state["size"] <= settings.capture_max_body_bytes:
+                    chunks.append(body)
+                if not message.get("more_body", False):
+                    state["complete"] = True
+            return message
+
+        async def send_and_note_status(message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive_and_keep, send_and_note_status)
+        except Exception:
+            state["status"] = state["status"] or 500
+            await self._capture(scope, state, chunks, start)
+            raise
+        await self._capture(scope, state, chunks, start)
+
+    async def _capture(self, scope, state: dict, chunks: list[bytes], start: float) -> None:
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        if state["size"] > settings.capture_max_body_bytes:
+            incr(CAPTURED_REQUESTS, "too_large")
+            return
+        if not state["complete"] and _header(scope, b"content-length") not in ("", "0"):
+            # The handler never read its body (e.g. an early 415)
+            incr(CAPTURED_REQUESTS, "unparsed")
+            return
+        record = {
+            "ts": round(time.time(), 3),
+            "method": scope["method"],
+            "path": scope["path"],
+            "query": scope.get("query_string", b"").decode("latin-1"),
+            "content_type": _header(scope, b"content-type"),
+            "accept": _header(scope, b"accept"),
+            "status": state["status"],
+            "ms": round(elapsed_ms, 1),
+        }
+        await run_in_threadpool(self._write, record, b"".join(chunks))
+
+    def _write(self, record: dict, body: bytes) -> None:
+        try:
+            record["body"] = sanitize_body(record["path"], _decode_body(record["content_type"], body))
+        except ValueError:  # includes JSONDecodeError and msgpack's unpack errors
+            incr(CAPTURED_REQUESTS, "unparsed")
+            return
+        try:
+            self.capture_file.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        except OSError as e:
+            incr(CAPTURED_REQUESTS, "failed")
+            logger.warning("[capture] could not write %s: %s", self.capture_file.path, e)
+            return
+        incr(CAPTURED_REQUESTS, "written")
@@ -0,0 +1,77 @@
+# app/core/compression.py
+#
+# Content-Encoding for rendered chart bodies (JSON / SVG).
+#
+# Wheel SVGs are 200-290 KB of very repetitive XML, so gzip / brotli cut
+# the bytes on the wire by 5-10x. Encoded bodies are cached next to the
+# identity body (see render_response), so a cache hit never recompresses.
+# brotli is optional: without the package only gzip is offered.
+
+import gzip
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Media types worth compressing (PDFs are already deflated internally;
+# msgpack chart bodies are mostly SVG markup)
+COMPRESSIBLE_TYPES = frozenset(
+    {"application/json", "image/svg+xml", "application/x-ndjson", "application/msgpack"}
+)
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Supported encodings in server preference order."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def _accepted(accept_encoding: str) -> dict[str, float]:
+    codings: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, *params = [p.strip() for p in part.split(";")]
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding:
+            codings[coding.lower()] = q
+    return codings
+
+
+def choose_encoding(accept_encoding: str | None, media_type: str, size: int | None = None) -> str | None:
+    """
+    Content-Encoding to use for a body, or None to send it as-is. The
+    client's q-values rank encodings; ties go to our preference (br first).
+    `size` None skips the minimum size check (body not known yet).
+    """
+    if (
+        not settings.compression_enabled
+        or not accept_encoding
+        or media_type not in COMPRESSIBLE_TYPES
+        or (size is not None and size < settings.compression_min_bytes)
+    ):
+        return None
+
+    codings = _accepted(accept_encoding)
+    best, best_q = None, 0.0
+    for encoding in available_encodings():
+        q = codings.get(encoding, codings.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        # mtime=0 keeps the output (and so the cached variant) deterministic
+        return gzip.compress(body, compresslevel=settings.gzip_level, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(body, quality=settings.brotli_quality)
+    raise ValueError(f"Unsupported content encoding: {encoding!r}")
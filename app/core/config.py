@@ -1,10 +1,113 @@
+import os
+
 from pydantic import BaseModel
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, "").strip() or default)
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, "").strip() or default)
+    except ValueError:
+        return default
+
+
+def _env_sizes(name: str, default: str) -> tuple[int, ...]:
+    """Comma-separated positive pixel sizes, sorted and deduplicated."""
+    raw = os.getenv(name, "").strip() or default
+    try:
+        sizes = {int(s) for s in raw.split(",") if s.strip()}
+    except ValueError:
+        raise ValueError(f"{name} must be comma-separated integers, got {raw!r}") from None
+    if not sizes or min(sizes) <= 0:
+        raise ValueError(f"{name} must list positive sizes in px, got {raw!r}")
+    return tuple(sorted(sizes))
+
+
 class Settings(BaseModel):
     app_name: str = "Phoenix Charts API"
     version: str = "0.1.0"
 
+    # HTTP worker processes forked by `python -m app.server` (0 = CPU count)
+    web_workers: int = _env_int("PHOENIX_WEB_WORKERS", 0) or (os.cpu_count() or 1)
+    # Render one dummy chart per theme before reporting ready on /health
+    warmup_enabled: bool = os.getenv("PHOENIX_WARMUP", "1").strip() == "1"
+
+    # Render execution backend: "process" (one pool process per core) or
+    # "thread" (bounded thread pool inside the uvicorn worker). Render
+    # threads share pyswisseph's process globals, so chart_generator computes
+    # subjects one at a time; any other code setting swe.set_* state must do
+    # so under the same lock.
+    render_backend: str = os.getenv("PHOENIX_RENDER_BACKEND", "process").strip().lower()
+    # 0 = size from CPU count
+    render_workers: int = _env_int("PHOENIX_RENDER_WORKERS", 0) or (os.cpu_count() or 1)
+    # Renders allowed to wait for a free worker before requests get a 503
+    render_queue_limit: int = _env_int("PHOENIX_RENDER_QUEUE_LIMIT", 32)
+    # Identical requests arriving while one is rendering share its render
+    single_flight_enabled: bool = os.getenv("PHOENIX_SINGLE_FLIGHT", "1").strip() == "1"
+    # Largest number of jobs accepted by POST /api/v1/batch
+    batch_max_jobs: int = _env_int("PHOENIX_BATCH_MAX_JOBS", 500)
+    # Largest time grid accepted by POST /api/v1/transit/series
+    transit_series_max_steps: int = _env_int("PHOENIX_TRANSIT_SERIES_MAX_STEPS", 20000)
+
+    # Content-addressed render cache (0 bytes = disabled)
+    cache_max_bytes: int = _env_int("PHOENIX_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+    cache_ttl_seconds: int = _env_int("PHOENIX_CACHE_TTL_SECONDS", 24 * 3600)
+    # Optional on-disk tier, shared by all workers on the host ("" = off)
+    cache_dir: str = os.getenv("PHOENIX_CACHE_DIR", "").strip()
+    cache_disk_max_bytes: int = _env_int("PHOENIX_CACHE_DISK_MAX_BYTES", 2 * 1024 * 1024 * 1024)
+    # Extra render version in the cache key; bump it when output changes
+    # without a change to the renderer / theme sources (e.g. new logos)
+    render_version: str = os.getenv("PHOENIX_RENDER_VERSION", "").strip()
+
+    # gzip / brotli Content-Encoding of chart JSON / SVG responses
+    compression_enabled: bool = os.getenv("PHOENIX_COMPRESSION", "1").strip() == "1"
+    compression_min_bytes: int = _env_int("PHOENIX_COMPRESSION_MIN_BYTES", 1024)
+    gzip_level: int = _env_int("PHOENIX_GZIP_LEVEL", 6)
+    brotli_quality: int = _env_int("PHOENIX_BROTLI_QUALITY", 5)
+
+    # AstrologicalSubjects memoized per render worker (0 = off)
+    subject_cache_size: int = _env_int("PHOENIX_SUBJECT_CACHE_SIZE", 1024)
+
+    # Converted glyphs / static rings reused across svg2rlg parses (0 = off)
+    svg_skeleton_cache_size: int = _env_int("PHOENIX_SVG_SKELETON_CACHE_SIZE", 2048)
+
+    # kerykeion_data -> chart model: full (validate), cached (memoized by
+    # payload hash) or trusted (structural check + model_construct)
+    kerykeion_validation: str = os.getenv("PHOENIX_KERYKEION_VALIDATION", "full").strip().lower()
+    # Validated models kept per render worker in cached mode (0 = off)
+    kerykeion_model_cache_size: int = _env_int("PHOENIX_KERYKEION_MODEL_CACHE_SIZE", 256)
+
+    # Per-stage timing spans, /metrics histograms and Server-Timing headers
+    metrics_enabled: bool = os.getenv("PHOENIX_METRICS", "1").strip() == "1"
+
+    # Resolution the PDF logos are pre-downscaled to for their printed size
+    logo_dpi: int = _env_int("PHOENIX_LOGO_DPI", 300)
+    # PDF output profile when a request names none: fast, balanced or small
+    pdf_profile: str = os.getenv("PHOENIX_PDF_PROFILE", "balanced").strip().lower()
+
+    # Chart image sizes (longest side, px) rendered together for /{chart}/image
+    image_sizes: tuple[int, ...] = _env_sizes("PHOENIX_IMAGE_SIZES", "256,512,1024")
+    webp_quality: int = _env_int("PHOENIX_WEBP_QUALITY", 80)
+
+    # Sanitized /api/v1 request bodies appended to this JSONL file for
+    # replay ("" = off); "{pid}" in the path gives each worker its own file
+    capture_path: str = os.getenv("PHOENIX_CAPTURE_PATH", "").strip()
+    # Fraction of requests captured (0..1)
+    capture_sample_rate: float = _env_float("PHOENIX_CAPTURE_SAMPLE_RATE", 1.0)
+    # Rotate the capture file past this size, keeping this many old files
+    capture_max_bytes: int = _env_int("PHOENIX_CAPTURE_MAX_BYTES", 64 * 1024 * 1024)
+    capture_backups: int = _env_int("PHOENIX_CAPTURE_BACKUPS", 3)
+    # Larger request bodies are not captured
+    capture_max_body_bytes: int = _env_int("PHOENIX_CAPTURE_MAX_BODY_BYTES", 4 * 1024 * 1024)
+    # Key of the hash that replaces subject names in captured bodies
+    capture_salt: str = os.getenv("PHOENIX_CAPTURE_SALT", "")
+
 
 settings = Settings()
 
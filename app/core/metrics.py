@@ -0,0 +1,248 @@
+# app/core/metrics.py
+#
+# Lightweight timing spans + Prometheus-format histograms.
+#
+#   with span("svg_parse"):
+#       drawing = svg2rlg(...)
+#
+# Spans recorded while a render runs on the pool (see render_executor) are
+# collected in the worker, shipped back with the result and then
+#   - observed into the per-stage histograms served on /metrics
+#   - added to the current request's Server-Timing header.
+# Counter increments (incr) made on a worker travel back the same way.
+# With PHOENIX_METRICS=0, span() returns a shared no-op context manager.
+
+import contextvars
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+# Upper bounds (seconds) of the stage duration histogram buckets
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_NULL_SPAN = nullcontext()
+
+# Spans of the render currently running in this worker / thread
+_collector: contextvars.ContextVar[list | None] = contextvars.ContextVar(
+    "phoenix_span_collector", default=None
+)
+# Spans of the HTTP request currently being served (for Server-Timing)
+_request_spans: contextvars.ContextVar[list | None] = contextvars.ContextVar(
+    "phoenix_request_spans", default=None
+)
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a single `stage` label."""
+
+    def __init__(self, name: str, help_text: str, buckets: tuple[float, ...] = BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        # stage -> [bucket counts..., +Inf count, sum]
+        self._series: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            series = self._series.get(stage)
+            if series is None:
+                series = self._series[stage] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    series[i] += 1
+            series[-2] += 1
+            series[-1] += seconds
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for stage, series in sorted(self._series.items()):
+                for bound, count in zip(self.buckets, series):
+                    lines.append(f'{self.name}_bucket{{stage="{stage}",le="{bound}"}} {count}')
+                lines.append(f'{self.name}_bucket{{stage="{stage}",le="+Inf"}} {series[-2]}')
+                lines.append(f'{self.name}_sum{{stage="{stage}"}} {series[-1]:.6f}')
+                lines.append(f'{self.name}_count{{stage="{stage}"}} {series[-2]}')
+        return lines
+
+
+STAGE_SECONDS = Histogram(
+    "phoenix_stage_duration_seconds",
+    "Time spent in each chart / PDF pipeline stage.",
+)
+
+
+class Counter:
+    """Monotonic counter keyed by a single label."""
+
+    def __init__(self, name: str, help_text: str, label: str):
+        self.name = name
+        self.help_text = help_text
+        self.label = label
+        self._values: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, value: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[value] = self._values.get(value, 0) + amount
+
+    def get(self, value: str) -> float:
+        return self._values.get(value, 0)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for value, count in sorted(self._values.items()):
+                lines.append(f'{self.name}{{{self.label}="{value}"}} {count}')
+        return lines
+
+
+# Counters by name, so increments shipped back from workers can be applied
+_counters: dict[str, Counter] = {}
+
+
+def counter(name: str, help_text: str, label: str) -> Counter:
+    """Create (or return the already registered) counter `name`."""
+    if name not in _counters:
+        _counters[name] = Counter(name, help_text, label)
+    return _counters[name]
+
+
+# Declared here rather than next to the caches they count, so the API
+# process can serve them (and apply increments shipped back from workers)
+# without importing the render stack.
+SUBJECT_LOOKUPS = counter(
+    "phoenix_subject_cache_lookups_total",
+    "AstrologicalSubject memo lookups.",
+    "result",
+)
+SKELETON_LOOKUPS = counter(
+    "phoenix_svg_skeleton_lookups_total",
+    "Cached SVG skeleton (glyph / static group) lookups.",
+    "result",
+)
+KERYKEION_MODEL_LOOKUPS = counter(
+    "phoenix_kerykeion_model_cache_lookups_total",
+    "Validated kerykeion_data model lookups (PHOENIX_KERYKEION_VALIDATION=cached).",
+    "result",
+)
+
+
+def incr(c: Counter, value: str, amount: float = 1) -> None:
+    """Increment `c{label=value}`; deferred to the parent when inside collect_spans."""
+    if not settings.metrics_enabled:
+        return
+    collector = _collector.get()
+    if collector is not None:
+        collector.append((c.name, value, amount))
+    else:
+        c.inc(value, amount)
+
+
+def _record(stage: str, seconds: float) -> None:
+    collector = _collector.get()
+    if collector is not None:
+        collector.append((stage, seconds))
+    else:
+        STAGE_SECONDS.observe(stage, seconds)
+
+
+class _Span:
+    __slots__ = ("stage", "_t0")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self) -> "_Span":
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        _record(self.stage, time.perf_counter() - self._t0)
+
+
+def span(stage: str):
+    """Time the enclosed block as pipeline stage `stage`."""
+    if not settings.metrics_enabled:
+        return _NULL_SPAN
+    return _Span(stage)
+
+
+def collect_spans(fn: Callable[..., T], *args: Any, **kwargs: Any) -> tuple[T, list]:
+    """
+    Run `fn` and return (result, spans recorded while it ran). Used as the
+    pool entry point so spans from worker processes make it back.
+    """
+    spans: list = []
+    token = _collector.set(spans)
+    try:
+        return fn(*args, **kwargs), spans
+    finally:
+        _collector.reset(token)
+
+
+def record_spans(spans: list) -> None:
+    """Observe spans returned by collect_spans and attach them to the request."""
+    timings = []
+    for item in spans:
+        if len(item) == 3:
+            # (counter name, label value, amount) from incr()
+            _counters[item[0]].inc(item[1], item[2])
+        else:
+            STAGE_SECONDS.observe(*item)
+            timings.append(item)
+    request_spans = _request_spans.get()
+    if request_spans is not None:
+        request_spans.extend(timings)
+
+
+def start_request() -> list:
+    """Begin collecting spans for Server-Timing in the current request context."""
+    spans: list = []
+    _request_spans.set(spans)
+    return spans
+
+
+def server_timing_header(spans: list) -> str:
+    """Server-Timing value with durations summed per stage, in first-seen order."""
+    totals: dict[str, float] = {}
+    for stage, seconds in spans:
+        totals[stage] = totals.get(stage, 0.0) + seconds
+    return ", ".join(f"{stage};dur={seconds * 1000.0:.1f}" for stage, seconds in totals.items())
+
+
+def render_prometheus(extra_lines: list[str] | None = None) -> str:
+    lines = STAGE_SECONDS.render()
+    for c in _counters.values():
+        lines.extend(c.render())
+    if extra_lines:
+        lines.extend(extra_lines)
+    return "\n".join(lines) + "\n"
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware adding a Server-Timing header built from the request's spans."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.metrics_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        spans = start_request()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start" and spans:
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing_header(spans).encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
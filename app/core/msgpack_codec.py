@@ -0,0 +1,101 @@
+# app/core/msgpack_codec.py
+#
+# MessagePack as an alternative to JSON on the /api/v1 endpoints.
+#
+# Requests: a body sent as Content-Type: application/msgpack is decoded into
+# the same dict a JSON body would give, so every request model validates it
+# unchanged (MsgpackRoute, the route class of the /api/v1 routers).
+#
+# Responses: endpoints returning JSON also offer application/msgpack via
+# Accept (or ?format=msgpack). The maps carry the same keys as the JSON,
+# except that raw SVG / PDF bytes travel as msgpack bin fields instead of
+# text or base64 (see chart_generator.generate_chart_msgpack_bytes and the
+# batch stream). JSON stays the default and its contract does not change.
+#
+# msgpack is optional: without the package, msgpack bodies get a 415 and
+# responses are never offered as msgpack.
+
+from typing import Any, Callable
+
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+MSGPACK_TYPE = "application/msgpack"
+# Content types accepted for msgpack request bodies
+MSGPACK_REQUEST_TYPES = frozenset({"application/msgpack", "application/x-msgpack", "application/vnd.msgpack"})
+
+
+def msgpack_available() -> bool:
+    return msgpack is not None
+
+
+def packb(obj: Any) -> bytes:
+    # use_bin_type: bytes -> bin, str -> str (the default, spelled out)
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+def packb_map_head(entries: dict, extra: int = 0) -> bytes:
+    """
+    A map of len(entries) + `extra` pairs, up to and including `entries`; the
+    caller appends the `extra` packed key / value pairs (e.g. an already
+    serialized body spliced in as a value).
+    """
+    packer = msgpack.Packer(use_bin_type=True)
+    out = packer.pack_map_header(len(entries) + extra)
+    for key, value in entries.items():
+        out += packer.pack(key) + packer.pack(value)
+    return out
+
+
+def unpackb(body: bytes) -> Any:
+    # Request bodies: str keys only, no ext types
+    return msgpack.unpackb(body, raw=False, strict_map_key=True)
+
+
+def _content_type(request: Request) -> str:
+    return (request.headers.get("content-type") or "").split(";")[0].strip().lower()
+
+
+class _MsgpackRequest(Request):
+    """Request whose msgpack body reads as a JSON one (see MsgpackRoute)."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            try:
+                self._json = unpackb(await self.body())
+            except ValueError as e:  # msgpack's unpack errors derive from it
+                detail = f"Malformed msgpack body ({type(e).__name__}: {e})" if str(e) else "Malformed msgpack body"
+                raise HTTPException(status_code=400, detail=detail)
+        return self._json
+
+
+class MsgpackRoute(APIRoute):
+    """
+    APIRoute that also takes application/msgpack request bodies.
+
+    FastAPI parses a body with request.json() when the Content-Type is JSON;
+    for msgpack bodies the handler gets a request that presents itself as
+    JSON and whose json() unpacks msgpack instead.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            if _content_type(request) not in MSGPACK_REQUEST_TYPES:
+                return await handler(request)
+            if msgpack is None:
+                raise HTTPException(status_code=415, detail="msgpack request bodies are not supported here")
+            scope = dict(request.scope)
+            scope["headers"] = [
+                (name, b"application/json" if name == b"content-type" else value)
+                for name, value in request.scope["headers"]
+            ]
+            return await handler(_MsgpackRequest(scope, request.receive))
+
+        return route_handler
@@ -1,6 +1,5 @@
 import os
-
-from openai import AsyncOpenAI
+from functools import lru_cache
 
 # Load .env if available to pick up OPENAI_API_KEY
 try:
@@ -10,18 +9,27 @@ try:
 except Exception:
     pass
 
-api_key = os.getenv("OPENAI_API_KEY", "").strip()
-if not api_key:
-    raise RuntimeError(
-        "OPENAI_API_KEY is not set. Please export it or add it to your .env before starting the server."
-    )
 
-client = AsyncOpenAI(api_key=api_key)
+@lru_cache(maxsize=1)
+def get_client():
+    """
+    The shared AsyncOpenAI client, created on first use so importing this
+    module neither loads the openai SDK nor requires a key.
+    """
+    api_key = os.getenv("OPENAI_API_KEY", "").strip()
+    if not api_key:
+        raise RuntimeError(
+            "OPENAI_API_KEY is not set. Please export it or add it to your .env before using the OpenAI client."
+        )
+
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(api_key=api_key)
 
 
 async def openai_stream_chat(messages: list[dict], model: str = "gpt-4o-mini"):
     try:
-        stream = await client.chat.completions.create(
+        stream = await get_client().chat.completions.create(
             model=model,
             messages=messages,
             temperature=0.7,
@@ -0,0 +1,341 @@
+# app/core/render_cache.py
+#
+# Content-addressed cache for rendered chart artifacts (JSON bodies, PDFs).
+#
+# The same birth data + theme always produce the same wheel, so renders are
+# keyed by a canonical hash of the normalized request (chart type, output
+# format and every request field, including a full kerykeion_data dict)
+# plus the render version, so a deploy that changes what a request renders
+# to never serves the old bytes. The key doubles as the HTTP ETag.
+#
+# Tiers:
+#   1. in-memory LRU bounded by total bytes, with a TTL
+#   2. optional on-disk directory (PHOENIX_CACHE_DIR), shared by every
+#      worker on the host; entries expire by mtime
+#
+# Only the memory tier is touched under the lock. Disk reads, writes and
+# pruning run outside it; async callers use the a* methods, which move the
+# disk work to a thread and keep the event loop free.
+
+import asyncio
+import functools
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from app.core.config import settings
+
+logger = logging.getLogger("phoenix_charts.cache")
+
+APP_DIR = Path(__file__).resolve().parents[1]
+# Sources whose changes alter rendered output: renderers and themes
+RENDER_SOURCES = ("services/**/*.py", "themes/*.css")
+
+
+@functools.cache
+def render_version() -> str:
+    """
+    Digest of everything a render depends on besides the request: the
+    renderer and theme sources, the Kerykeion version and
+    PHOENIX_RENDER_VERSION (bump it for changes outside the sources, e.g.
+    new logo images). Computed once per process.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for pattern in RENDER_SOURCES:
+        for path in sorted(APP_DIR.glob(pattern)):
+            digest.update(path.relative_to(APP_DIR).as_posix().encode())
+            digest.update(path.read_bytes())
+    try:
+        digest.update(importlib.metadata.version("kerykeion").encode())
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    digest.update(settings.render_version.encode())
+    return digest.hexdigest()
+
+
+def make_cache_key(chart_type: str, output_format: str, payload: Any) -> str:
+    """
+    Canonical content hash of a render request under the current render_version().
+
+    `payload` is typically `req.model_dump(mode="json")`; dict ordering and
+    JSON whitespace never affect the key.
+    """
+    canonical = json.dumps(
+        {"chart_type": chart_type, "format": output_format, "payload": payload, "version": render_version()},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """
+    Byte-bounded LRU + TTL cache of rendered bytes with an optional disk tier.
+
+    Safe to share between threads; all state changes happen under one lock.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl_seconds: float,
+        disk_dir: str | Path | None = None,
+        disk_max_bytes: int = 0,
+    ):
+        self.max_bytes = max(0, max_bytes)
+        self.ttl_seconds = ttl_seconds
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+
+        # key -> (stored_at, value)
+        self._entries: "OrderedDict[str, tuple[float, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._disk_bytes: int | None = None  # measured lazily
+        self._lock = threading.Lock()
+        # One disk measure / prune at a time; others skip it
+        self._prune_lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 or self.disk_dir is not None
+
+    # ------------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------------
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl_seconds > 0 and time.time() - stored_at > self.ttl_seconds
+
+    def _memory_put(self, key: str, value: bytes, stored_at: float) -> None:
+        if len(value) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old[1])
+        self._entries[key] = (stored_at, value)
+        self._bytes += len(value)
+        while self._bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / key
+
+    def _disk_get(self, key: str) -> tuple[float, bytes] | None:
+        path = self._disk_path(key)
+        try:
+            stored_at = path.stat().st_mtime
+            if self._expired(stored_at):
+                path.unlink(missing_ok=True)
+                return None
+            return stored_at, path.read_bytes()
+        except OSError:
+            return None
+
+    def _disk_put(self, key: str, value: bytes) -> None:
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            # Write + rename so concurrent readers never see a partial file
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(value)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("[cache] disk write failed for %s: %s", key, e)
+            return
+
+        if self.disk_max_bytes <= 0:
+            return
+        with self._lock:
+            measured = self._disk_bytes is not None
+            if measured:
+                self._disk_bytes += len(value)
+            over = measured and self._disk_bytes > self.disk_max_bytes
+        if (not measured or over) and self._prune_lock.acquire(blocking=False):
+            try:
+                self._prune_disk()
+            finally:
+                self._prune_lock.release()
+
+    def _disk_files(self) -> list[Path]:
+        return [p for p in self.disk_dir.glob("*/*") if not p.name.startswith(".tmp-")]
+
+    def _prune_disk(self) -> None:
+        """
+        Measure the disk tier and, when it is over budget, drop the oldest
+        files until it is back under 90% of it.
+        """
+        files = []
+        for p in self._disk_files():
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, p))
+
+        total = sum(size for _, size, _ in files)
+        evicted = 0
+        if total > self.disk_max_bytes:
+            files.sort()
+            target = self.disk_max_bytes * 0.9
+            for _, size, p in files:
+                if total <= target:
+                    break
+                p.unlink(missing_ok=True)
+                total -= size
+                evicted += 1
+        with self._lock:
+            self._disk_bytes = total
+            self.evictions += evicted
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def _memory_get(self, key: str) -> bytes | None:
+        """Memory-tier lookup; counts a hit."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._expired(entry[0]):
+                del self._entries[key]
+                self._bytes -= len(entry[1])
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def _promote(self, key: str, disk_entry: tuple[float, bytes] | None) -> bytes | None:
+        """Copy a disk-tier entry into memory; counts a disk hit."""
+        if disk_entry is None:
+            return None
+        with self._lock:
+            self._memory_put(key, disk_entry[1], disk_entry[0])
+            self.disk_hits += 1
+        return disk_entry[1]
+
+    def _count_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def get(self, key: str) -> bytes | None:
+        value = self._memory_get(key)
+        if value is None and self.disk_dir is not None:
+            value = self._promote(key, self._disk_get(key))
+        if value is None:
+            self._count_miss()
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._memory_put(key, value, time.time())
+        if self.disk_dir is not None:
+            self._disk_put(key, value)
+
+    async def aget(self, key: str) -> bytes | None:
+        """get() for the event loop: the disk tier is read on a thread."""
+        value = self._memory_get(key)
+        if value is None and self.disk_dir is not None:
+            value = self._promote(key, await asyncio.to_thread(self._disk_get, key))
+        if value is None:
+            self._count_miss()
+        return value
+
+    async def aput(self, key: str, value: bytes) -> None:
+        """put() for the event loop: the disk tier is written on a thread."""
+        with self._lock:
+            self._memory_put(key, value, time.time())
+        if self.disk_dir is not None:
+            await asyncio.to_thread(self._disk_put, key, value)
+
+    # Variants are derived artifacts of an entry (e.g. its gzip encoding).
+    # A variant hit counts as a cache hit; a variant miss is not counted, the
+    # caller falls back to get(key).
+    def get_variant(self, key: str, variant: str) -> bytes | None:
+        key = f"{key}.{variant}"
+        value = self._memory_get(key)
+        if value is None and self.disk_dir is not None:
+            value = self._promote(key, self._disk_get(key))
+        return value
+
+    def put_variant(self, key: str, variant: str, value: bytes) -> None:
+        self.put(f"{key}.{variant}", value)
+
+    async def aget_variant(self, key: str, variant: str) -> bytes | None:
+        key = f"{key}.{variant}"
+        value = self._memory_get(key)
+        if value is None and self.disk_dir is not None:
+            value = self._promote(key, await asyncio.to_thread(self._disk_get, key))
+        return value
+
+    async def aput_variant(self, key: str, variant: str, value: bytes) -> None:
+        await self.aput(f"{key}.{variant}", value)
+
+    def clear(self, *, disk: bool = False) -> None:
+        """
+        Empty the memory tier. The disk tier is shared by every worker on the
+        host and stays unless `disk` is set; entries of an older
+        render_version() are never looked up again and age out by TTL / size.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if disk and self.disk_dir is not None:
+            for path in self._disk_files():
+                path.unlink(missing_ok=True)
+            with self._lock:
+                self._disk_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+
+_cache: RenderCache | None = None
+
+
+def get_render_cache() -> RenderCache:
+    global _cache
+    if _cache is None:
+        _cache = RenderCache(
+            max_bytes=settings.cache_max_bytes,
+            ttl_seconds=settings.cache_ttl_seconds,
+            disk_dir=settings.cache_dir or None,
+            disk_max_bytes=settings.cache_disk_max_bytes,
+        )
+    return _cache
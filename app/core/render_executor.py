@@ -0,0 +1,194 @@
+# app/core/render_executor.py
+#
+# Execution backend for CPU-bound chart work (Kerykeion, svglib, ReportLab).
+#
+# Routers must never call the generate_* functions directly on the event
+# loop: one slow synastry PDF would freeze /health and every other request
+# on the uvicorn worker. Instead they `await run_render(fn, ...)`, which
+# dispatches onto a bounded thread or process pool and rejects work with
+# RenderQueueFull (-> HTTP 503) once too many renders are waiting.
+#
+# The process pool starts all its workers as soon as it is created, and
+# each draws the warm-up dummy charts before taking work; start() blocks
+# until they all have, so /health can wait for it.
+
+import asyncio
+import concurrent.futures
+import functools
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from app.core.config import settings
+from app.core.metrics import collect_spans, record_spans
+
+logger = logging.getLogger("phoenix_charts.render")
+
+T = TypeVar("T")
+
+# Seconds a warmed process pool worker waits for the slowest of its peers
+WARMUP_BARRIER_TIMEOUT = 300.0
+
+
+class RenderQueueFull(RuntimeError):
+    """Raised when the render pool already has the maximum number of jobs queued."""
+
+
+def _warm_worker() -> None:
+    """
+    Thread pool initializer: import kerykeion / reportlab / svglib, load the
+    theme CSS and decode the logos before the first request. The dummy
+    renders run in the process itself (app.main's lifespan).
+    """
+    from app.core.warmup import load_render_stack
+
+    load_render_stack()
+
+
+def _warm_process_worker(barrier) -> None:
+    """
+    Process pool initializer: full warm-up (render stack plus, with
+    PHOENIX_WARMUP, the dummy charts), then wait for the other workers so
+    none takes a job before all are warm.
+    """
+    from app.core.warmup import warm_up
+
+    warm_up()
+    try:
+        barrier.wait(WARMUP_BARRIER_TIMEOUT)
+    except threading.BrokenBarrierError:
+        logger.warning("[render] pool warm-up barrier broken; serving")
+
+
+def _worker_started() -> None:
+    pass
+
+
+class RenderExecutor:
+    """
+    Bounded wrapper around a thread or process pool.
+
+    `max_pending` counts jobs that are running or waiting; submissions beyond
+    workers + queue_limit fail fast instead of piling up behind the pool.
+    """
+
+    def __init__(self, backend: str, workers: int, queue_limit: int):
+        if backend not in ("process", "thread"):
+            raise ValueError(f"Unknown render backend: {backend!r}")
+        self.backend = backend
+        self.workers = max(1, workers)
+        self.max_pending = self.workers + max(0, queue_limit)
+
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._pool: Executor | None = None
+        self._warm_jobs: list[concurrent.futures.Future] = []
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _get_pool(self) -> Executor:
+        with self._lock:
+            if self._pool is None:
+                self._create_pool()
+        return self._pool
+
+    def _create_pool(self) -> None:
+        if self.backend == "process":
+            # spawn: never fork a process that already runs the event loop
+            context = multiprocessing.get_context("spawn")
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_warm_process_worker,
+                initargs=(context.Barrier(self.workers),),
+            )
+            # One job per worker: the pool spawns a process per submission
+            # while none is idle, so all of them start (and warm) now
+            self._warm_jobs = [self._pool.submit(_worker_started) for _ in range(self.workers)]
+        else:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="phoenix-render",
+                initializer=_warm_worker,
+            )
+        logger.info(
+            "[render] started %s pool workers=%d max_pending=%d",
+            self.backend,
+            self.workers,
+            self.max_pending,
+        )
+
+    def start(self) -> None:
+        """
+        Create the pool now rather than on the first render; under the
+        process backend, block until every worker has warmed up.
+        """
+        self._get_pool()
+        concurrent.futures.wait(self._warm_jobs)
+
+    def _release(self, _fut: Any = None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise RenderQueueFull(
+                    f"Render queue is full ({self._pending} jobs pending)"
+                )
+            self._pending += 1
+
+        metrics = settings.metrics_enabled
+        call = functools.partial(fn, *args, **kwargs)
+        try:
+            job = self._get_pool().submit(
+                functools.partial(collect_spans, call) if metrics else call
+            )
+        except BaseException:
+            self._release()
+            raise
+        # Release when the pool job finishes (not when the request stops
+        # awaiting it) so cancelled requests keep counting until their
+        # render really ends.
+        job.add_done_callback(self._release)
+        result = await asyncio.wrap_future(job)
+        if metrics:
+            result, spans = result
+            record_spans(spans)
+        return result
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            self._warm_jobs = []
+
+
+_executor: RenderExecutor | None = None
+
+
+def get_render_executor() -> RenderExecutor:
+    global _executor
+    if _executor is None:
+        _executor = RenderExecutor(
+            backend=settings.render_backend,
+            workers=settings.render_workers,
+            queue_limit=settings.render_queue_limit,
+        )
+    return _executor
+
+
+async def run_render(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a CPU-bound render function off the event loop."""
+    return await get_render_executor().run(fn, *args, **kwargs)
+
+
+def shutdown_render_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
@@ -0,0 +1,97 @@
+# app/core/single_flight.py
+#
+# Single-flight coalescing of identical in-flight renders.
+#
+# A bot retrying, or several people opening the same shared chart, sends the
+# same request several times within a second. The render cache only helps
+# once the first render has finished; until then every copy would run the
+# whole Kerykeion -> svglib -> ReportLab pipeline again. Here the first
+# request for a key starts the render as its own task, and every request for
+# the same key that arrives while it runs awaits that task instead.
+#
+#   - Errors reach every waiter. Nothing is remembered afterwards, so the
+#     next request for the key renders again.
+#   - A waiter that is cancelled (client gone) only stops waiting; the render
+#     goes on for the others. When the last waiter is cancelled, the render
+#     task is cancelled too. A job still queued on the pool is dropped then,
+#     and a job already running is left to finish.
+#
+# The flights live in the API process's event loop, so coalescing works per
+# uvicorn worker. The render cache, shared by all workers, catches the rest.
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, TypeVar
+
+from app.core.config import settings
+from app.core.metrics import counter, incr
+
+logger = logging.getLogger("phoenix_charts.single_flight")
+
+T = TypeVar("T")
+
+COALESCED_RENDERS = counter(
+    "phoenix_renders_coalesced_total",
+    "Requests served by an identical request's in-flight render (renders saved).",
+    "chart_type",
+)
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Runs at most one `render()` per key at a time; callers of a busy key share its result."""
+
+    def __init__(self):
+        self._flights: dict[str, _Flight] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    async def run(self, key: str, render: Callable[[], Awaitable[T]], label: str = "") -> T:
+        flight = self._flights.get(key)
+        if flight is None:
+            # The render runs as its own task so no single waiter owns it
+            flight = self._flights[key] = _Flight(asyncio.ensure_future(render()))
+            flight.task.add_done_callback(lambda _task: self._forget(key, flight))
+        else:
+            incr(COALESCED_RENDERS, label)
+            logger.debug("[single_flight] joined in-flight render key=%s", key)
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                # Forget it now: a request arriving before the task has
+                # unwound must start a fresh render, not join a cancelled one
+                self._forget(key, flight)
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    return _single_flight
+
+
+async def coalesce(key: str, render: Callable[[], Awaitable[T]], label: str = "") -> T:
+    """`await render()`, shared with concurrent callers of the same key (PHOENIX_SINGLE_FLIGHT)."""
+    if not settings.single_flight_enabled:
+        return await render()
+    return await _single_flight.run(key, render, label)
@@ -0,0 +1,102 @@
+# app/core/warmup.py
+#
+# Process warm-up and the readiness flag behind GET /health.
+#
+# A cold worker pays for importing kerykeion / reportlab / svglib / lxml,
+# loading the theme CSS, opening the ephemeris, decoding the logos and
+# filling the per-theme caches (recolor plans, svglib skeleton, native
+# glyphs) on its first requests. warm_up() does all of that up front by
+# rendering one dummy wheel per theme plus one natal report.
+#
+# The pre-forked server (app/server.py) calls it in the parent before
+# forking, so every worker starts ready and shares the warmed pages
+# copy-on-write. Under plain `uvicorn app.main:app` the lifespan runs it in
+# a background thread and /health answers 503 until it finishes. With the
+# process backend the pool workers run it instead, and the API process is
+# marked ready once RenderExecutor.start() has seen them all warm.
+#
+# Nothing here is imported at module load: app.main stays cheap to import
+# (see benchmarks/bench_import_time.py) and pays for the render stack only
+# in the process that renders.
+
+import logging
+import threading
+import time
+
+from app.core.config import settings
+from app.core.metrics import collect_spans
+
+logger = logging.getLogger("phoenix_charts.warmup")
+
+# Fixed dummy subject: offline coordinates, no geonames lookup
+_DUMMY_BIRTH = dict(
+    name="Warmup",
+    year=1990,
+    month=6,
+    day=15,
+    hour=12,
+    minute=30,
+    lat=51.5074,
+    lng=-0.1278,
+    tz_str="Europe/London",
+    city="London",
+    country="GB",
+)
+
+_ready = threading.Event()
+
+
+def is_ready() -> bool:
+    return _ready.is_set()
+
+
+def mark_ready() -> None:
+    _ready.set()
+
+
+def _render_dummy_charts() -> None:
+    from app.schemas.natal import NatalRequest
+    from app.schemas.wheel import WheelPdfRequest
+    from app.services.chart_generator import generate_chart_pdf_bytes, generate_wheel_pdf_bytes
+    from app.services.phoenix_theme import THEME_FILES
+
+    for theme in THEME_FILES:
+        generate_wheel_pdf_bytes(WheelPdfRequest(**_DUMMY_BIRTH, theme=theme))
+        generate_wheel_pdf_bytes(WheelPdfRequest(**_DUMMY_BIRTH, theme=theme, renderer="native"))
+    generate_chart_pdf_bytes("natal", NatalRequest(**_DUMMY_BIRTH, theme="classic"))
+
+
+def load_render_stack() -> None:
+    """Import kerykeion / reportlab / svglib, read the themes, decode the logos."""
+    import app.services.chart_generator  # noqa: F401  (pulls in everything)
+    from app.services.pdf.assets import preload_assets
+    from app.services.phoenix_theme import load_themes
+
+    load_themes()
+    preload_assets()
+
+
+def warm_up(render: bool = True) -> float:
+    """
+    Warm-up hook: load the render stack and (with PHOENIX_WARMUP) draw the
+    dummy charts, then mark the process ready. Returns the seconds spent.
+
+    `render=False` is for processes that never render (the API process of
+    the process backend, once RenderExecutor.start() has warmed the pool
+    workers): it only marks the process ready. Spans and counters from the dummy renders are
+    discarded so they don't show up in /metrics.
+    """
+    t0 = time.perf_counter()
+    try:
+        if render:
+            load_render_stack()
+            if settings.warmup_enabled:
+                collect_spans(_render_dummy_charts)
+    except Exception:
+        # A failed warm-up must not keep the worker out of rotation: it only
+        # means the first real requests pay the cold costs.
+        logger.exception("[warmup] failed; serving cold")
+    elapsed = time.perf_counter() - t0
+    mark_ready()
+    logger.info("[warmup] ready in %.2fs (render=%s)", elapsed, render and settings.warmup_enabled)
+    return elapsed
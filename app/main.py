@@ -1,37 +1,150 @@
 # app/main.py
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
-from app.routers import charts
+from app.core.capture import RequestCaptureMiddleware
+from app.core.config import API_TITLE, API_VERSION, settings
+from app.core.metrics import (
+    KERYKEION_MODEL_LOOKUPS,
+    SKELETON_LOOKUPS,
+    SUBJECT_LOOKUPS,
+    ServerTimingMiddleware,
+    render_prometheus,
+)
+from app.core.render_cache import get_render_cache
+from app.core.render_executor import (
+    RenderQueueFull,
+    get_render_executor,
+    shutdown_render_executor,
+)
+from app.core.warmup import is_ready, warm_up
+from app.routers import batch, charts
 from app.routers import wheel as wheel_routes  # ← import your wheel router
 
 import logging
 import os
+import threading
+
+
+logger = logging.getLogger("phoenix_charts.warmup")
+
 
-app = FastAPI(title="Phoenix Charts API", version="0.1.0")
+def _warm_up_renders() -> None:
+    if settings.render_backend == "process":
+        # Renders never run in this process: start the pool and wait until
+        # every worker has drawn its dummy charts
+        try:
+            get_render_executor().start()
+        except Exception:
+            logger.exception("[warmup] render pool warm-up failed; serving cold")
+        warm_up(render=False)
+    else:
+        warm_up()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    get_render_executor()
+    if not is_ready():
+        # Not pre-warmed by app.server: warm up without blocking startup
+        threading.Thread(target=_warm_up_renders, name="phoenix-warmup", daemon=True).start()
+    yield
+    shutdown_render_executor()
+
+
+app = FastAPI(title=API_TITLE, version=API_VERSION, lifespan=lifespan)
 
 @app.get("/health", include_in_schema=False)
 async def health():
+    # Readiness: load balancers keep the worker out of rotation until warm
+    if not is_ready():
+        return JSONResponse({"status": "warming"}, status_code=503)
     return {"status": "ok"}
 
+
+def _lookup_stats(lookups) -> dict:
+    hits, misses = lookups.get("hit"), lookups.get("miss")
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+    }
+
+
+@app.get("/cache/stats", include_in_schema=False)
+async def cache_stats():
+    return {
+        **get_render_cache().stats(),
+        # Memo lookups summed over all render workers
+        "subjects": _lookup_stats(SUBJECT_LOOKUPS),
+        "svg_skeleton": _lookup_stats(SKELETON_LOOKUPS),
+        "kerykeion_models": _lookup_stats(KERYKEION_MODEL_LOOKUPS),
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    cache = get_render_cache().stats()
+    extra = [
+        "# TYPE phoenix_render_pending gauge",
+        f"phoenix_render_pending {get_render_executor().pending}",
+        "# TYPE phoenix_render_cache_bytes gauge",
+        f"phoenix_render_cache_bytes {cache['bytes']}",
+        "# TYPE phoenix_render_cache_lookups_total counter",
+        f'phoenix_render_cache_lookups_total{{result="hit"}} {cache["hits"]}',
+        f'phoenix_render_cache_lookups_total{{result="disk_hit"}} {cache["disk_hits"]}',
+        f'phoenix_render_cache_lookups_total{{result="miss"}} {cache["misses"]}',
+        "# TYPE phoenix_render_cache_evictions_total counter",
+        f"phoenix_render_cache_evictions_total {cache['evictions']}",
+    ]
+    return PlainTextResponse(
+        render_prometheus(extra),
+        media_type="text/plain; version=0.0.4",
+    )
+
 # Debug toggle for phoenix-charts
 PHOENIX_DEBUG = os.getenv("PHOENIX_DEBUG", "0") == "1"
 
 wheel_logger = logging.getLogger("phoenix_charts.wheel")
 wheel_logger.setLevel(logging.DEBUG if PHOENIX_DEBUG else logging.INFO)
 
+
+@app.exception_handler(RenderQueueFull)
+async def render_queue_full_handler(request: Request, exc: RenderQueueFull):
+    # Every render worker is busy and the wait queue is at its limit
+    return JSONResponse(
+        status_code=503,
+        content={"detail": f"Chart renderer is busy, retry shortly: {exc}"},
+        headers={"Retry-After": "1"},
+    )
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "ETag", "X-Cache", "Content-Disposition", "Content-Encoding"],
 )
 
+# Server-Timing header from the per-stage spans (PHOENIX_METRICS=1)
+app.add_middleware(ServerTimingMiddleware)
+
+# Sampled, sanitized /api/v1 requests for replay (PHOENIX_CAPTURE_PATH)
+if settings.capture_path:
+    app.add_middleware(RequestCaptureMiddleware)
+
 # Charts (existing)
 app.include_router(charts.router, prefix="/api/v1")
 
 # Wheel router (versioned)
 app.include_router(wheel_routes.router, prefix="/api/v1")
 # -> endpoint: POST http://localhost:8001/api/v1/wheel/pdf-bytes
+
+# Batch fan-out (NDJSON stream)
+app.include_router(batch.router, prefix="/api/v1")
@@ -0,0 +1,137 @@
+# app/routers/batch.py
+#
+# POST /api/v1/batch: many chart jobs in one request.
+#
+# Jobs are fanned out over the render pool in subject-grouped chunks and
+# each result is streamed back as one NDJSON line as soon as it is ready
+# (completion order, not request order). A failing job produces an
+# {"ok": false} line; it never fails the rest of the batch. With
+# Accept: application/msgpack the lines are msgpack maps instead (a plain
+# msgpack stream, readable with msgpack.Unpacker), PDFs as bin fields.
+
+import asyncio
+import base64
+import json
+import logging
+from typing import AsyncIterator
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.msgpack_codec import MSGPACK_TYPE, MsgpackRoute, msgpack_available, packb, packb_map_head
+from app.core.render_cache import get_render_cache, make_cache_key
+from app.core.render_executor import RenderQueueFull, get_render_executor, run_render
+from app.routers.render_response import negotiate_media_type
+from app.schemas.batch import BatchRequest
+from app.services.batch import plan_chunks, resolve_job, run_batch_chunk
+
+logger = logging.getLogger("phoenix_charts.batch")
+
+router = APIRouter(tags=["batch"], route_class=MsgpackRoute)
+
+# Back-off while the render queue is full; batch chunks wait instead of 503ing
+QUEUE_FULL_RETRY_SECONDS = 0.05
+
+
+def _cache_scope(job_type: str, output: str = "json") -> tuple[str, str]:
+    """(chart_type, output_format) the matching single endpoint caches under."""
+    if job_type == "wheel_pdf":
+        return "wheel", "pdf"
+    return job_type, output
+
+
+def _line(index: int, job_id, job_type: str, body: bytes | None = None, error: str | None = None) -> bytes:
+    head = json.dumps({"index": index, "id": job_id, "type": job_type}, ensure_ascii=False)[:-1]
+    if error is not None:
+        return f'{head},"ok":false,"error":{json.dumps(error, ensure_ascii=False)}}}\n'.encode("utf-8")
+    if job_type == "wheel_pdf":
+        # PDF bytes travel base64-encoded
+        return f'{head},"ok":true,"pdf_base64":"{base64.b64encode(body).decode("ascii")}"}}\n'.encode("utf-8")
+    # Chart JSON is already serialized; splice it in without re-encoding
+    return head.encode("utf-8") + b',"ok":true,"result":' + body + b"}\n"
+
+
+def _record(index: int, job_id, job_type: str, body: bytes | None = None, error: str | None = None) -> bytes:
+    """_line as one msgpack map of a msgpack stream; PDFs are bin fields, not base64."""
+    head = {"index": index, "id": job_id, "type": job_type}
+    if error is not None:
+        return packb({**head, "ok": False, "error": error})
+    if job_type == "wheel_pdf":
+        return packb({**head, "ok": True, "pdf": body})
+    # Splice the serialized chart map in as the value of "result"
+    return packb_map_head({**head, "ok": True}, extra=1) + packb("result") + body
+
+
+async def _run_chunk(chunk: list, output: str) -> list:
+    while True:
+        try:
+            return await run_render(run_batch_chunk, chunk, output)
+        except RenderQueueFull:
+            await asyncio.sleep(QUEUE_FULL_RETRY_SECONDS)
+
+
+async def _stream_batch(req: BatchRequest, output: str = "json") -> AsyncIterator[bytes]:
+    cache = get_render_cache()
+    encode = _record if output == "msgpack" else _line
+    jobs = req.jobs
+
+    pending: list[tuple[int, str, object]] = []
+    keys: dict[int, str] = {}
+    for index, job in enumerate(jobs):
+        try:
+            model = resolve_job(job, req.subjects)
+        except Exception as e:
+            yield encode(index, job.id, job.type, error=f"Invalid job payload: {e}")
+            continue
+
+        if cache.enabled:
+            key = make_cache_key(*_cache_scope(job.type, output), model.model_dump(mode="json"))
+            body = await cache.aget(key)
+            if body is not None:
+                yield encode(index, job.id, job.type, body)
+                continue
+            keys[index] = key
+        pending.append((index, job.type, model))
+
+    # Never hold more chunks in flight than there are workers, so a large
+    # batch cannot starve single-chart requests of queue slots.
+    executor = get_render_executor()
+    slots = asyncio.Semaphore(executor.workers)
+
+    async def run_limited(chunk: list) -> list:
+        async with slots:
+            try:
+                return await _run_chunk(chunk, output)
+            except Exception as e:
+                # The whole chunk was lost (e.g. a worker process died)
+                logger.exception("[batch] chunk of %d jobs failed", len(chunk))
+                return [(index, None, str(e)) for index, _, _ in chunk]
+
+    tasks = [asyncio.ensure_future(run_limited(c)) for c in plan_chunks(pending, executor.workers)]
+    try:
+        for done in asyncio.as_completed(tasks):
+            for index, body, error in await done:
+                job = jobs[index]
+                if error is None and index in keys:
+                    await cache.aput(keys[index], body)
+                yield encode(index, job.id, job.type, body, error)
+    finally:
+        # Client went away (or the stream failed): drop chunks not yet started
+        for task in tasks:
+            task.cancel()
+
+
+@router.post("/batch", summary="Generate many charts in one request (NDJSON stream)")
+async def batch_endpoint(req: BatchRequest, request: Request):
+    if not req.jobs:
+        raise HTTPException(status_code=422, detail="Batch has no jobs")
+    if len(req.jobs) > settings.batch_max_jobs:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch has {len(req.jobs)} jobs; the limit is {settings.batch_max_jobs}",
+        )
+    offered = ("application/x-ndjson", MSGPACK_TYPE) if msgpack_available() else ("application/x-ndjson",)
+    media_type = negotiate_media_type(request, offered)
+    output = "msgpack" if media_type == MSGPACK_TYPE else "json"
+    return StreamingResponse(_stream_batch(req, output), media_type=media_type, headers={"Vary": "Accept"})
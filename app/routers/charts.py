@@ -1,167 +1,434 @@
-from fastapi import APIRouter, HTTPException, Response
-from io import BytesIO
-
-from reportlab.pdfgen import canvas   
-from reportlab.lib.pagesizes import A4, landscape
-
+import json
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+
+from app.core.config import settings
+from app.core.msgpack_codec import MSGPACK_TYPE, MsgpackRoute, msgpack_available
+from app.core.render_executor import RenderQueueFull
+from app.routers.render_response import (
+    PDF_PROFILE_QUERY,
+    PdfProfileName,
+    download_filename,
+    negotiate_media_type,
+    pdf_output_format,
+    render_response,
+)
 from app.schemas.natal import NatalRequest
 from app.schemas.synastry import SynastryRequest
 from app.schemas.transit import TransitRequest
+from app.schemas.transit_series import TransitSeriesRequest, series_steps
 from app.schemas.composite import CompositeRequest
-from app.services.chart_generator import (
-    generate_natal_chart,
-    generate_synastry_chart,
-    generate_transit_chart,
-    generate_composite_chart,
+from app.services.render_jobs import (
+    CHART_FIELDS,
+    data_projection,
+    generate_chart_image_bytes,
+    generate_chart_json_bytes,
+    generate_chart_msgpack_bytes,
+    generate_chart_pdf_bytes,
+    generate_chart_svg_bytes,
+    generate_transit_series_json_bytes,
+    generate_transit_series_msgpack_bytes,
+    image_output_format,
 )
 
-from app.services.pdf.wheel_page import draw_wheel_page
-from app.services.pdf.natal_report import draw_natal_report_body
 
+router = APIRouter(tags=["charts"], route_class=MsgpackRoute)
 
-router = APIRouter(tags=["charts"])
+FIELDS_QUERY = Query(
+    None,
+    description="Comma-separated JSON fields to include: svg, svg_base64, data (default: all)",
+)
+DATA_FIELDS_QUERY = Query(
+    None,
+    description=(
+        "Comma-separated chart data fields to keep, dotted for nested ones, "
+        "e.g. aspects,first_subject.sun (default: the whole model)"
+    ),
+)
+FORMAT_QUERY = Query(
+    None,
+    alias="format",
+    description=(
+        "json (default), svg for a raw image/svg+xml body or msgpack for application/msgpack; "
+        "overrides Accept"
+    ),
+)
+SERIES_FORMAT_QUERY = Query(
+    None,
+    alias="format",
+    description="json (default) or msgpack for application/msgpack; overrides Accept",
+)
+
+IMAGE_SIZE_QUERY = Query(
+    None,
+    description="Longest side in px; one of PHOENIX_IMAGE_SIZES (default 512, or the largest configured)",
+)
+IMAGE_FORMAT_QUERY = Query(
+    None,
+    alias="format",
+    description="png (default) or webp; overrides Accept",
+)
+IMAGE_MEDIA_TYPES = {"png": "image/png", "webp": "image/webp"}
+DEFAULT_IMAGE_SIZE = 512
+
+
+def _parse_fields(fields: str | None) -> frozenset:
+    if fields is None:
+        return CHART_FIELDS
+    selected = frozenset(f.strip() for f in fields.split(",") if f.strip())
+    unknown = selected - CHART_FIELDS
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))} (choose from svg, svg_base64, data)",
+        )
+    return selected
+
+
+def _offered(*media_types: str) -> tuple[str, ...]:
+    """`media_types`, plus application/msgpack when the msgpack package is installed."""
+    return media_types + (MSGPACK_TYPE,) if msgpack_available() else media_types
+
+
+def _check_msgpack(output: str) -> None:
+    if output == "msgpack" and not msgpack_available():
+        raise HTTPException(status_code=406, detail="msgpack responses are not available")
+
+
+async def _chart_response(
+    request: Request,
+    req,
+    chart_type: str,
+    fields: str | None,
+    data_fields: str | None,
+    output: str | None,
+) -> Response:
+    """
+    Chart JSON shaped by `fields` / `data_fields`, or the bare SVG when
+    asked for with ?format=svg or Accept: image/svg+xml.
+    """
+    if output is None:
+        media_type = negotiate_media_type(request, _offered("application/json", "image/svg+xml"))
+        output = {"image/svg+xml": "svg", MSGPACK_TYPE: "msgpack"}.get(media_type, "json")
+    _check_msgpack(output)
+
+    if output == "svg":
+        response = await render_response(
+            request,
+            req,
+            chart_type=chart_type,
+            output_format="svg",
+            media_type="image/svg+xml",
+            render=generate_chart_svg_bytes,
+            render_args=(chart_type, req),
+        )
+    else:
+        selected = _parse_fields(fields)
+        # Full responses keep the plain "json" / "msgpack" cache key
+        output_format = output if selected == CHART_FIELDS else f"{output}:" + ",".join(sorted(selected))
+        include = None
+        if data_fields is not None and "data" in selected:
+            try:
+                include = data_projection(chart_type, data_fields)
+            except ValueError as e:
+                raise HTTPException(status_code=422, detail=str(e))
+            output_format += ";data=" + json.dumps(include, sort_keys=True, separators=(",", ":"))
+        response = await render_response(
+            request,
+            req,
+            chart_type=chart_type,
+            output_format=output_format,
+            media_type=MSGPACK_TYPE if output == "msgpack" else "application/json",
+            render=generate_chart_msgpack_bytes if output == "msgpack" else generate_chart_json_bytes,
+            render_args=(chart_type, req, selected, include),
+        )
+    response.headers.add_vary_header("Accept")
+    return response
+
+
+async def _image_response(
+    request: Request,
+    req,
+    chart_type: str,
+    size: int | None,
+    output: str | None,
+) -> Response:
+    """
+    The themed chart as a PNG / WebP. Every configured size is rendered and
+    cached together, so the other sizes of the same chart are cache hits.
+    """
+    sizes = settings.image_sizes
+    if size is None:
+        size = DEFAULT_IMAGE_SIZE if DEFAULT_IMAGE_SIZE in sizes else max(sizes)
+    elif size not in sizes:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unsupported size {size} (choose from {', '.join(map(str, sizes))})",
+        )
+    if output is None:
+        media_type = negotiate_media_type(request, tuple(IMAGE_MEDIA_TYPES.values()))
+        output = "webp" if media_type == "image/webp" else "png"
+
+    response = await render_response(
+        request,
+        req,
+        chart_type=chart_type,
+        output_format=image_output_format(output, size),
+        media_type=IMAGE_MEDIA_TYPES[output],
+        render=generate_chart_image_bytes,
+        render_args=(chart_type, req, output, sizes),
+    )
+    response.headers.add_vary_header("Accept")
+    return response
 
 
 @router.post("/natal", summary="Generate natal chart with SVG")
-async def natal_endpoint(req: NatalRequest):
+async def natal_endpoint(
+    req: NatalRequest,
+    request: Request,
+    fields: str | None = FIELDS_QUERY,
+    data_fields: str | None = DATA_FIELDS_QUERY,
+    output: Literal["json", "svg", "msgpack"] | None = FORMAT_QUERY,
+):
     try:
-        return generate_natal_chart(req)
+        return await _chart_response(request, req, "natal", fields, data_fields, output)
+    except (HTTPException, RenderQueueFull):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Natal chart generation failed: {e}")
-    
-    
-@router.post("/natal/pdf", summary="Generate natal chart PDF (wheel + report)")
-async def natal_pdf_endpoint(req: NatalRequest):
-    try:
-        # 1. Use your existing generator
-        result = generate_natal_chart(req)
-        svg_string = result["svg"]
-        data = result["data"]  # whatever you want in the body
-
-        # 2. Create PDF buffer
-        buffer = BytesIO()
 
-        # PAGE 1: wheel (landscape)
-        c = canvas.Canvas(buffer, pagesize=landscape(A4))
-        draw_wheel_page(c, svg_string)
-        c.showPage()
 
-        # PAGE 2+: report body (portrait)
-        c.setPageSize(A4)
-        draw_natal_report_body(c, data, req)  # you'll define this helper just below
-        c.showPage()
+@router.post("/natal/pdf", summary="Generate natal chart PDF (wheel + report)")
+async def natal_pdf_endpoint(
+    req: NatalRequest,
+    request: Request,
+    profile: PdfProfileName | None = PDF_PROFILE_QUERY,
+):
+    try:
+        return await render_response(
+            request,
+            req,
+            chart_type="natal",
+            output_format=pdf_output_format(profile),
+            media_type="application/pdf",
+            render=generate_chart_pdf_bytes,
+            render_args=("natal", req, profile),
+            filename=download_filename("natal", req),
+        )
+    except RenderQueueFull:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Natal PDF generation failed: {e}")
 
-        c.save()
-        pdf_bytes = buffer.getvalue()
-        buffer.close()
 
-        return Response(content=pdf_bytes, media_type="application/pdf")
+@router.post("/natal/image", summary="Generate natal chart image (PNG / WebP)")
+async def natal_image_endpoint(
+    req: NatalRequest,
+    request: Request,
+    size: int | None = IMAGE_SIZE_QUERY,
+    output: Literal["png", "webp"] | None = IMAGE_FORMAT_QUERY,
+):
+    try:
+        return await _image_response(request, req, "natal", size, output)
+    except (HTTPException, RenderQueueFull):
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Natal PDF generation failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Natal image generation failed: {e}")
 
 
 @router.post("/synastry", summary="Generate synastry chart with SVG")
-async def synastry_endpoint(req: SynastryRequest):
+async def synastry_endpoint(
+    req: SynastryRequest,
+    request: Request,
+    fields: str | None = FIELDS_QUERY,
+    data_fields: str | None = DATA_FIELDS_QUERY,
+    output: Literal["json", "svg", "msgpack"] | None = FORMAT_QUERY,
+):
     try:
-        return generate_synastry_chart(req)
+        return await _chart_response(request, req, "synastry", fields, data_fields, output)
+    except (HTTPException, RenderQueueFull):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Synastry chart generation failed: {e}")
-    
-    
-@router.post("/synastry/pdf", summary="Generate synastry chart PDF (wheel + report)")
-async def synastry_pdf_endpoint(req: SynastryRequest):
-    try:
-        result = generate_synastry_chart(req)
-        svg_string = result["svg"]
-        data = result["data"]
-
-        buffer = BytesIO()
 
-        # PAGE 1: wheel (landscape)
-        c = canvas.Canvas(buffer, pagesize=landscape(A4))
-        draw_wheel_page(c, svg_string)
-        c.showPage()
 
-        # PAGE 2+: report body (portrait)
-        c.setPageSize(A4)
-        draw_synastry_report_body(c, data, req)
-        c.showPage()
+@router.post("/synastry/pdf", summary="Generate synastry chart PDF (wheel + report)")
+async def synastry_pdf_endpoint(
+    req: SynastryRequest,
+    request: Request,
+    profile: PdfProfileName | None = PDF_PROFILE_QUERY,
+):
+    try:
+        return await render_response(
+            request,
+            req,
+            chart_type="synastry",
+            output_format=pdf_output_format(profile),
+            media_type="application/pdf",
+            render=generate_chart_pdf_bytes,
+            render_args=("synastry", req, profile),
+            filename=download_filename("synastry", req),
+        )
+    except RenderQueueFull:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Synastry PDF generation failed: {e}")
 
-        c.save()
-        pdf_bytes = buffer.getvalue()
-        buffer.close()
 
-        return Response(content=pdf_bytes, media_type="application/pdf")
+@router.post("/synastry/image", summary="Generate synastry chart image (PNG / WebP)")
+async def synastry_image_endpoint(
+    req: SynastryRequest,
+    request: Request,
+    size: int | None = IMAGE_SIZE_QUERY,
+    output: Literal["png", "webp"] | None = IMAGE_FORMAT_QUERY,
+):
+    try:
+        return await _image_response(request, req, "synastry", size, output)
+    except (HTTPException, RenderQueueFull):
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Synastry PDF generation failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Synastry image generation failed: {e}")
 
 
 @router.post("/transit", summary="Generate transit chart with SVG")
-async def transit_endpoint(req: TransitRequest):
+async def transit_endpoint(
+    req: TransitRequest,
+    request: Request,
+    fields: str | None = FIELDS_QUERY,
+    data_fields: str | None = DATA_FIELDS_QUERY,
+    output: Literal["json", "svg", "msgpack"] | None = FORMAT_QUERY,
+):
     try:
-        return generate_transit_chart(req)
+        return await _chart_response(request, req, "transit", fields, data_fields, output)
+    except (HTTPException, RenderQueueFull):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Transit chart generation failed: {e}")
-    
-    
-@router.post("/transit/pdf", summary="Generate transit chart PDF (wheel + report)")
-async def transit_pdf_endpoint(req: TransitRequest):
-    try:
-        result = generate_transit_chart(req)
-        svg_string = result["svg"]
-        data = result["data"]
-
-        buffer = BytesIO()
 
-        c = canvas.Canvas(buffer, pagesize=landscape(A4))
-        draw_wheel_page(c, svg_string)
-        c.showPage()
 
-        c.setPageSize(A4)
-        draw_transit_report_body(c, data, req)
-        c.showPage()
-
-        c.save()
-        pdf_bytes = buffer.getvalue()
-        buffer.close()
-
-        return Response(content=pdf_bytes, media_type="application/pdf")
+@router.post("/transit/pdf", summary="Generate transit chart PDF (wheel + report)")
+async def transit_pdf_endpoint(
+    req: TransitRequest,
+    request: Request,
+    profile: PdfProfileName | None = PDF_PROFILE_QUERY,
+):
+    try:
+        return await render_response(
+            request,
+            req,
+            chart_type="transit",
+            output_format=pdf_output_format(profile),
+            media_type="application/pdf",
+            render=generate_chart_pdf_bytes,
+            render_args=("transit", req, profile),
+            filename=download_filename("transit", req),
+        )
+    except RenderQueueFull:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Transit PDF generation failed: {e}")
 
 
-@router.post("/composite", summary="Generate composite chart with SVG")
-async def composite_endpoint(req: CompositeRequest):
+@router.post("/transit/image", summary="Generate transit chart image (PNG / WebP)")
+async def transit_image_endpoint(
+    req: TransitRequest,
+    request: Request,
+    size: int | None = IMAGE_SIZE_QUERY,
+    output: Literal["png", "webp"] | None = IMAGE_FORMAT_QUERY,
+):
     try:
-        return generate_composite_chart(req)
+        return await _image_response(request, req, "transit", size, output)
+    except (HTTPException, RenderQueueFull):
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Composite chart generation failed: {e}")
-    
-    
-@router.post("/composite/pdf", summary="Generate composite chart PDF (wheel + report)")
-async def composite_pdf_endpoint(req: CompositeRequest):
+        raise HTTPException(status_code=500, detail=f"Transit image generation failed: {e}")
+
+
+@router.post("/transit/series", summary="Transit positions and aspect timeline over a date range")
+async def transit_series_endpoint(
+    req: TransitSeriesRequest,
+    request: Request,
+    output: Literal["json", "msgpack"] | None = SERIES_FORMAT_QUERY,
+):
+    steps = series_steps(req)
+    if steps < 1:
+        raise HTTPException(status_code=422, detail="end must not be before start")
+    if steps > settings.transit_series_max_steps:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Series has {steps} steps; the limit is {settings.transit_series_max_steps}",
+        )
+    if output is None:
+        output = "msgpack" if negotiate_media_type(request, _offered("application/json")) == MSGPACK_TYPE else "json"
+    _check_msgpack(output)
     try:
-        result = generate_composite_chart(req)
-        svg_string = result["svg"]
-        data = result["data"]
-
-        buffer = BytesIO()
+        response = await render_response(
+            request,
+            req,
+            chart_type="transit_series",
+            output_format=output,
+            media_type=MSGPACK_TYPE if output == "msgpack" else "application/json",
+            render=generate_transit_series_msgpack_bytes if output == "msgpack" else generate_transit_series_json_bytes,
+            render_args=(req,),
+        )
+        response.headers.add_vary_header("Accept")
+        return response
+    except RenderQueueFull:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Transit series generation failed: {e}")
 
-        c = canvas.Canvas(buffer, pagesize=landscape(A4))
-        draw_wheel_page(c, svg_string)
-        c.showPage()
 
-        c.setPageSize(A4)
-        draw_composite_report_body(c, data, req)
-        c.showPage()
+@router.post("/composite", summary="Generate composite chart with SVG")
+async def composite_endpoint(
+    req: CompositeRequest,
+    request: Request,
+    fields: str | None = FIELDS_QUERY,
+    data_fields: str | None = DATA_FIELDS_QUERY,
+    output: Literal["json", "svg", "msgpack"] | None = FORMAT_QUERY,
+):
+    try:
+        return await _chart_response(request, req, "composite", fields, data_fields, output)
+    except (HTTPException, RenderQueueFull):
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Composite chart generation failed: {e}")
 
-        c.save()
-        pdf_bytes = buffer.getvalue()
-        buffer.close()
 
-        return Response(content=pdf_bytes, media_type="application/pdf")
+@router.post("/composite/pdf", summary="Generate composite chart PDF (wheel + report)")
+async def composite_pdf_endpoint(
+    req: CompositeRequest,
+    request: Request,
+    profile: PdfProfileName | None = PDF_PROFILE_QUERY,
+):
+    try:
+        return await render_response(
+            request,
+            req,
+            chart_type="composite",
+            output_format=pdf_output_format(profile),
+            media_type="application/pdf",
+            render=generate_chart_pdf_bytes,
+            render_args=("composite", req, profile),
+            filename=download_filename("composite", req),
+        )
+    except RenderQueueFull:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Composite PDF generation failed: {e}")
-    
 
-    
\ No newline at end of file
+
+@router.post("/composite/image", summary="Generate composite chart image (PNG / WebP)")
+async def composite_image_endpoint(
+    req: CompositeRequest,
+    request: Request,
+    size: int | None = IMAGE_SIZE_QUERY,
+    output: Literal["png", "webp"] | None = IMAGE_FORMAT_QUERY,
+):
+    try:
+        return await _image_response(request, req, "composite", size, output)
+    except (HTTPException, RenderQueueFull):
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Composite image generation failed: {e}")
@@ -0,0 +1,218 @@
+# app/routers/render_response.py
+#
+# Shared endpoint plumbing: look a render up in the content-addressed cache,
+# honour If-None-Match, otherwise run it on the render pool and cache it
+# (identical requests arriving meanwhile share that render).
+# Compressible bodies are sent gzip / brotli encoded when the client accepts
+# it; the encoded bytes are cached as a variant of the entry.
+
+import asyncio
+import re
+from typing import Any, Callable, Iterator, Literal
+
+from fastapi import Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.core.compression import COMPRESSIBLE_TYPES, choose_encoding, compress
+from app.core.config import settings
+from app.core.metrics import span
+from app.core.msgpack_codec import MSGPACK_TYPE
+from app.core.render_cache import get_render_cache, make_cache_key
+from app.core.render_executor import run_render
+from app.core.single_flight import coalesce
+
+# Size of the slices file bodies (PDFs) are streamed in
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# PDF output profiles (app/services/pdf/output_profile.py)
+PdfProfileName = Literal["fast", "balanced", "small"]
+PDF_PROFILE_QUERY = Query(
+    None,
+    description=(
+        "PDF output profile: fast (uncompressed), balanced (compressed, shared glyphs) "
+        "or small (also rounded coordinates and a 150 dpi logo). Default: PHOENIX_PDF_PROFILE"
+    ),
+)
+
+
+def pdf_output_format(profile: str | None) -> str:
+    """Cache key format of a PDF render; the default profile keeps plain "pdf"."""
+    return "pdf" if profile is None else f"pdf;profile={profile}"
+
+
+# Media types whose renders are not byte-for-byte reproducible (ReportLab
+# stamps each PDF with its creation time and a random /ID; the JSON and
+# msgpack chart bodies carry generated_at): their ETags are weak, so a
+# re-render after eviction is not passed off as the same bytes
+WEAK_ETAG_TYPES = frozenset({"application/pdf", "application/json", MSGPACK_TYPE})
+
+
+def _etag(key: str, encoding: str | None, weak: bool) -> str:
+    # "<key>" for the identity body, "<key>-gzip" / "<key>-br" when encoded
+    tag = f'"{key}-{encoding}"' if encoding else f'"{key}"'
+    return f"W/{tag}" if weak else tag
+
+
+def _matching_etag(if_none_match: str | None, key: str) -> str | None:
+    """
+    The If-None-Match tag naming any encoding of entry `key`, if one does
+    (weak comparison), or "*" when the header is the wildcard.
+    """
+    if not if_none_match:
+        return None
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return "*"
+        if tag.removeprefix("W/").strip('"').split("-")[0] == key:
+            return tag
+    return None
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    with span("compress"):
+        return compress(body, encoding)
+
+
+def negotiate_media_type(request: Request, offered: tuple[str, ...]) -> str:
+    """
+    Pick the best of `offered` for the request's Accept header. Ties, a
+    missing header and nothing acceptable all fall back to offered[0].
+    """
+    accept = request.headers.get("accept")
+    if not accept:
+        return offered[0]
+
+    # media range -> q
+    ranges: dict[str, float] = {}
+    for part in accept.split(","):
+        media, *params = [p.strip() for p in part.split(";")]
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media:
+            ranges[media.lower()] = q
+
+    best, best_q = offered[0], 0.0
+    for media_type in offered:
+        # Most specific matching range wins
+        for candidate in (media_type, media_type.split("/")[0] + "/*", "*/*"):
+            if candidate in ranges:
+                if ranges[candidate] > best_q:
+                    best, best_q = media_type, ranges[candidate]
+                break
+    return best
+
+
+def _iter_chunks(body: bytes) -> Iterator[memoryview]:
+    # memoryview slices share the rendered bytes instead of copying them
+    view = memoryview(body)
+    for start in range(0, len(view), STREAM_CHUNK_SIZE):
+        yield view[start:start + STREAM_CHUNK_SIZE]
+
+
+def download_filename(chart_type: str, req: BaseModel, extension: str = "pdf") -> str:
+    """ASCII-safe file name from the (first) subject, e.g. phoenix-natal-jane-doe.pdf."""
+    subject = getattr(req, "first", None) or getattr(req, "natal", None) or req
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", getattr(subject, "name", None) or "").strip("-").lower()
+    return f"phoenix-{chart_type}-{slug}.{extension}" if slug else f"phoenix-{chart_type}.{extension}"
+
+
+async def render_response(
+    request: Request,
+    req: BaseModel,
+    *,
+    chart_type: str,
+    output_format: str,
+    media_type: str,
+    render: Callable[..., bytes | dict[str, bytes]],
+    render_args: tuple[Any, ...],
+    filename: str | None = None,
+) -> Response:
+    """
+    Serve `render(*render_args)` (bytes) through the render cache.
+
+    The cache key covers the chart type, the output format and every request
+    field, and is sent back as the ETag (suffixed with the content encoding,
+    if any; weak for PDFs, see WEAK_ETAG_TYPES). A matching If-None-Match
+    gets a 304 without rendering anything; "*" only when the entry is cached,
+    since nothing else proves a current representation exists. Concurrent misses for the same key wait on one render (see
+    core.single_flight).
+
+    A render may return {output_format: bytes} instead, several outputs made
+    together (chart image sizes): each is cached under its own key and the
+    one named by `output_format` is served.
+
+    With `filename` the body is streamed as a file (PDFs) with
+    Content-Length and an inline Content-Disposition.
+    """
+    cache = get_render_cache()
+    payload = req.model_dump(mode="json")
+    key = make_cache_key(chart_type, output_format, payload)
+    headers: dict[str, str] = {}
+    encoding = choose_encoding(request.headers.get("accept-encoding"), media_type)
+    if settings.compression_enabled and media_type in COMPRESSIBLE_TYPES:
+        headers["Vary"] = "Accept-Encoding"
+
+    weak = media_type in WEAK_ETAG_TYPES
+
+    matched = _matching_etag(request.headers.get("if-none-match"), key)
+    if matched == "*":
+        if cache.enabled:
+            if encoding and await cache.aget_variant(key, encoding) is not None:
+                return Response(status_code=304, headers={**headers, "ETag": _etag(key, encoding, weak)})
+            if await cache.aget(key) is not None:
+                return Response(status_code=304, headers={**headers, "ETag": _etag(key, None, weak)})
+    elif matched is not None:
+        tag = matched.removeprefix("W/")
+        return Response(status_code=304, headers={**headers, "ETag": f"W/{tag}" if weak else tag})
+
+    body = await cache.aget_variant(key, encoding) if cache.enabled and encoding else None
+    if body is not None:
+        headers["X-Cache"] = "HIT"
+    else:
+        body = await cache.aget(key) if cache.enabled else None
+        if body is not None:
+            headers["X-Cache"] = "HIT"
+        else:
+
+            async def render_and_cache() -> bytes:
+                body = await run_render(render, *render_args)
+                if isinstance(body, dict):
+                    outputs, body = body, body[output_format]
+                    if cache.enabled:
+                        for fmt, output in outputs.items():
+                            if fmt != output_format:
+                                await cache.aput(make_cache_key(chart_type, fmt, payload), output)
+                if cache.enabled:
+                    await cache.aput(key, body)
+                return body
+
+            # Identical requests already rendering share that render
+            body = await coalesce(key, render_and_cache, chart_type)
+            headers["X-Cache"] = "MISS"
+
+        if encoding is not None and len(body) >= settings.compression_min_bytes:
+            # zlib / brotli release the GIL; keep the event loop free
+            body = await asyncio.to_thread(_compress, body, encoding)
+            if cache.enabled:
+                await cache.aput_variant(key, encoding, body)
+        else:
+            encoding = None
+
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    headers["ETag"] = _etag(key, encoding, weak)
+
+    if filename is not None:
+        headers["Content-Length"] = str(len(body))
+        headers["Content-Disposition"] = f'inline; filename="{filename}"'
+        return StreamingResponse(_iter_chunks(body), media_type=media_type, headers=headers)
+
+    return Response(content=body, media_type=media_type, headers=headers)
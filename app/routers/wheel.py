@@ -1,17 +1,29 @@
 import logging
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import Response
+from fastapi import APIRouter, HTTPException, Request
 
+from app.core.msgpack_codec import MsgpackRoute
+from app.core.render_executor import RenderQueueFull
+from app.routers.render_response import (
+    PDF_PROFILE_QUERY,
+    PdfProfileName,
+    download_filename,
+    pdf_output_format,
+    render_response,
+)
 from app.schemas.wheel import WheelPdfRequest
-from app.services.chart_generator import generate_wheel_pdf_bytes
+from app.services.render_jobs import generate_wheel_pdf_bytes
 
-router = APIRouter(prefix="/wheel", tags=["wheel"])
+router = APIRouter(prefix="/wheel", tags=["wheel"], route_class=MsgpackRoute)
 logger = logging.getLogger("phoenix_charts.wheel")
 
 
 @router.post("/pdf-bytes")
-async def wheel_pdf_bytes(req: WheelPdfRequest):
+async def wheel_pdf_bytes(
+    req: WheelPdfRequest,
+    request: Request,
+    profile: PdfProfileName | None = PDF_PROFILE_QUERY,
+):
     """
     Generate a natal wheel PDF using the Phoenix perfection pipeline.
     """
@@ -21,8 +33,18 @@ async def wheel_pdf_bytes(req: WheelPdfRequest):
     f"lat={req.lat} lng={req.lng}"
     )
     try:
-        pdf_bytes = generate_wheel_pdf_bytes(req)
-        return Response(content=pdf_bytes, media_type="application/pdf")
+        return await render_response(
+            request,
+            req,
+            chart_type="wheel",
+            output_format=pdf_output_format(profile),
+            media_type="application/pdf",
+            render=generate_wheel_pdf_bytes,
+            render_args=(req, profile),
+            filename=download_filename("wheel", req),
+        )
+    except RenderQueueFull:
+        raise
     except Exception as e:
         logger.error("[wheel] wheel_pdf_bytes failed: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Wheel generation failed: {e}")
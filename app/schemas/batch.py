@@ -0,0 +1,71 @@
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from app.schemas.subject import SubjectInput
+
+
+BatchJobType = Literal["natal", "synastry", "transit", "composite", "wheel_pdf"]
+
+
+class BatchJob(BaseModel):
+    """
+    One chart job. `payload` is the body the matching single endpoint takes
+    (NatalRequest, SynastryRequest, TransitRequest, CompositeRequest or
+    WheelPdfRequest). Subject fields (`first`, `second`, `natal`, `transit`,
+    or `subject` for flat natal / wheel_pdf payloads) may be a key into
+    BatchRequest.subjects instead of a full subject.
+    """
+
+    id: Optional[str] = None
+    type: BatchJobType
+    payload: Dict[str, Any] = Field(default_factory=dict)
+
+
+class BatchRequest(BaseModel):
+    subjects: Dict[str, SubjectInput] = Field(default_factory=dict)
+    jobs: List[BatchJob]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "subjects": {
+                    "jane": {
+                        "name": "Jane Doe",
+                        "year": 1990,
+                        "month": 6,
+                        "day": 15,
+                        "hour": 12,
+                        "minute": 30,
+                        "lat": 40.7128,
+                        "lng": -74.006,
+                        "tz_str": "America/New_York",
+                        "city": "New York",
+                        "country": "US",
+                    }
+                },
+                "jobs": [
+                    {"id": "natal", "type": "natal", "payload": {"subject": "jane", "theme": "classic"}},
+                    {
+                        "id": "transit-2025-01-01",
+                        "type": "transit",
+                        "payload": {
+                            "natal": "jane",
+                            "transit": {
+                                "name": "Transit",
+                                "year": 2025,
+                                "month": 1,
+                                "day": 1,
+                                "hour": 12,
+                                "minute": 0,
+                                "lat": 40.7128,
+                                "lng": -74.006,
+                                "tz_str": "America/New_York",
+                                "city": "New York",
+                                "country": "US",
+                            },
+                        },
+                    },
+                ],
+            }
+        }
@@ -0,0 +1,119 @@
+from datetime import datetime, timezone
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from app.schemas.subject import SubjectInput
+
+
+MAX_STEP_MINUTES = 1440
+
+TransitPoint = Literal[
+    "Sun",
+    "Moon",
+    "Mercury",
+    "Venus",
+    "Mars",
+    "Jupiter",
+    "Saturn",
+    "Uranus",
+    "Neptune",
+    "Pluto",
+    "Mean_North_Lunar_Node",
+    "True_North_Lunar_Node",
+    "Mean_South_Lunar_Node",
+    "True_South_Lunar_Node",
+    "Chiron",
+    "Mean_Lilith",
+    "True_Lilith",
+]
+
+NatalPoint = Literal[
+    "Sun",
+    "Moon",
+    "Mercury",
+    "Venus",
+    "Mars",
+    "Jupiter",
+    "Saturn",
+    "Uranus",
+    "Neptune",
+    "Pluto",
+    "True_North_Lunar_Node",
+    "True_South_Lunar_Node",
+    "Chiron",
+    "Mean_Lilith",
+    "Ascendant",
+    "Medium_Coeli",
+    "Descendant",
+    "Imum_Coeli",
+]
+
+AspectName = Literal[
+    "conjunction",
+    "semi-sextile",
+    "semi-square",
+    "sextile",
+    "quintile",
+    "square",
+    "trine",
+    "sesquiquadrate",
+    "biquintile",
+    "quincunx",
+    "opposition",
+]
+
+
+class SeriesAspect(BaseModel):
+    name: AspectName
+    orb: float = Field(gt=0, le=15)
+
+
+class TransitSeriesRequest(BaseModel):
+    """
+    Transit timeline against one natal chart. `start` / `end` without a
+    timezone are UTC. Omitted point / aspect lists use Kerykeion's defaults.
+    """
+
+    natal: SubjectInput
+    start: datetime
+    end: datetime
+    # At most a day: the aspect search assumes every body moves far less than
+    # 180 degrees per step (the Moon, the fastest, makes about 13-15 a day)
+    step_minutes: int = Field(1440, ge=1, le=MAX_STEP_MINUTES)
+    transit_points: Optional[List[TransitPoint]] = None
+    natal_points: Optional[List[NatalPoint]] = None
+    aspects: Optional[List[SeriesAspect]] = None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "natal": {
+                    "name": "Jane Doe",
+                    "year": 1990,
+                    "month": 6,
+                    "day": 15,
+                    "hour": 12,
+                    "minute": 30,
+                    "lat": 40.7128,
+                    "lng": -74.006,
+                    "tz_str": "America/New_York",
+                    "city": "New York",
+                    "country": "US",
+                },
+                "start": "2025-01-01T00:00:00Z",
+                "end": "2025-06-30T00:00:00Z",
+                "step_minutes": 1440,
+                "transit_points": ["Sun", "Mars", "Jupiter", "Saturn"],
+                "aspects": [{"name": "conjunction", "orb": 2}, {"name": "square", "orb": 2}],
+            }
+        }
+
+
+def series_steps(req: TransitSeriesRequest) -> int:
+    """Number of grid points between start and end (inclusive)."""
+    def utc(dt: datetime) -> datetime:
+        return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+
+    span_minutes = (utc(req.end) - utc(req.start)).total_seconds() / 60.0
+    return int(span_minutes // req.step_minutes) + 1 if span_minutes >= 0 else 0
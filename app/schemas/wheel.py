@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Literal
 
 from pydantic import BaseModel
 
@@ -27,3 +27,7 @@ class WheelPdfRequest(BaseModel):
 
     # Optional chart type marker
     chart_type: Optional[str] = "natal"
+
+    # "svg": Kerykeion SVG rendered through svglib (full chart with grids)
+    # "native": wheel drawn directly on the PDF canvas (single-subject charts)
+    renderer: Literal["svg", "native"] = "svg"
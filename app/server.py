@@ -0,0 +1,200 @@
+# app/server.py
+#
+# Production entry point: pre-forked uvicorn workers sharing one socket.
+#
+#   python -m app.server [--host 0.0.0.0] [--port 8001] [--workers N]
+#
+# The parent imports the app, runs warm_up() (render stack imports, theme
+# caches, ephemeris, logos, one dummy chart per theme), freezes the GC and
+# only then forks the workers. Each worker starts with warm caches and
+# shares the parent's pages copy-on-write, so a new worker is ready as soon
+# as it accepts, and /health is ready on its first request.
+#
+# uvicorn's own --workers spawns fresh interpreters (cold imports per
+# worker), hence the fork here. The parent supervises: a worker that dies
+# is re-forked from the warm parent, with a growing delay while workers keep
+# dying right after start (so a broken deploy does not turn into a fork
+# storm); SIGTERM / SIGINT stop all workers.
+#
+# Workers default to the thread render backend with two render threads each:
+# the worker processes already spread load over the cores, and a process
+# pool per worker would spawn cold interpreters again. PHOENIX_RENDER_BACKEND
+# / PHOENIX_RENDER_WORKERS still override this. The render threads share
+# pyswisseph's process-global settings, so subject computation is serialized
+# (see _swisseph_lock in app/services/chart_generator.py).
+
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+
+os.environ.setdefault("PHOENIX_RENDER_BACKEND", "thread")
+os.environ.setdefault("PHOENIX_RENDER_WORKERS", "2")
+
+import uvicorn  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.warmup import warm_up  # noqa: E402
+
+logger = logging.getLogger("phoenix_charts.server")
+
+# Seconds to wait for workers to finish in-flight requests on shutdown
+GRACEFUL_TIMEOUT = 30.0
+# A worker exiting within this many seconds of its fork counts as a crash
+# loop: re-forks are delayed RESPAWN_BACKOFF, doubled per consecutive
+# crash up to RESPAWN_BACKOFF_MAX
+MIN_WORKER_UPTIME = 10.0
+RESPAWN_BACKOFF = 0.5
+RESPAWN_BACKOFF_MAX = 30.0
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(config: uvicorn.Config, sock: socket.socket) -> None:
+    # uvicorn installs its own SIGINT / SIGTERM handlers in serve()
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+class Supervisor:
+    """Forks `workers` copies of the warmed app and keeps them running."""
+
+    def __init__(self, config: uvicorn.Config, sock: socket.socket, workers: int):
+        self.config = config
+        self.sock = sock
+        self.workers = max(1, workers)
+        self.children: dict[int, float] = {}  # pid -> fork time
+        self.respawns: list[float] = []  # when to fork replacements
+        self.fast_exits = 0
+        self.stopping = False
+
+    def spawn(self) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _run_worker(self.config, self.sock)
+            except BaseException:
+                logger.exception("[server] worker crashed")
+                code = 1
+            finally:
+                os._exit(code)
+        self.children[pid] = time.monotonic()
+        logger.info("[server] forked worker pid=%d", pid)
+
+    def stop(self, signum, _frame=None) -> None:
+        self.stopping = True
+        self.respawns.clear()
+        for pid in self.children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _schedule_respawn(self, pid: int, status: int, forked_at: float) -> None:
+        now = time.monotonic()
+        if now - forked_at < MIN_WORKER_UPTIME:
+            self.fast_exits += 1
+        else:
+            self.fast_exits = 0
+        delay = min(RESPAWN_BACKOFF * 2 ** (self.fast_exits - 1), RESPAWN_BACKOFF_MAX) if self.fast_exits else 0.0
+        logger.warning(
+            "[server] worker pid=%d exited with status %d; re-forking in %.1fs",
+            pid,
+            os.waitstatus_to_exitcode(status),
+            delay,
+        )
+        self.respawns.append(now + delay)
+
+    def _spawn_due(self) -> None:
+        now = time.monotonic()
+        due = [t for t in self.respawns if t <= now]
+        self.respawns = [t for t in self.respawns if t > now]
+        for _ in due:
+            self.spawn()
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        for _ in range(self.workers):
+            self.spawn()
+
+        deadline = None
+        while self.children or self.respawns:
+            if self.stopping and deadline is None:
+                deadline = time.monotonic() + GRACEFUL_TIMEOUT
+            self._spawn_due()
+            # Block in waitpid unless there is a deadline or a re-fork to wait for
+            poll = deadline is not None or bool(self.respawns)
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG if poll else 0)
+            except ChildProcessError:
+                if not self.respawns:
+                    break
+                pid = 0
+            except InterruptedError:
+                continue
+            if pid == 0:
+                if deadline is not None and time.monotonic() > deadline:
+                    for child in self.children:
+                        os.kill(child, signal.SIGKILL)
+                    deadline = float("inf")
+                time.sleep(0.1)
+                continue
+            forked_at = self.children.pop(pid, time.monotonic())
+            if not self.stopping:
+                self._schedule_respawn(pid, status, forked_at)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Phoenix Charts API (pre-forked workers)")
+    parser.add_argument("--host", default=os.getenv("PHOENIX_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PHOENIX_PORT", "8001")))
+    parser.add_argument("--workers", type=int, default=settings.web_workers)
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level.upper(), format="%(asctime)s %(process)d %(name)s %(message)s")
+
+    t0 = time.perf_counter()
+    from app.main import app
+
+    imported = time.perf_counter() - t0
+    # Under the process backend the render pools are created per worker:
+    # the parent stays unready and each worker's lifespan warms its pool
+    warmed = warm_up() if settings.render_backend == "thread" else 0.0
+    # Move the warmed objects to the permanent generation (also in the
+    # workers) so GC passes don't touch, and un-share, the parent's pages
+    gc.collect()
+    gc.freeze()
+    logger.info(
+        "[server] imports %.2fs, warm-up %.2fs; forking %d workers on %s:%d",
+        imported,
+        warmed,
+        args.workers,
+        args.host,
+        args.port,
+    )
+
+    sock = _bind(args.host, args.port)
+    config = uvicorn.Config(app, log_level=args.log_level, lifespan="on", timeout_graceful_shutdown=GRACEFUL_TIMEOUT)
+    Supervisor(config, sock, args.workers).run()
+    sock.close()
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# app/services/batch.py
+#
+# Worker-side helpers for POST /api/v1/batch.
+#
+# Jobs are validated in the API process and grouped so jobs sharing a
+# subject land in the same chunk, i.e. on the same worker, where the subject
+# memo computes e.g. one natal subject once for many transit jobs.
+
+import logging
+import math
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.schemas.batch import BatchJob
+from app.schemas.composite import CompositeRequest
+from app.schemas.natal import NatalRequest
+from app.schemas.subject import SubjectInput
+from app.schemas.synastry import SynastryRequest
+from app.schemas.transit import TransitRequest
+from app.schemas.wheel import WheelPdfRequest
+from app.services.render_jobs import (
+    generate_chart_json_bytes,
+    generate_chart_msgpack_bytes,
+    generate_wheel_pdf_bytes,
+)
+
+logger = logging.getLogger("phoenix_charts.batch")
+
+JOB_MODELS: dict[str, type[BaseModel]] = {
+    "natal": NatalRequest,
+    "synastry": SynastryRequest,
+    "transit": TransitRequest,
+    "composite": CompositeRequest,
+    "wheel_pdf": WheelPdfRequest,
+}
+
+# Nested SubjectInput fields of the dual-chart requests
+SUBJECT_FIELDS = ("first", "second", "natal", "transit")
+
+# Largest number of jobs sent to one worker in a single pool submission
+MAX_CHUNK_SIZE = 16
+
+
+def _subject_ref(subjects: dict[str, SubjectInput], ref: str) -> dict:
+    try:
+        return subjects[ref].model_dump()
+    except KeyError:
+        raise ValueError(f"Unknown subject reference {ref!r}") from None
+
+
+def resolve_job(job: BatchJob, subjects: dict[str, SubjectInput]) -> BaseModel:
+    """Substitute shared subject references and validate the job payload."""
+    payload = dict(job.payload)
+
+    for field in SUBJECT_FIELDS:
+        if isinstance(payload.get(field), str):
+            payload[field] = _subject_ref(subjects, payload[field])
+
+    # Flat natal / wheel payloads: {"subject": "<ref>", "theme": ...}
+    ref = payload.pop("subject", None) if job.type in ("natal", "wheel_pdf") else None
+    if isinstance(ref, str):
+        payload = {**_subject_ref(subjects, ref), **payload}
+
+    return JOB_MODELS[job.type].model_validate(payload)
+
+
+def _primary_subject(job_type: str, model: Any) -> Any:
+    if job_type in ("natal", "wheel_pdf"):
+        return (model.name, model.year, model.month, model.day, model.hour, model.minute, model.lat, model.lng)
+    first = getattr(model, "first", None) or getattr(model, "natal", None)
+    return first.model_dump_json() if first is not None else None
+
+
+def plan_chunks(jobs: list[tuple[int, str, BaseModel]], workers: int) -> list[list]:
+    """
+    Group jobs by their primary subject and split them into pool-sized
+    chunks, so subject reuse happens inside one worker while the batch
+    still fans out across all of them.
+    """
+    if not jobs:
+        return []
+    chunk_size = max(1, min(MAX_CHUNK_SIZE, math.ceil(len(jobs) / max(1, workers))))
+
+    groups: dict[Any, list] = {}
+    for job in jobs:
+        groups.setdefault(_primary_subject(job[1], job[2]), []).append(job)
+
+    chunks = []
+    for group in groups.values():
+        for start in range(0, len(group), chunk_size):
+            chunks.append(group[start:start + chunk_size])
+    return chunks
+
+
+def render_job(job_type: str, model: BaseModel, output: str = "json") -> bytes:
+    if job_type == "wheel_pdf":
+        return generate_wheel_pdf_bytes(model)
+    if output == "msgpack":
+        return generate_chart_msgpack_bytes(job_type, model)
+    return generate_chart_json_bytes(job_type, model)
+
+
+def run_batch_chunk(
+    jobs: list[tuple[int, str, BaseModel]],
+    output: str = "json",
+) -> list[tuple[int, bytes | None, str | None]]:
+    """
+    Render a chunk of jobs on one worker. Returns (index, body, error) per
+    job; a failing job never aborts the rest of the chunk. Chart jobs are
+    encoded as `output` (json or msgpack).
+    """
+    results = []
+    for index, job_type, model in jobs:
+        try:
+            results.append((index, render_job(job_type, model, output), None))
+        except Exception as e:
+            logger.warning("[batch] job %d (%s) failed: %s", index, job_type, e)
+            results.append((index, None, str(e)))
+    return results
@@ -1,10 +1,14 @@
 from datetime import datetime
-from io import BytesIO
 import base64
+import json
 import logging
 from pathlib import Path
 import re
+import threading
+import time
 import traceback
+from collections import OrderedDict
+from contextlib import contextmanager
 from typing import Dict
 
 import os
@@ -19,34 +23,40 @@ from kerykeion import (
 )
 from kerykeion.schemas.kr_models import ChartDataModel, SingleChartDataModel, DualChartDataModel
 
-from reportlab.graphics import renderPDF
 from reportlab.graphics.shapes import Drawing
-from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4, landscape
 from reportlab.lib.units import inch
-from reportlab.lib.utils import ImageReader
-from svglib.svglib import svg2rlg
 
 from app.schemas.natal import NatalRequest
 from app.schemas.synastry import SynastryRequest
 from app.schemas.transit import TransitRequest
 from app.schemas.composite import CompositeRequest
 from app.schemas.wheel import WheelPdfRequest
-from app.services.wheel_generator import svg_to_pdf_bytes
+from app.services.wheel_generator import chart_data_to_pdf_bytes, svg_to_pdf_bytes, themed_svg_to_pdf_bytes
+from app.services.pdf.native_wheel import NATIVE_CHART_TYPES
+from app.services.pdf.output_profile import draw_drawing, get_profile, new_canvas
+from app.services.pdf.svg_skeleton import svg_to_drawing
 
 from app.services.phoenix_theme import apply_phoenix_perfection
+from app.services.raster import encode_image, render_pyramid
+from app.services.render_jobs import CHART_FIELDS, SVG_FIELDS, image_output_format
 
 from app.services.kerykeion_model_utils import build_chart_model_from_kerykeion_data
+from app.core.config import settings
+from app.core.metrics import SUBJECT_LOOKUPS, incr, span
+from app.core.msgpack_codec import packb
+from app.services.pdf.wheel_page import draw_wheel_page
+from app.services.pdf.reports import REPORT_BODIES
+from app.services.pdf.assets import (
+    HEADER_LOGO_SIZE,
+    get_image,
+)
 
 logger = logging.getLogger("phoenix_charts.wheel")
 
 # Resolve repo root: .../phoenix-charts-api
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
-# Logo assets (wheel page + optional watermark)
-PRIMARY_LOGO_PATH = REPO_ROOT / "images" / "PhoenixLogo.png"
-WATERMARK_LOGO_PATH = REPO_ROOT / "images" / "PhoenixWaterMarkLogo.png"
-
 
 # ------------------------------------------------------------------
 # Theme normalization
@@ -71,56 +81,159 @@ def _normalize_theme(theme: str | None) -> str:
     t = theme.strip().lower().replace("_", "-")
     return t if t in _ALLOWED_THEMES else "classic"
 
-def generate_natal_chart(req: NatalRequest) -> Dict:
+
+def generate_natal_chart(req: NatalRequest, fields: frozenset = CHART_FIELDS) -> Dict:
     """
     Generate a natal chart SVG (and base64) using Kerykeion v5+.
     """
-    subject = AstrologicalSubjectFactory.from_birth_data(
-        name=req.name,
-        year=req.year,
-        month=req.month,
-        day=req.day,
-        hour=req.hour,
-        minute=req.minute,
-        lng=req.lng,
-        lat=req.lat,
-        tz_str=req.tz_str,
-        city=req.city,
-        nation=req.country,
-        online=False,
-    )
+    return _wrap_response("natal", *_build_natal_chart(req, fields), fields)
 
-    chart_data = ChartDataFactory.create_natal_chart_data(subject)
-    drawer = ChartDrawer(
-        chart_data=chart_data,
-        theme=req.theme or "classic",
-    )
-    svg = drawer.generate_svg_string()
 
-    svg_b64 = "data:image/svg+xml;base64," + base64.b64encode(
-        svg.encode("utf-8")
-    ).decode("utf-8")
+def _draw_svg(chart_data, theme: str, fields: frozenset) -> str | None:
+    """The chart SVG, or None when `fields` names neither svg nor svg_base64."""
+    if not fields & SVG_FIELDS:
+        return None
+    drawer = ChartDrawer(chart_data=chart_data, theme=theme)
+    with span("draw_svg"):
+        return drawer.generate_svg_string()
 
-    if hasattr(chart_data, "model_dump"):
-        data_dict = chart_data.model_dump()
-    elif hasattr(chart_data, "dict"):
-        data_dict = chart_data.dict()
-    else:
-        data_dict = {}
 
-    return {
-        "success": True,
-        "chart_type": "natal",
-        "svg": svg,
-        "svg_base64": svg_b64,
-        "data": data_dict,
-        "generated_at": datetime.utcnow().isoformat() + "Z",
-    }
+def _build_natal_chart(req: NatalRequest, fields: frozenset = CHART_FIELDS) -> tuple[str | None, ChartDataModel]:
+    subject = _subject_from_input(req)
+
+    with span("chart_data"):
+        chart_data = ChartDataFactory.create_natal_chart_data(subject)
+    return _draw_svg(chart_data, req.theme or "classic", fields), chart_data
+
+
+# ------------------------------------------------------------------
+# Subject memo
+# ------------------------------------------------------------------
+# A user typically asks for a natal chart, then transits for many dates, then
+# synastry with several partners: the same birth data over and over. Subjects
+# (planet / house positions) are memoized per process, keyed by the
+# canonical birth tuple plus the zodiac / house settings.
+
+
+class _SubjectMemo:
+    """Bounded LRU of AstrologicalSubjectModel by birth tuple."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, object] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple):
+        with self._lock:
+            subject = self._entries.get(key)
+            if subject is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return subject
+
+    def put(self, key: tuple, subject) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = subject
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+_subject_memo = _SubjectMemo(settings.subject_cache_size)
+
+# Kerykeion sets Swiss Ephemeris process globals (ephemeris path, topocentric
+# position, sidereal mode) before computing each subject. Render threads
+# (PHOENIX_RENDER_BACKEND=thread) would interleave those calls, and a
+# sidereal or topocentric subject would then corrupt a concurrent one, so
+# subjects are computed one at a time per process. Uncontended under the
+# process backend; memo hits never take it.
+_swisseph_lock = threading.Lock()
+
+
+def subject_cache_stats() -> dict:
+    """Memo stats of this process (see /metrics for all render workers)."""
+    return _subject_memo.stats()
+
+
+def cached_subject(
+    *,
+    name: str,
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    lng: float,
+    lat: float,
+    tz_str: str,
+    city: str = "",
+    nation: str = "",
+    **chart_settings,
+):
+    """
+    AstrologicalSubjectFactory.from_birth_data (offline) through the subject
+    memo. `chart_settings` are further factory options (zodiac_type,
+    houses_system_identifier, ...) and are part of the key.
+
+    The returned model is shared between requests and must not be mutated.
+    """
+    key = (
+        name, year, month, day, hour, minute,
+        lat, lng, tz_str, city, nation,
+        tuple(sorted(chart_settings.items())),
+    )
+    subject = _subject_memo.get(key)
+    if subject is not None:
+        incr(SUBJECT_LOOKUPS, "hit")
+        return subject
+
+    incr(SUBJECT_LOOKUPS, "miss")
+    with span("subject"), _swisseph_lock:
+        subject = AstrologicalSubjectFactory.from_birth_data(
+            name=name,
+            year=year,
+            month=month,
+            day=day,
+            hour=hour,
+            minute=minute,
+            lng=lng,
+            lat=lat,
+            tz_str=tz_str,
+            city=city,
+            nation=nation,
+            online=False,
+            **chart_settings,
+        )
+    _subject_memo.put(key, subject)
+    return subject
 
 
 # Shared helpers for other chart types
 def _subject_from_input(i) -> object:
-    return AstrologicalSubjectFactory.from_birth_data(
+    return cached_subject(
         name=i.name,
         year=i.year,
         month=i.month,
@@ -132,7 +245,6 @@ def _subject_from_input(i) -> object:
         tz_str=i.tz_str,
         city=i.city,
         nation=i.country,
-        online=False,
     )
 
 
@@ -144,61 +256,219 @@ def _dump_chart_data(model) -> dict:
     return {}
 
 
-def _wrap_response(chart_type: str, svg: str, data: dict) -> dict:
-    svg_b64 = "data:image/svg+xml;base64," + base64.b64encode(
-        svg.encode("utf-8")
-    ).decode("utf-8")
-    return {
-        "success": True,
-        "chart_type": chart_type,
-        "svg": svg,
-        "svg_base64": svg_b64,
-        "data": data,
-        "generated_at": datetime.utcnow().isoformat() + "Z",
-    }
+def _wrap_response(chart_type: str, svg: str, chart_data, fields: frozenset = CHART_FIELDS) -> dict:
+    """
+    Chart response dict. The base64 data URI (2.3x the SVG) and the chart
+    data dump are only built when they are in `fields`.
+    """
+    result = {"success": True, "chart_type": chart_type}
+    if "svg" in fields:
+        result["svg"] = svg
+    if "svg_base64" in fields:
+        result["svg_base64"] = "data:image/svg+xml;base64," + base64.b64encode(
+            svg.encode("utf-8")
+        ).decode("utf-8")
+    if "data" in fields:
+        result["data"] = _dump_chart_data(chart_data)
+    result["generated_at"] = datetime.utcnow().isoformat() + "Z"
+    return result
 
 
-def generate_synastry_chart(req: SynastryRequest) -> dict:
+def generate_synastry_chart(req: SynastryRequest, fields: frozenset = CHART_FIELDS) -> dict:
+    return _wrap_response("synastry", *_build_synastry_chart(req, fields), fields)
+
+
+def _build_synastry_chart(req: SynastryRequest, fields: frozenset = CHART_FIELDS) -> tuple[str | None, ChartDataModel]:
     first = _subject_from_input(req.first)
     second = _subject_from_input(req.second)
 
-    chart_data = ChartDataFactory.create_synastry_chart_data(first, second)
-    drawer = ChartDrawer(chart_data=chart_data, theme=req.theme)
-    svg = drawer.generate_svg_string()
-    data = _dump_chart_data(chart_data)
+    with span("chart_data"):
+        chart_data = ChartDataFactory.create_synastry_chart_data(first, second)
+    return _draw_svg(chart_data, req.theme, fields), chart_data
+
 
-    return _wrap_response("synastry", svg, data)
+def generate_transit_chart(req: TransitRequest, fields: frozenset = CHART_FIELDS) -> dict:
+    return _wrap_response("transit", *_build_transit_chart(req, fields), fields)
 
 
-def generate_transit_chart(req: TransitRequest) -> dict:
+def _build_transit_chart(req: TransitRequest, fields: frozenset = CHART_FIELDS) -> tuple[str | None, ChartDataModel]:
     natal = _subject_from_input(req.natal)
     transit = _subject_from_input(req.transit)
 
-    chart_data = ChartDataFactory.create_transit_chart_data(natal, transit)
-    drawer = ChartDrawer(chart_data=chart_data, theme=req.theme)
-    svg = drawer.generate_svg_string()
-    data = _dump_chart_data(chart_data)
+    with span("chart_data"):
+        chart_data = ChartDataFactory.create_transit_chart_data(natal, transit)
+    return _draw_svg(chart_data, req.theme, fields), chart_data
+
 
-    return _wrap_response("transit", svg, data)
+def generate_composite_chart(req: CompositeRequest, fields: frozenset = CHART_FIELDS) -> dict:
+    return _wrap_response("composite", *_build_composite_chart(req, fields), fields)
 
 
-def generate_composite_chart(req: CompositeRequest) -> dict:
+def _build_composite_chart(req: CompositeRequest, fields: frozenset = CHART_FIELDS) -> tuple[str | None, ChartDataModel]:
     first = _subject_from_input(req.first)
     second = _subject_from_input(req.second)
 
     factory = CompositeSubjectFactory(first, second)
-    composite = factory.get_midpoint_composite_subject_model()
+    with span("composite_subject"):
+        composite = factory.get_midpoint_composite_subject_model()
 
     # Provide ISO datetimes similar to working reference
     composite.iso_formatted_local_datetime = "1999-01-01T12:00:00-08:00"
     composite.iso_formatted_utc_datetime = "1999-01-01T20:00:00+00:00"
 
-    chart_data = ChartDataFactory.create_natal_chart_data(composite)
-    drawer = ChartDrawer(chart_data=chart_data, theme=req.theme)
-    svg = drawer.generate_svg_string()
+    with span("chart_data"):
+        chart_data = ChartDataFactory.create_natal_chart_data(composite)
+    return _draw_svg(chart_data, req.theme, fields), chart_data
+
+
+# (svg, chart data model) per chart type, before any response shaping; the
+# SVG is only drawn (None otherwise) when the fields passed name it
+_CHART_BUILDERS = {
+    "natal": _build_natal_chart,
+    "synastry": _build_synastry_chart,
+    "transit": _build_transit_chart,
+    "composite": _build_composite_chart,
+}
+
+# Chart data model per chart type (top-level fields a projection may name)
+_CHART_DATA_MODELS = {
+    "natal": SingleChartDataModel,
+    "composite": SingleChartDataModel,
+    "synastry": DualChartDataModel,
+    "transit": DualChartDataModel,
+}
+
+
+def data_projection(chart_type: str, spec: str) -> dict:
+    """
+    Parse a `data_fields` projection such as "aspects,first_subject.sun"
+    into a model_dump include spec. Raises ValueError on unknown
+    top-level fields.
+    """
+    allowed = _CHART_DATA_MODELS[chart_type].model_fields
+    include: dict = {}
+    for path in (p.strip() for p in spec.split(",")):
+        if not path:
+            continue
+        parts = path.split(".")
+        if parts[0] not in allowed:
+            raise ValueError(
+                f"Unknown {chart_type} data field {parts[0]!r} "
+                f"(choose from {', '.join(allowed)})"
+            )
+        node = include
+        for part in parts[:-1]:
+            child = node.get(part)
+            if child is True:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = True
+    return include
+
+
+def generate_chart_json_bytes(
+    chart_type: str,
+    req,
+    fields: frozenset = CHART_FIELDS,
+    data_include: dict | None = None,
+) -> bytes:
+    """
+    Generate a chart and encode it exactly like FastAPI's JSONResponse would,
+    so the body can be cached and served as-is.
+
+    The chart data is serialized by pydantic-core (model_dump_json) straight
+    into the body instead of model_dump() -> jsonable_encoder -> json.dumps,
+    optionally projected to `data_include` (a model_dump include spec).
+    """
+    svg, chart_data = _CHART_BUILDERS[chart_type](req, fields)
+    envelope = _wrap_response(chart_type, svg, chart_data, fields - {"data"})
+    generated_at = envelope.pop("generated_at")
+
+    with span("serialize"):
+        body = json.dumps(
+            envelope,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")[:-1]
+        if "data" in fields:
+            body += b',"data":' + chart_data.model_dump_json(include=data_include).encode("utf-8")
+        return body + b',"generated_at":"' + generated_at.encode("ascii") + b'"}'
+
+
+def generate_chart_msgpack_bytes(
+    chart_type: str,
+    req,
+    fields: frozenset = CHART_FIELDS,
+    data_include: dict | None = None,
+) -> bytes:
+    """
+    The chart response of generate_chart_json_bytes as a msgpack map. The
+    SVG is a bin field (UTF-8 bytes), so svg_base64, which only exists to
+    carry it in JSON, maps to the same field.
+    """
+    svg, chart_data = _CHART_BUILDERS[chart_type](req, fields)
+    with span("serialize"):
+        envelope = {"success": True, "chart_type": chart_type}
+        if fields & SVG_FIELDS:
+            envelope["svg"] = svg.encode("utf-8")
+        if "data" in fields:
+            envelope["data"] = chart_data.model_dump(mode="json", include=data_include)
+        envelope["generated_at"] = datetime.utcnow().isoformat() + "Z"
+        return packb(envelope)
+
+
+def generate_chart_svg_bytes(chart_type: str, req) -> bytes:
+    """The chart's SVG alone (UTF-8), for image/svg+xml responses."""
+    svg, _ = _CHART_BUILDERS[chart_type](req)
+    return svg.encode("utf-8")
+
+
+def generate_chart_pdf_bytes(chart_type: str, req, profile: str | None = None) -> bytes:
+    """
+    Generate a chart PDF: landscape wheel page followed by the portrait
+    report body. Used by the /{chart_type}/pdf endpoints; `profile` names
+    the PDF output profile (see pdf.output_profile).
+    """
+    draw_report_body = REPORT_BODIES.get(chart_type)
+    if draw_report_body is None:
+        raise NotImplementedError(f"No {chart_type} report body available yet")
+
+    svg_string, chart_data = _CHART_BUILDERS[chart_type](req)
     data = _dump_chart_data(chart_data)
 
-    return _wrap_response("composite", svg, data)
+    # PAGE 1: wheel (landscape)
+    c = new_canvas(f"{chart_type}.pdf", landscape(A4), get_profile(profile))
+    draw_wheel_page(c, svg_string)
+    c.showPage()
+
+    # PAGE 2+: report body (portrait)
+    c.setPageSize(A4)
+    with span("report_body"):
+        draw_report_body(c, data, req)
+    c.showPage()
+
+    # getpdfdata() hands back the serialized document itself; saving into a
+    # BytesIO and reading it back would copy every byte twice
+    with span("pdf_save"):
+        return c.getpdfdata()
+
+
+def generate_chart_image_bytes(chart_type: str, req, image_format: str, sizes: tuple[int, ...]) -> dict[str, bytes]:
+    """
+    The themed chart as `image_format` (png / webp) at every one of `sizes`
+    (longest side, px), rasterized once and downscaled. Keyed by output
+    format (see render_jobs.image_output_format) so each size is cached on
+    its own.
+    """
+    svg, _ = _CHART_BUILDERS[chart_type](req)
+    themed_svg = apply_phoenix_perfection(svg, _normalize_theme(getattr(req, "theme", None)))
+    images = render_pyramid(themed_svg, list(sizes))
+    return {
+        image_output_format(image_format, size): encode_image(image, image_format)
+        for size, image in images.items()
+    }
 
 
 def convert_svg_to_pdf_bytes(
@@ -207,20 +477,22 @@ def convert_svg_to_pdf_bytes(
     title: str = "",
     subtitle: str | None = None,
     logo_path: str | Path | None = None,
+    profile: str | None = None,
 ) -> bytes:
     """
     Pure SVG -> PDF conversion (no Cairo, no PNG).
     Mirrors test_wheel_perfection.py.
     """
+    pdf_profile = get_profile(profile)
     svg_resolved = apply_phoenix_perfection(svg, theme="classic")
 
-    drawing = svg2rlg(BytesIO(svg_resolved.encode("utf-8")))
+    with span("svg_parse"):
+        drawing = svg_to_drawing(svg_resolved)
     if drawing is None:
         raise ValueError("SVG parse failed")
 
-    buf = BytesIO()
     page_width, page_height = landscape(A4)
-    c = canvas.Canvas(buf, pagesize=(page_width, page_height))
+    c = new_canvas("chart.pdf", (page_width, page_height), pdf_profile)
 
     # Header (title + logo)
     left_margin = 0.75 * inch
@@ -236,11 +508,11 @@ def convert_svg_to_pdf_bytes(
 
     if logo_path:
         try:
-            p = Path(logo_path)
-            if p.exists():
-                logo_size = 1.25 * inch
+            img = get_image(logo_path, HEADER_LOGO_SIZE, pdf_profile.logo_dpi)
+            if img is not None:
+                logo_size = HEADER_LOGO_SIZE
                 c.drawImage(
-                    str(p),
+                    img,
                     page_width - logo_size - left_margin,
                     header_top - logo_size + 0.25 * inch,
                     width=logo_size,
@@ -248,8 +520,6 @@ def convert_svg_to_pdf_bytes(
                     preserveAspectRatio=True,
                     mask="auto",
                 )
-            else:
-                logger.warning("[wheel] LOGO not found at %s", p)
         except Exception as e:
             logger.warning("[wheel] LOGO draw failed: %s", e)
 
@@ -270,20 +540,15 @@ def convert_svg_to_pdf_bytes(
     x = (page_width - scaled_width) / 2.0
     y = (available_height - scaled_height) / 2.0 + 0.2 * inch
 
-    renderPDF.draw(drawing, c, x, y)
+    with span("pdf_draw"):
+        draw_drawing(drawing, c, x, y)
     c.showPage()
-    c.save()
-    buf.seek(0)
-    return buf.read()
+    with span("pdf_save"):
+        return c.getpdfdata()
 
 
-def generate_natal_svg_for_wheel(req: WheelPdfRequest) -> str:
-    """
-    Generate a natal SVG using the same Kerykeion pipeline as all_charts_final_perfect.py.
-    Theme is normalized to a supported Kerykeion theme; Phoenix overrides colors later.
-    """
-    theme = _normalize_theme(getattr(req, "theme", None))
-    subject_model = AstrologicalSubjectFactory.from_birth_data(
+def _natal_chart_data_for_wheel(req: WheelPdfRequest) -> ChartDataModel:
+    subject_model = cached_subject(
         name=req.name,
         year=req.year,
         month=req.month,
@@ -295,19 +560,108 @@ def generate_natal_svg_for_wheel(req: WheelPdfRequest) -> str:
         tz_str=req.tz_str,
         city=req.city or "",
         nation=req.country or "",
-        online=False,
     )
-    chart_data = ChartDataFactory.create_natal_chart_data(subject_model)
+    with span("chart_data"):
+        return ChartDataFactory.create_natal_chart_data(subject_model)
+
+
+def generate_natal_svg_for_wheel(req: WheelPdfRequest) -> str:
+    """
+    Generate a natal SVG using the same Kerykeion pipeline as all_charts_final_perfect.py.
+    Theme is normalized to a supported Kerykeion theme; Phoenix overrides colors later.
+    """
+    theme = _normalize_theme(getattr(req, "theme", None))
+    chart_data = _natal_chart_data_for_wheel(req)
     drawer = ChartDrawer(chart_data=chart_data, theme=theme)
-    return drawer.generate_svg_string()
+    with span("draw_svg"):
+        return drawer.generate_svg_string()
+
+
+def _use_native_renderer(req, chart_data) -> bool:
+    """Native wheel when the request asks for it and the chart has one subject."""
+    if getattr(req, "renderer", "svg") != "native":
+        return False
+    if chart_data.chart_type not in NATIVE_CHART_TYPES:
+        logger.debug("[wheel] native renderer unsupported for %s; using svg", chart_data.chart_type)
+        return False
+    return True
+
+
+@contextmanager
+def _timed_stage(timings: dict[str, float], stage: str):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = (time.perf_counter() - t0) * 1000.0
+
+
+def render_wheel_pdf_from_kerykeion_data(
+    kdata: dict,
+    *,
+    phoenix_theme: str,
+    drawer_theme: str,
+    name: str = "",
+    chart_type: str = "",
+    renderer: str = "svg",
+    profile: str | None = None,
+) -> bytes:
+    """
+    Wheel PDF pipeline for a ready kerykeion_data payload.
+
+    Stages run exactly once each, in order, and are timed individually:
+      validate -> draw_svg -> theme -> rasterize
+    or, with renderer="native" (single-subject charts):
+      validate -> native_draw
+    benchmarks/bench_wheel_stages.py checks the call counts.
+
+    In PHOENIX_KERYKEION_VALIDATION=cached mode the chart model comes from a
+    memo shared by every request with the same payload: nothing downstream
+    (drawer, native wheel) may mutate it. Normalize `kdata` before calling,
+    since the memo key is a hash of it.
+    """
+    timings: dict[str, float] = {}
+
+    # Convert dict -> concrete chart data model (Single or Dual) via shared helper
+    with _timed_stage(timings, "validate"), span("validate"):
+        chart_model = build_chart_model_from_kerykeion_data(kdata)
+
+    if renderer == "native" and chart_model.chart_type in NATIVE_CHART_TYPES:
+        with _timed_stage(timings, "native_draw"):
+            pdf_bytes = chart_data_to_pdf_bytes(
+                chart_model, phoenix_theme, name=name, chart_type=chart_type, profile=profile
+            )
+        logger.info(
+            "[wheel] kerykeion_data pipeline %s",
+            " ".join(f"{stage}={ms:.1f}ms" for stage, ms in timings.items()),
+        )
+        return pdf_bytes
+
+    with _timed_stage(timings, "draw_svg"):
+        drawer = ChartDrawer(chart_data=chart_model, theme=drawer_theme)
+        with span("draw_svg"):
+            svg = drawer.generate_svg_string()
+
+    with _timed_stage(timings, "theme"):
+        themed_svg = apply_phoenix_perfection(svg, phoenix_theme)
+
+    with _timed_stage(timings, "rasterize"):
+        pdf_bytes = themed_svg_to_pdf_bytes(themed_svg, name=name, chart_type=chart_type, profile=profile)
+
+    logger.info(
+        "[wheel] kerykeion_data pipeline %s",
+        " ".join(f"{stage}={ms:.1f}ms" for stage, ms in timings.items()),
+    )
+    return pdf_bytes
 
 
-def generate_wheel_pdf_bytes(req) -> bytes:
+def generate_wheel_pdf_bytes(req, profile: str | None = None) -> bytes:
     """
     Generate a wheel PDF for natal charts.
 
     Preferred: use full kerykeion_data (no recompute).
     Fallback: recompute from explicit birth fields.
+    `profile` names the PDF output profile (see pdf.output_profile).
     """
     try:
         # ---------------------------------------------------------
@@ -330,6 +684,8 @@ def generate_wheel_pdf_bytes(req) -> bytes:
                     subject["zodiac_type"] = "Tropical"
                 elif zl.startswith("sid"):
                     subject["zodiac_type"] = "Sidereal"
+            # Normalized before render_wheel_pdf_from_kerykeion_data hashes
+            # kdata for the model memo (cached validation mode)
             kdata["subject"] = subject
 
             asc = subject.get("ascendant") or subject.get("asc") or {}
@@ -355,24 +711,20 @@ def generate_wheel_pdf_bytes(req) -> bytes:
             zodiac_type = subject.get("zodiac_type")
             logger.debug("[wheel] house_system=%s zodiac_type=%s", house_sys, zodiac_type)
 
-            # Convert dict -> concrete chart data model (Single or Dual) via shared helper
-            chart_model = build_chart_model_from_kerykeion_data(kdata)
-
-            drawer = ChartDrawer(chart_data=chart_model, theme=drawer_theme)
-            svg = drawer.generate_svg_string()
-                        # Human-readable chart type label for the wheel header
+            # Human-readable chart type label for the wheel header
             chart_type_label = (
                 getattr(req, "chart_type", "")        # "natal" from astro-bot
                 or str(kdata.get("chart_type") or kdata.get("chartType") or "Natal")
             )
 
-            drawer = ChartDrawer(chart_data=chart_model, theme=drawer_theme)
-            svg = drawer.generate_svg_string()
-            pdf_bytes = svg_to_pdf_bytes(
-                svg,
-                theme=phoenix_theme,
+            pdf_bytes = render_wheel_pdf_from_kerykeion_data(
+                kdata,
+                phoenix_theme=phoenix_theme,
+                drawer_theme=drawer_theme,
                 name=getattr(req, "name", "") or subject.get("name", ""),
                 chart_type=chart_type_label,
+                renderer=getattr(req, "renderer", "svg"),
+                profile=profile,
             )
 
             logger.debug("[wheel] PDF generated from kerykeion_data, size=%d bytes", len(pdf_bytes))
@@ -403,8 +755,14 @@ def generate_wheel_pdf_bytes(req) -> bytes:
                 drawer_theme,
             )
 
-            svg = generate_natal_svg_for_wheel(req)  # uses ChartDrawer internally
-            pdf_bytes = svg_to_pdf_bytes(svg, theme=phoenix_theme)
+            chart_data = _natal_chart_data_for_wheel(req)
+            if _use_native_renderer(req, chart_data):
+                pdf_bytes = chart_data_to_pdf_bytes(chart_data, phoenix_theme, profile=profile)
+            else:
+                drawer = ChartDrawer(chart_data=chart_data, theme=_normalize_theme(raw_theme))
+                with span("draw_svg"):
+                    svg = drawer.generate_svg_string()
+                pdf_bytes = svg_to_pdf_bytes(svg, theme=phoenix_theme, profile=profile)
             logger.debug("[wheel] PDF generated (WheelPdfRequest), size=%d bytes", len(pdf_bytes))
             return pdf_bytes
 
@@ -442,7 +800,7 @@ def generate_wheel_pdf_bytes(req) -> bytes:
             subject.get("houses_system_identifier"),
         )
 
-        subject_model = AstrologicalSubjectFactory.from_birth_data(
+        subject_model = cached_subject(
             name=subject.get("name", name or "Chart"),
             year=subject.get("year") or subject.get("birth_year"),
             month=subject.get("month") or subject.get("birth_month"),
@@ -454,13 +812,17 @@ def generate_wheel_pdf_bytes(req) -> bytes:
             tz_str=subject.get("tz_str") or subject.get("timezone") or "UTC",
             city=subject.get("city") or subject.get("place") or "",
             nation=subject.get("nation") or subject.get("country") or "",
-            online=False,
         )
 
-        chart_data = ChartDataFactory.create_natal_chart_data(subject_model)
-        drawer = ChartDrawer(chart_data=chart_data, theme=drawer_theme)
-        svg = drawer.generate_svg_string()
-        pdf_bytes = svg_to_pdf_bytes(svg, theme=phoenix_theme)
+        with span("chart_data"):
+            chart_data = ChartDataFactory.create_natal_chart_data(subject_model)
+        if _use_native_renderer(req, chart_data):
+            pdf_bytes = chart_data_to_pdf_bytes(chart_data, phoenix_theme, profile=profile)
+        else:
+            drawer = ChartDrawer(chart_data=chart_data, theme=drawer_theme)
+            with span("draw_svg"):
+                svg = drawer.generate_svg_string()
+            pdf_bytes = svg_to_pdf_bytes(svg, theme=phoenix_theme, profile=profile)
         logger.debug("[wheel] PDF generated (legacy), size=%d bytes", len(pdf_bytes))
         return pdf_bytes
 
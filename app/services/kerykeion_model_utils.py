@@ -1,9 +1,56 @@
+import hashlib
+import pickle
+import threading
+import typing
+from collections import OrderedDict
+
 from kerykeion.schemas.kr_models import SingleChartDataModel, DualChartDataModel
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.metrics import KERYKEION_MODEL_LOOKUPS, incr
+
+# How kerykeion_data payloads become chart models (PHOENIX_KERYKEION_VALIDATION):
+#   full     model_validate on every call
+#   cached   validated models memoized by a hash of the payload's content;
+#            repeated payloads (retries, re-rendering a stored chart in
+#            another theme) skip validation
+#   trusted  no validation: after a structural check (every required field
+#            present, objects / lists where the schema has nested models) the
+#            model tree is assembled the way model_construct does it. Only
+#            for payloads Kerykeion itself produced (our own Astro-Bot).
+#
+# pydantic-core validates these payloads in well under 2 ms, about as fast
+# as any Python-side construction of the ~300 nested models can go, so
+# trusted saves little; cached is the mode that skips the work
+# (benchmarks/bench_kerykeion_validation.py).
+VALIDATION_MODES = ("full", "cached", "trusted")
+
+
+def _chart_model_class(kdata: dict):
+    # Normalize chart_type – match Kerykeion's own logic
+    raw_type = kdata.get("chart_type") or kdata.get("chartType") or ""
+    k_chart_type = str(raw_type).strip().lower()
 
+    # Explicit dual chart types as defined by Kerykeion
+    dual_chart_types = {"transit", "synastry", "dualreturnchart"}
+
+    is_explicit_dual = k_chart_type in dual_chart_types
+    has_dual_subjects = (
+        isinstance(kdata.get("first_subject"), dict)
+        and isinstance(kdata.get("second_subject"), dict)
+    )
 
-def build_chart_model_from_kerykeion_data(kdata: dict):
+    if is_explicit_dual or has_dual_subjects:
+        # Transit / Synastry / DualReturnChart (or explicit dual payload)
+        return DualChartDataModel
+    # Radix, ReturnChart, Progressed, Composite-with-single-subject, etc.
+    return SingleChartDataModel
+
+
+def build_chart_model_from_kerykeion_data(kdata: dict, mode: str | None = None):
     """
-    Normalize chart_type and build a validated Kerykeion ChartDataModel
+    Normalize chart_type and build a Kerykeion ChartDataModel
     (SingleChartDataModel or DualChartDataModel) from a raw kerykeion_data dict.
 
     Dual charts are only:
@@ -14,37 +61,206 @@ def build_chart_model_from_kerykeion_data(kdata: dict):
 
     Everything else (Radix, ReturnChart, Progressed, Composite without dual subjects, etc.)
     is treated as a single chart.
+
+    `mode` is full, cached or trusted (see VALIDATION_MODES); None selects
+    PHOENIX_KERYKEION_VALIDATION. Models from the cache are shared between
+    requests and must not be mutated.
     """
     if not isinstance(kdata, dict):
         raise TypeError("kdata must be a dict")
 
-    # Normalize chart_type – match Kerykeion's own logic
-    raw_type = kdata.get("chart_type") or kdata.get("chartType") or ""
-    k_chart_type = str(raw_type).strip().lower()
+    mode = mode or settings.kerykeion_validation
+    model_cls = _chart_model_class(kdata)
 
-    # Explicit dual chart types as defined by Kerykeion
-    dual_chart_types = {"transit", "synastry", "dualreturnchart"}
+    if mode == "full":
+        return model_cls.model_validate(kdata)
+    if mode == "trusted":
+        return construct_trusted(model_cls, kdata)
+    if mode == "cached":
+        key = payload_hash(kdata)
+        model = _model_memo.get(key)
+        if model is not None:
+            incr(KERYKEION_MODEL_LOOKUPS, "hit")
+            return model
+        incr(KERYKEION_MODEL_LOOKUPS, "miss")
+        model = model_cls.model_validate(kdata)
+        _model_memo.put(key, model)
+        return model
+    raise ValueError(f"Unknown validation mode {mode!r} (choose from {', '.join(VALIDATION_MODES)})")
 
-    is_explicit_dual = k_chart_type in dual_chart_types
-    has_dual_subjects = (
-        isinstance(kdata.get("first_subject"), dict)
-        and isinstance(kdata.get("second_subject"), dict)
-    )
 
-    if is_explicit_dual or has_dual_subjects:
-        # Transit / Synastry / DualReturnChart (or explicit dual payload)
-        model_cls = DualChartDataModel
+# ------------------------------------------------------------------
+# cached
+# ------------------------------------------------------------------
+
+
+def payload_hash(kdata: dict) -> bytes:
+    # pickle walks the payload in C, several times faster than a canonical
+    # json.dumps (which costs more than the validation it would save). Key
+    # order is part of the hash: the same JSON body always hits, a reordered
+    # one is a miss, never a wrong model.
+    return hashlib.blake2b(pickle.dumps(kdata, protocol=5), digest_size=16).digest()
+
+
+class _ModelMemo:
+    """Bounded LRU of validated chart models by payload hash."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes):
+        with self._lock:
+            model = self._entries.get(key)
+            if model is not None:
+                self._entries.move_to_end(key)
+            return model
+
+    def put(self, key: bytes, model) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = model
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_model_memo = _ModelMemo(settings.kerykeion_model_cache_size)
+
+
+def clear_model_cache() -> None:
+    _model_memo.clear()
+
+
+# ------------------------------------------------------------------
+# trusted
+# ------------------------------------------------------------------
+
+# Per model class: field names in order, required ones, the FieldInfo of
+# the others (defaults are made per model, so no two models share a mutable
+# default) and the fields holding nested models, as (name, is_list,
+# classes) with union members in declaration order.
+class _Plan(typing.NamedTuple):
+    fields: tuple[str, ...]
+    field_set: frozenset
+    required: frozenset
+    optional: dict
+    nested: tuple[tuple[str, bool, tuple], ...]
+
+
+_plans: dict[type, _Plan] = {}
+
+
+def _model_candidates(annotation) -> tuple:
+    args = typing.get_args(annotation) if typing.get_origin(annotation) is typing.Union else (annotation,)
+    return tuple(a for a in args if isinstance(a, type) and issubclass(a, BaseModel))
+
+
+def _plan(model_cls) -> _Plan:
+    plan = _plans.get(model_cls)
+    if plan is None:
+        required, optional, nested = set(), {}, []
+        for name, field in model_cls.model_fields.items():
+            if field.is_required():
+                required.add(name)
+            else:
+                optional[name] = field
+            annotation = field.annotation
+            is_list = typing.get_origin(annotation) is list
+            if is_list:
+                args = typing.get_args(annotation)
+                annotation = args[0] if args else None
+            candidates = _model_candidates(annotation)
+            if candidates:
+                nested.append((name, is_list, candidates))
+        names = tuple(model_cls.model_fields)
+        plan = _plans[model_cls] = _Plan(names, frozenset(names), frozenset(required), optional, tuple(nested))
+    return plan
+
+
+class _Malformed(Exception):
+    """Structural problem in a payload; `path` is filled in on the way out."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+        self.path: list[str] = []
+
+
+def _pick(candidates: tuple, data):
+    """The union member `data` fits: all required fields present, most fields matched."""
+    if len(candidates) == 1 or not isinstance(data, dict):
+        return candidates[0]
+    best, best_score = None, -1
+    for cls in candidates:
+        plan = _plan(cls)
+        if plan.required <= data.keys():
+            score = len(data.keys() & plan.field_set)
+            if score > best_score:
+                best, best_score = cls, score
+    if best is None:
+        raise _Malformed(f"missing required fields for {' / '.join(cls.__name__ for cls in candidates)}")
+    return best
+
+
+def _construct(model_cls, data):
+    if not isinstance(data, dict):
+        raise _Malformed(f"expected an object for {model_cls.__name__}")
+    plan = _plan(model_cls)
+    if data.keys() == plan.field_set:
+        # Complete payload (what Kerykeion's model_dump produces)
+        values = dict(data)
     else:
-        # Radix, ReturnChart, Progressed, Composite-with-single-subject, etc.
-        model_cls = SingleChartDataModel
+        missing = plan.required - data.keys()
+        if missing:
+            raise _Malformed(f"missing required fields {', '.join(sorted(missing))}")
+        values = {
+            name: data[name] if name in data else plan.optional[name].get_default(call_default_factory=True)
+            for name in plan.fields
+        }
+
+    for name, is_list, candidates in plan.nested:
+        value = values[name]
+        if value is None or name not in data:
+            # Defaults are already what the field holds
+            continue
+        try:
+            if not is_list:
+                values[name] = _construct(_pick(candidates, value), value)
+                continue
+            if not isinstance(value, list):
+                raise _Malformed("expected a list")
+            items = []
+            for i, item in enumerate(value):
+                try:
+                    items.append(_construct(_pick(candidates, item), item))
+                except _Malformed as e:
+                    e.path.append(f"[{i}]")
+                    raise
+            values[name] = items
+        except _Malformed as e:
+            e.path.append(f".{name}")
+            raise
 
-    # Pydantic v2
-    if hasattr(model_cls, "model_validate"):
-        return model_cls.model_validate(kdata)  # type: ignore[attr-defined]
+    # What model_construct does, minus its per-field default / alias handling
+    model = model_cls.__new__(model_cls)
+    _set = object.__setattr__
+    _set(model, "__dict__", values)
+    _set(model, "__pydantic_fields_set__", data.keys() & plan.field_set)
+    _set(model, "__pydantic_extra__", None)
+    _set(model, "__pydantic_private__", None)
+    return model
 
-    # Pydantic v1
-    if hasattr(model_cls, "parse_obj"):
-        return model_cls.parse_obj(kdata)      # type: ignore[attr-defined]
 
-    # Fallback (should rarely be needed)
-    return model_cls(**kdata)                  # type: ignore[arg-type]
\ No newline at end of file
+def construct_trusted(model_cls, kdata: dict):
+    """`model_cls` built from `kdata` without validation, after a structural check (ValueError)."""
+    try:
+        return _construct(model_cls, kdata)
+    except _Malformed as e:
+        raise ValueError(f"kerykeion_data{''.join(reversed(e.path))}: {e.message}") from None
@@ -0,0 +1,87 @@
+# app/services/pdf/assets.py
+#
+# Logo images for the PDF pages.
+#
+# The source PNGs are 1024x1024 (~2 MB). Decoding them per request and
+# embedding the full-resolution bitmap in every PDF is wasteful when they are
+# printed at ~1 inch, so each (image, printed size) pair is decoded once,
+# downscaled to PHOENIX_LOGO_DPI and kept as a ready-to-draw ImageReader.
+
+import logging
+import threading
+from pathlib import Path
+
+from PIL import Image
+from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
+
+from app.core.config import settings
+
+logger = logging.getLogger("phoenix_charts.wheel")
+
+# Resolve repo root: .../phoenix-charts-api
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+# Logo drawn on the wheel page and the report headers
+PRIMARY_LOGO_PATH = REPO_ROOT / "images" / "PhoenixLogo.png"
+
+# Printed logo sizes used by the page layouts
+WHEEL_LOGO_SIZE = 0.9 * inch
+HEADER_LOGO_SIZE = 1.25 * inch
+
+_images: dict[tuple[Path, int, int], ImageReader | None] = {}
+_lock = threading.Lock()
+
+
+def _target_pixels(print_size: float, dpi: int) -> int:
+    return max(1, round(print_size / inch * dpi))
+
+
+def _load_scaled(path: Path, max_px: int, dpi: int) -> ImageReader | None:
+    if not path.exists():
+        logger.warning("[assets] image not found at %s", path)
+        return None
+
+    with Image.open(path) as src:
+        img = src.convert("RGBA" if "A" in src.getbands() else "RGB")
+    # Only ever shrink; thumbnail keeps the aspect ratio
+    img.thumbnail((max_px, max_px), Image.LANCZOS)
+
+    reader = ImageReader(img)
+    # Decode the pixel (and alpha) data now so drawImage only compresses it
+    reader.getRGBData()
+    logger.info(
+        "[assets] loaded %s at %dx%d px (%d dpi)",
+        path.name,
+        img.width,
+        img.height,
+        dpi,
+    )
+    return reader
+
+
+def get_image(path: str | Path, print_size: float, dpi: int | None = None) -> ImageReader | None:
+    """
+    Return a cached, downscaled ImageReader for `path` printed at
+    `print_size` points (longest side) at `dpi` (default PHOENIX_LOGO_DPI).
+    None if the file is missing.
+    """
+    dpi = dpi or settings.logo_dpi
+    key = (Path(path).resolve(), _target_pixels(print_size, dpi), dpi)
+    try:
+        return _images[key]
+    except KeyError:
+        pass
+    with _lock:
+        if key not in _images:
+            _images[key] = _load_scaled(*key)
+        return _images[key]
+
+
+def preload_assets() -> None:
+    """Decode every logo at the sizes and resolutions the page layouts use."""
+    from app.services.pdf.output_profile import PROFILES
+
+    for dpi in {profile.logo_dpi for profile in PROFILES.values()}:
+        get_image(PRIMARY_LOGO_PATH, WHEEL_LOGO_SIZE, dpi)
+        get_image(PRIMARY_LOGO_PATH, HEADER_LOGO_SIZE, dpi)
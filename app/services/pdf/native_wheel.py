@@ -0,0 +1,297 @@
+# app/services/pdf/native_wheel.py
+#
+# Native wheel renderer: builds the chart wheel as a ReportLab Drawing
+# straight from a Kerykeion ChartDataModel, instead of generating an SVG
+# with ChartDrawer and re-parsing it with svglib (~250 ms of svg2rlg per
+# wheel).
+#
+# Geometry mirrors ChartDrawer for single-subject charts (same radii,
+# sliceToX / sliceToY placement and planet de-overlapping), so the wheel
+# matches the svglib one; colors come from the Phoenix theme variables.
+# Glyphs (planets, signs) are the <symbol>s of Kerykeion's wheel
+# template, parsed once per theme and reused as shared Drawing nodes.
+
+import functools
+import re
+from io import BytesIO
+from pathlib import Path
+from typing import get_args
+
+import kerykeion
+from kerykeion.charts.charts_utils import degreeDiff, sliceToX, sliceToY
+# Private helpers, reused so planets are spread exactly like ChartDrawer does
+from kerykeion.charts.draw_planets import (
+    _calculate_point_offset,
+    _determine_point_radius,
+    _handle_multi_point_group,
+    _handle_two_point_group,
+)
+from kerykeion.schemas.kr_literals import Sign
+from kerykeion.settings.chart_defaults import (
+    DEFAULT_CELESTIAL_POINTS_SETTINGS,
+    DEFAULT_CHART_ASPECTS_SETTINGS,
+    DEFAULT_CHART_COLORS,
+)
+from kerykeion.utilities import get_houses_list
+from reportlab.graphics.shapes import Circle, Drawing, Group, Line, Rect, String, Wedge
+from svglib.svglib import Svg2RlgAttributeConverter, svg2rlg
+
+from app.services.phoenix_theme import _normalize_theme_name, recolor_plan
+
+# Chart types drawn on a single wheel (SingleChartDataModel)
+NATIVE_CHART_TYPES = frozenset({"Natal", "Composite", "SingleReturnChart"})
+
+# ChartDrawer's single-chart layout
+RADIUS = 240
+FIRST_CIRCLE = 0
+SECOND_CIRCLE = 36
+THIRD_CIRCLE = 120
+# Same margin as ChartDrawer's wheel-only viewBox
+MARGIN = 20
+PLANET_GROUPING_THRESHOLD = 3.4
+
+WHEEL_TEMPLATE = Path(kerykeion.__file__).parent / "charts" / "templates" / "wheel_only.xml"
+SYMBOL_PATTERN = re.compile(r'<symbol id="(?P<id>[^"]+)">(?P<body>.*?)</symbol>', re.DOTALL)
+GLYPH_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+    'width="40" height="40">{body}</svg>'
+)
+
+_color = Svg2RlgAttributeConverter().convertColor
+
+
+class _Palette:
+    """Theme colors as ReportLab colors, keyed by Kerykeion color value."""
+
+    def __init__(self, theme: str):
+        self.plan = recolor_plan(theme)
+        self._colors: dict[str, object] = {}
+
+    def __call__(self, value: str):
+        color = self._colors.get(value)
+        if color is None:
+            color = self._colors[value] = _color(self.plan.resolve(value))
+        return color
+
+    def chart(self, key: str):
+        return self(DEFAULT_CHART_COLORS[key])
+
+
+@functools.lru_cache(maxsize=None)
+def _palette(theme: str) -> _Palette:
+    return _Palette(theme)
+
+
+@functools.lru_cache(maxsize=None)
+def _glyphs(theme: str) -> dict[str, Group]:
+    """Kerykeion's symbol glyphs, themed and converted once per theme."""
+    plan = recolor_plan(theme)
+    glyphs = {}
+    for m in SYMBOL_PATTERN.finditer(WHEEL_TEMPLATE.read_text(encoding="utf-8")):
+        drawing = svg2rlg(BytesIO(GLYPH_SVG.format(body=plan.resolve(m.group("body"))).encode("utf-8")))
+        if drawing is None:
+            continue
+        # svglib wraps the content in a y-flip group; keep the SVG-space children
+        glyphs[m.group("id")] = Group(*drawing.contents[0].contents)
+    return glyphs
+
+
+def _at(node, x: float, y: float) -> Group:
+    return Group(node, transform=(1, 0, 0, 1, x, y))
+
+
+def _line(x1, y1, x2, y2, color, opacity=1.0, dash=None) -> Line:
+    line = Line(x1, y1, x2, y2, strokeColor=color, strokeWidth=1, strokeOpacity=opacity)
+    if dash:
+        line.strokeDashArray = dash
+    return line
+
+
+def _text(x: float, y: float, text: str, color, size: float, opacity: float = 1.0) -> Group:
+    # Un-flip the glyphs of the text inside the SVG-space wheel group
+    return Group(
+        String(0, 0, text, fontName="Helvetica", fontSize=size, fillColor=color, fillOpacity=opacity),
+        transform=(1, 0, 0, -1, x, y),
+    )
+
+
+def _circle(r: float, fill, stroke, fill_opacity: float = 1.0, stroke_opacity: float = 1.0) -> Circle:
+    return Circle(
+        RADIUS, RADIUS, r,
+        fillColor=fill, fillOpacity=fill_opacity,
+        strokeColor=stroke, strokeOpacity=stroke_opacity, strokeWidth=1,
+    )
+
+
+def _active_points(chart_data) -> tuple[list[dict], list]:
+    """Active point settings and their KerykeionPointModels, in ChartDrawer order."""
+    subject = chart_data.subject
+    settings_list, points = [], []
+    for body in DEFAULT_CELESTIAL_POINTS_SETTINGS:
+        if body["name"] not in chart_data.active_points:
+            continue
+        point = getattr(subject, body["name"].lower(), None)
+        if point is None:
+            continue
+        settings_list.append(body)
+        points.append(point)
+    return settings_list, points
+
+
+def _point_positions(points: list, settings_list: list[dict], seventh: float, chart_type: str):
+    """(index, x, y) per point, spread apart the way draw_planets does."""
+    positions = [p.abs_pos for p in points]
+    index_of = {pos: i for i, pos in enumerate(positions)}
+    ordered = sorted(index_of)
+    count = len(ordered)
+
+    by_position: list = [None] * count
+    groups: list = []
+    group_open = False
+    for k, pos in enumerate(ordered):
+        i = index_of[pos]
+        if count == 1:
+            to_prev = to_next = 360.0
+        else:
+            to_prev = degreeDiff(positions[index_of[ordered[k - 1]]], positions[i])
+            to_next = degreeDiff(positions[index_of[ordered[(k + 1) % count]]], positions[i])
+        by_position[k] = [i, to_prev, to_next]
+
+        entry = [k, to_prev, to_next, settings_list[i]["label"]]
+        if to_next < PLANET_GROUPING_THRESHOLD:
+            if group_open:
+                groups[-1].append(entry)
+            else:
+                group_open = True
+                groups.append([entry])
+        else:
+            if group_open:
+                groups[-1].append(entry)
+            group_open = False
+
+    adjustments = [0.0] * len(points)
+    for group in groups:
+        if len(group) == 2:
+            _handle_two_point_group(group, by_position, adjustments, PLANET_GROUPING_THRESHOLD)
+        elif len(group) >= 3:
+            _handle_multi_point_group(group, adjustments, PLANET_GROUPING_THRESHOLD)
+
+    for k, pos in enumerate(ordered):
+        i = index_of[pos]
+        point_radius = _determine_point_radius(i, chart_type, bool(k % 2))
+        offset = _calculate_point_offset(seventh, positions[i], adjustments[k])
+        x = sliceToX(0, RADIUS - point_radius, offset) + point_radius
+        y = sliceToY(0, RADIUS - point_radius, offset) + point_radius
+        yield i, x, y
+
+
+def build_wheel_drawing(chart_data, theme: str = "classic") -> Drawing:
+    """
+    Wheel of a single-subject ChartDataModel as a Drawing: zodiac ring,
+    rings, degree ticks, house cusps and numbers, point glyphs and aspect
+    lines. Same extent as Kerykeion's wheel-only SVG (wheel + 20 margin).
+    """
+    if chart_data.chart_type not in NATIVE_CHART_TYPES:
+        raise ValueError(f"Native wheel renderer does not support {chart_data.chart_type} charts")
+
+    theme = _normalize_theme_name(theme)
+    palette = _palette(theme)
+    glyphs = _glyphs(theme)
+    subject = chart_data.subject
+    seventh = subject.seventh_house.abs_pos
+    paper_0 = palette.chart("paper_0")
+    paper_1 = palette.chart("paper_1")
+
+    # Everything below is in ChartDrawer's SVG space (y down, wheel at 0..480)
+    size = 2 * RADIUS + 2 * MARGIN
+    wheel = Group(transform=(1, 0, 0, -1, MARGIN, size - MARGIN))
+
+    # Background circle
+    wheel.add(_circle(RADIUS, paper_1, paper_1))
+
+    # Zodiac sectors and sign glyphs
+    offset = 360 - seventh
+    for num, sign in enumerate(get_args(Sign)):
+        start = 30 * num + offset
+        wheel.add(Wedge(
+            RADIUS, RADIUS, RADIUS, -start - 30, -start,
+            fillColor=palette.chart(f"zodiac_bg_{num}"), fillOpacity=0.5, strokeColor=None,
+        ))
+        dropin = 18 + FIRST_CIRCLE
+        x = dropin + sliceToX(num, RADIUS - dropin, offset + 15)
+        y = dropin + sliceToY(num, RADIUS - dropin, offset + 15)
+        if sign in glyphs:
+            wheel.add(_at(glyphs[sign], x - 16, y - 16))
+
+    # Rings
+    wheel.add(_circle(RADIUS - FIRST_CIRCLE, None, palette.chart("zodiac_radix_ring_2")))
+    wheel.add(_circle(
+        RADIUS - SECOND_CIRCLE, paper_1, palette.chart("zodiac_radix_ring_1"),
+        fill_opacity=0.2, stroke_opacity=0.4,
+    ))
+    wheel.add(_circle(RADIUS - THIRD_CIRCLE, paper_1, palette.chart("zodiac_radix_ring_0"), fill_opacity=0.8))
+
+    # Degree ring: a tick every 5 degrees
+    for i in range(72):
+        tick = (i * 5 - seventh) % 360.0
+        wheel.add(_line(
+            sliceToX(0, RADIUS - FIRST_CIRCLE, tick) + FIRST_CIRCLE,
+            sliceToY(0, RADIUS - FIRST_CIRCLE, tick) + FIRST_CIRCLE,
+            sliceToX(0, RADIUS + 2 - FIRST_CIRCLE, tick) - 2 + FIRST_CIRCLE,
+            sliceToY(0, RADIUS + 2 - FIRST_CIRCLE, tick) - 2 + FIRST_CIRCLE,
+            paper_0, 0.9,
+        ))
+
+    # House cusps and numbers (ChartDrawer colors the angles by settings 12..15)
+    houses = get_houses_list(subject)
+    angle_colors = {
+        0: DEFAULT_CELESTIAL_POINTS_SETTINGS[12]["color"],
+        9: DEFAULT_CELESTIAL_POINTS_SETTINGS[13]["color"],
+        6: DEFAULT_CELESTIAL_POINTS_SETTINGS[14]["color"],
+        3: DEFAULT_CELESTIAL_POINTS_SETTINGS[15]["color"],
+    }
+    house_number = palette("var(--kerykeion-chart-color-house-number)")
+    for i, house in enumerate(houses):
+        cusp = -int(houses[6].abs_pos) + int(house.abs_pos)
+        color = palette(angle_colors.get(i, DEFAULT_CHART_COLORS["houses_radix_line"]))
+        wheel.add(_line(
+            sliceToX(0, RADIUS - THIRD_CIRCLE, cusp) + THIRD_CIRCLE,
+            sliceToY(0, RADIUS - THIRD_CIRCLE, cusp) + THIRD_CIRCLE,
+            sliceToX(0, RADIUS - FIRST_CIRCLE, cusp) + FIRST_CIRCLE,
+            sliceToY(0, RADIUS - FIRST_CIRCLE, cusp) + FIRST_CIRCLE,
+            color, 0.4, dash=[3, 2],
+        ))
+        middle = cusp + int(degreeDiff(houses[(i + 1) % 12].abs_pos, house.abs_pos) / 2)
+        x = sliceToX(0, RADIUS - 48, middle) + 48
+        y = sliceToY(0, RADIUS - 48, middle) + 48
+        wheel.add(_text(x - 3, y + 3, str(i + 1), house_number, 14, 0.6))
+
+    # Point glyphs (24x24, centred on the computed position)
+    settings_list, points = _active_points(chart_data)
+    for i, x, y in _point_positions(points, settings_list, seventh, chart_data.chart_type):
+        glyph = glyphs.get(settings_list[i]["name"])
+        if glyph is not None:
+            wheel.add(_at(glyph, x - 12, y - 12))
+
+    # Aspect lines inside the third circle
+    aspect_colors = {a["name"]: a["color"] for a in DEFAULT_CHART_ASPECTS_SETTINGS}
+    inner = RADIUS - THIRD_CIRCLE
+    for aspect in chart_data.aspects:
+        color = aspect_colors.get(aspect.aspect)
+        if color is None:
+            continue
+        first = -int(seventh) + int(aspect.p1_abs_pos)
+        second = -int(seventh) + int(aspect.p2_abs_pos)
+        wheel.add(_line(
+            sliceToX(0, inner, first) + THIRD_CIRCLE,
+            sliceToY(0, inner, first) + THIRD_CIRCLE,
+            sliceToX(0, inner, second) + THIRD_CIRCLE,
+            sliceToY(0, inner, second) + THIRD_CIRCLE,
+            palette(color), 0.9,
+        ))
+
+    drawing = Drawing(size, size)
+    # Paper background, like the rect apply_phoenix_perfection adds to SVGs
+    drawing.add(Rect(0, 0, size, size, fillColor=paper_1, strokeColor=None))
+    drawing.add(wheel)
+    return drawing
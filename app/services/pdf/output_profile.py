@@ -0,0 +1,201 @@
+# app/services/pdf/output_profile.py
+#
+# PDF output profiles: how much CPU a render spends on making the file small.
+#
+#   fast      page streams left uncompressed
+#   balanced  Flate page streams
+#   small     balanced + path coordinates rounded to 2 decimals and the logo
+#             embedded at 150 dpi
+#
+# Every profile draws repeated glyphs once, as form XObjects: besides the
+# smaller file that is less drawing and serializing work, so it pays off in
+# "fast" too (see benchmarks/bench_pdf_profiles.py). It relies on svg_skeleton: every <use> of a glyph with the
+# same inherited attributes gets the same converted Group object, so a Group
+# seen more than once in a drawing is drawn once into a form XObject and
+# invoked with `Do` at each use. Forms inherit the graphics state they are
+# invoked in, so the page looks the same.
+#
+# Fonts: the pages only use the standard 14 fonts (Helvetica, Times), which
+# PDF viewers provide and ReportLab never embeds, so there is nothing to
+# subset. TrueType fonts, if a theme ever registers one, are always subset by
+# ReportLab.
+
+from dataclasses import dataclass
+
+from reportlab import rl_config
+from reportlab.graphics import renderPDF
+from reportlab.graphics.renderbase import renderScaledDrawing
+from reportlab.graphics.shapes import Group, String
+from reportlab.pdfgen import canvas
+from reportlab.pdfgen.pathobject import PDFPathObject
+
+from app.core.config import settings
+
+# PDFs are sent as binary HTTP bodies; ASCII85 on top of Flate only makes
+# every compressed stream (logos included) 25% larger and costs an encode pass.
+# Process-wide: ReportLab reads rl_config.useA85 while drawing and saving
+# and has no per-document switch, so importing this module turns ASCII85 off
+# for every canvas in the process. All the app's PDFs are made by
+# new_canvas, which lives here.
+rl_config.useA85 = 0
+
+# Form BBox in the glyph's own coordinates; large enough never to clip
+_FORM_EXTENT = 1e5
+
+
+@dataclass(frozen=True)
+class PdfProfile:
+    name: str
+    # Flate-compress page and form streams
+    compress: bool
+    # Decimals kept in path coordinates (None: ReportLab's 6 significant digits)
+    precision: int | None
+    # Logo resolution (None: PHOENIX_LOGO_DPI)
+    logo_dpi: int | None = None
+
+
+PROFILES = {
+    "fast": PdfProfile("fast", compress=False, precision=None),
+    "balanced": PdfProfile("balanced", compress=True, precision=None),
+    "small": PdfProfile("small", compress=True, precision=2, logo_dpi=150),
+}
+
+
+def get_profile(name: str | None = None) -> PdfProfile:
+    """Profile by name; None selects PHOENIX_PDF_PROFILE."""
+    name = name or settings.pdf_profile
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown PDF profile {name!r} (choose from {', '.join(PROFILES)})") from None
+
+
+# ──────────────────────────────────────────────────────────────
+# Canvas
+# ──────────────────────────────────────────────────────────────
+
+
+class _RoundedPath(PDFPathObject):
+    """Path whose coordinates are written with a fixed number of decimals."""
+
+    def __init__(self, fmt: str):
+        super().__init__()
+        self._fmt = fmt
+
+    def _nums(self, *values: float) -> str:
+        fmt = self._fmt
+        out = []
+        for v in values:
+            s = fmt % v
+            if "." in s:
+                s = s.rstrip("0").rstrip(".")
+            out.append("0" if s == "-0" else s)
+        return " ".join(out)
+
+    def moveTo(self, x, y):
+        self._code_append(self._nums(x, y) + " m")
+
+    def lineTo(self, x, y):
+        self._code_append(self._nums(x, y) + " l")
+
+    def curveTo(self, x1, y1, x2, y2, x3, y3):
+        self._code_append(self._nums(x1, y1, x2, y2, x3, y3) + " c")
+
+    def rect(self, x, y, width, height):
+        self._code_append(self._nums(x, y, width, height) + " re")
+
+
+class ProfileCanvas(canvas.Canvas):
+    """Canvas configured by a PdfProfile."""
+
+    def __init__(self, filename, *, profile: PdfProfile, **kwargs):
+        super().__init__(filename, pageCompression=int(profile.compress), **kwargs)
+        self.profile = profile
+        self._path_fmt = f"%.{profile.precision}f" if profile.precision is not None else None
+
+    def beginPath(self):
+        if self._path_fmt is None:
+            return super().beginPath()
+        return _RoundedPath(self._path_fmt)
+
+
+def new_canvas(filename: str, pagesize, profile: PdfProfile | None = None) -> ProfileCanvas:
+    return ProfileCanvas(filename, pagesize=pagesize, profile=profile or get_profile())
+
+
+# ──────────────────────────────────────────────────────────────
+# Drawing
+# ──────────────────────────────────────────────────────────────
+
+
+def _shared_groups(drawing) -> set[int]:
+    """ids of text-free Groups that occur more than once in the tree."""
+    seen: set[int] = set()
+    shared: set[int] = set()
+    has_text: set[int] = set()
+
+    def walk(node) -> bool:
+        """True when `node` contains a String."""
+        key = id(node)
+        if key in seen:
+            shared.add(key)
+            return key in has_text
+        seen.add(key)
+        text = False
+        for child in node.contents:
+            if isinstance(child, Group):
+                text = walk(child) or text
+            elif isinstance(child, String):
+                text = True
+        if text:
+            has_text.add(key)
+        return text
+
+    walk(drawing)
+    return shared - has_text
+
+
+class _FormRenderer(renderPDF._PDFRenderer):
+    """renderPDF renderer that draws shared Groups once, as form XObjects."""
+
+    def __init__(self, shared: set[int]):
+        super().__init__()
+        self._shared = shared
+        self._forms: dict[tuple, str] = {}
+        self._in_form = False
+
+    def drawNode(self, node):
+        if self._in_form or id(node) not in self._shared:
+            return super().drawNode(node)
+
+        state = self._tracker.getState()
+        # Every shape sets its own colors and widths, so a text-free Group
+        # draws the same operators wherever it is used; only the canvas's
+        # alpha bookkeeping depends on the inherited state.
+        key = (id(node), state.get("fillOpacity"), state.get("strokeOpacity"))
+        name = self._forms.get(key)
+        c = self._canvas
+        if name is None:
+            name = self._forms[key] = f"glyph{id(self):x}_{len(self._forms)}"
+            c.beginForm(name, -_FORM_EXTENT, -_FORM_EXTENT, _FORM_EXTENT, _FORM_EXTENT)
+            # beginForm resets the canvas's alpha bookkeeping to 1; resync it
+            # with what the form will inherit so no change is skipped
+            for attr, setter in (("fillOpacity", c.setFillAlpha), ("strokeOpacity", c.setStrokeAlpha)):
+                if state.get(attr) not in (None, 1):
+                    setter(state[attr])
+            self._in_form = True
+            try:
+                super().drawNode(node)
+            finally:
+                self._in_form = False
+            c.endForm()
+        c.doForm(name)
+
+
+def draw_drawing(drawing, c: canvas.Canvas, x: float, y: float) -> None:
+    """renderPDF.draw with shared glyphs as forms on a ProfileCanvas."""
+    if getattr(c, "profile", None) is None:
+        renderPDF.draw(drawing, c, x, y)
+        return
+    drawing = renderScaledDrawing(drawing)
+    _FormRenderer(_shared_groups(drawing)).draw(drawing, c, x, y)
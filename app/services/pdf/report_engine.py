@@ -0,0 +1,317 @@
+# app/services/pdf/report_engine.py
+#
+# Shared layout engine for the portrait report pages of every chart PDF.
+#
+# A report is a declarative list of sections (Heading, Text, Fields, Table)
+# built from the chart data by app/services/pdf/reports.py. The engine turns
+# them into flowables and lays them out frame by frame on the canvas the
+# wheel page was drawn on, so the whole PDF stays one document.
+#
+# Tables are the bulk of a report (positions, houses, aspects: hundreds of
+# rows for dual charts) and every cell is a single line, so they don't go
+# through platypus.Table, which measures every cell and re-lays out the
+# remainder on each split. _RowTable has a fixed row height, splits by
+# slicing its rows, and draws each column as a run inside one text object,
+# setting each font once per column instead of once per cell. Styles and
+# fonts are module-level and shared by every report; only the standard
+# Helvetica faces are used, so nothing is embedded.
+
+from dataclasses import dataclass, field
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import mm
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+from reportlab.platypus import Flowable, Frame, Paragraph
+from reportlab.platypus.doctemplate import LayoutError
+
+PAGE_WIDTH, PAGE_HEIGHT = A4
+MARGIN = 20 * mm
+RUNNING_HEADER_HEIGHT = 10 * mm
+FOOTER_HEIGHT = 8 * mm
+
+FONT = "Helvetica"
+FONT_BOLD = "Helvetica-Bold"
+TABLE_FONT_SIZE = 9
+TABLE_LEADING = 12
+# Rows a table must bring onto a page together with its header
+MIN_TABLE_ROWS = 3
+
+MUTED = colors.HexColor("#6b7280")
+RULE = colors.HexColor("#9ca3af")
+STRIPE = colors.HexColor("#f3f4f6")
+
+TITLE_STYLE = ParagraphStyle("report-title", fontName=FONT_BOLD, fontSize=18, leading=22, spaceAfter=8)
+HEADING_STYLES = {
+    1: ParagraphStyle("report-h1", fontName=FONT_BOLD, fontSize=13, leading=16, spaceBefore=12, spaceAfter=4),
+    2: ParagraphStyle("report-h2", fontName=FONT_BOLD, fontSize=11, leading=14, spaceBefore=8, spaceAfter=3),
+}
+BODY_STYLE = ParagraphStyle("report-body", fontName=FONT, fontSize=10, leading=13, spaceAfter=4)
+
+
+# ──────────────────────────────────────────────────────────────
+# Sections
+# ──────────────────────────────────────────────────────────────
+
+
+@dataclass
+class Heading:
+    text: str
+    level: int = 1
+
+
+@dataclass
+class Text:
+    text: str
+
+
+@dataclass
+class Fields:
+    """Label / value rows, labels in bold."""
+
+    rows: list[tuple[str, str]]
+
+
+@dataclass
+class Table:
+    """Single-line rows under a header; `widths` are fractions of the frame width."""
+
+    columns: tuple[str, ...]
+    rows: list[tuple[str, ...]]
+    widths: tuple[float, ...] | None = None
+    align_right: frozenset[int] = field(default_factory=frozenset)
+
+
+Section = Heading | Text | Fields | Table
+
+
+# ──────────────────────────────────────────────────────────────
+# Flowables
+# ──────────────────────────────────────────────────────────────
+
+
+def _fit(text: str, font: str, width: float) -> tuple[str, float]:
+    """Clip `text` with an ellipsis to `width` points; returns it with its width."""
+    text_width = stringWidth(text, font, TABLE_FONT_SIZE)
+    if text_width <= width:
+        return text, text_width
+    while text:
+        text = text[:-1]
+        text_width = stringWidth(text + "…", font, TABLE_FONT_SIZE)
+        if text_width <= width:
+            break
+    return text + "…", text_width
+
+
+class _RowTable(Flowable):
+    """Fixed-height single-line rows; optional bold header repeated on every split."""
+
+    def __init__(
+        self,
+        rows: list[tuple[str, ...]],
+        widths: tuple[float, ...],
+        *,
+        columns: tuple[str, ...] | None = None,
+        label_column: bool = False,
+        align_right: frozenset[int] = frozenset(),
+        stripes: bool = True,
+    ):
+        super().__init__()
+        self.rows = rows
+        self.fractions = widths
+        self.columns = columns
+        self.label_column = label_column
+        self.align_right = align_right
+        self.stripes = stripes
+        self.spaceAfter = 6
+
+    def _header_height(self) -> float:
+        return TABLE_LEADING + 3 if self.columns else 0
+
+    def min_height(self) -> float:
+        return self._header_height() + TABLE_LEADING * min(len(self.rows), MIN_TABLE_ROWS)
+
+    def wrap(self, availWidth, availHeight):
+        self.width = availWidth
+        self.height = self._header_height() + TABLE_LEADING * len(self.rows)
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        fit = int((availHeight - self._header_height()) // TABLE_LEADING)
+        if fit < MIN_TABLE_ROWS or fit >= len(self.rows):
+            return []
+        if len(self.rows) - fit < MIN_TABLE_ROWS:
+            fit = len(self.rows) - MIN_TABLE_ROWS
+        return [self._copy(self.rows[:fit]), self._copy(self.rows[fit:])]
+
+    def _copy(self, rows):
+        return _RowTable(
+            rows,
+            self.fractions,
+            columns=self.columns,
+            label_column=self.label_column,
+            align_right=self.align_right,
+            stripes=self.stripes,
+        )
+
+    def draw(self):
+        c = self.canv
+        widths = [f * self.width for f in self.fractions]
+        lefts = [sum(widths[:i]) for i in range(len(widths))]
+        top = self.height
+        # Baseline offset inside a row
+        descent = TABLE_LEADING - TABLE_FONT_SIZE
+
+        if self.columns:
+            c.setStrokeColor(RULE)
+            c.setLineWidth(0.5)
+            c.line(0, top - TABLE_LEADING - 1.5, self.width, top - TABLE_LEADING - 1.5)
+        body_top = top - self._header_height()
+
+        if self.stripes:
+            c.setFillColor(STRIPE)
+            for i in range(1, len(self.rows), 2):
+                c.rect(0, body_top - (i + 1) * TABLE_LEADING, self.width, TABLE_LEADING, stroke=0, fill=1)
+        c.setFillColor(colors.black)
+
+        # Cells are placed with relative Td moves from the previous cell
+        # (two operands) rather than a Tm text matrix per cell (six).
+        text = c.beginText()
+        cursor = [0.0, 0.0]
+        for col, (left, width) in enumerate(zip(lefts, widths)):
+            pad_width = width - 4
+            if self.columns:
+                text.setFont(FONT_BOLD, TABLE_FONT_SIZE)
+                self._cell(text, cursor, self.columns[col], FONT_BOLD, left, pad_width, top - TABLE_LEADING + descent, col)
+            font = FONT_BOLD if self.label_column and col == 0 else FONT
+            text.setFont(font, TABLE_FONT_SIZE)
+            y = body_top - TABLE_LEADING + descent
+            for row in self.rows:
+                self._cell(text, cursor, row[col], font, left, pad_width, y, col)
+                y -= TABLE_LEADING
+        c.drawText(text)
+
+    def _cell(self, text, cursor: list[float], value: str, font: str, left: float, width: float, y: float, col: int) -> None:
+        if not value:
+            return
+        value, value_width = _fit(value, font, width)
+        x = left + 2
+        if col in self.align_right:
+            x += width - value_width
+        text.moveCursor(x - cursor[0], cursor[1] - y)
+        cursor[0], cursor[1] = x, y
+        text.textOut(value)
+
+
+def _flowables(title: str, sections: list[Section]) -> list[Flowable]:
+    # Section text is plain text, not Paragraph markup
+    story: list[Flowable] = [Paragraph(escape(title), TITLE_STYLE)]
+    for section in sections:
+        if isinstance(section, Heading):
+            flowable = Paragraph(escape(section.text), HEADING_STYLES.get(section.level, HEADING_STYLES[2]))
+            flowable.keepWithNext = True
+        elif isinstance(section, Text):
+            flowable = Paragraph(escape(section.text), BODY_STYLE)
+        elif isinstance(section, Fields):
+            if not section.rows:
+                continue
+            flowable = _RowTable(section.rows, (0.3, 0.7), label_column=True, stripes=False)
+        elif isinstance(section, Table):
+            if not section.rows:
+                continue
+            n = len(section.columns)
+            flowable = _RowTable(
+                section.rows,
+                section.widths or (1.0 / n,) * n,
+                columns=section.columns,
+                align_right=section.align_right,
+            )
+        else:
+            raise TypeError(f"Unknown report section {section!r}")
+        story.append(flowable)
+    return story
+
+
+# ──────────────────────────────────────────────────────────────
+# Layout
+# ──────────────────────────────────────────────────────────────
+
+
+def _min_height(flowable: Flowable, width: float, height: float) -> float:
+    if isinstance(flowable, _RowTable):
+        return flowable.min_height()
+    return flowable.wrap(width, height)[1]
+
+
+def _fill_frame(frame: Frame, c: canvas.Canvas, story: list[Flowable]) -> None:
+    """Add flowables from the front of `story` until the frame is full, splitting as needed."""
+    while story:
+        head = story[0]
+        remaining = frame._y - frame._y1p
+        if getattr(head, "keepWithNext", False) and len(story) > 1 and not frame._atTop:
+            # A heading must not end a page: it needs room for the start of the next section
+            need = head.wrap(frame._aW, remaining)[1] + head.getSpaceBefore()
+            need += _min_height(story[1], frame._aW, remaining)
+            if need > remaining:
+                return
+        if frame.add(head, c, trySplit=1):
+            del story[0]
+            continue
+        parts = frame.split(head, c)
+        if not parts:
+            if frame._atTop:
+                raise LayoutError(f"{head.__class__.__name__} does not fit on an empty report page")
+            return
+        story[0:1] = parts
+        if not frame.add(story[0], c, trySplit=1):
+            return
+        del story[0]
+
+
+def draw_report(c: canvas.Canvas, sections: list[Section], *, title: str, running_header: str = "") -> int:
+    """
+    Lay out `sections` under `title` on portrait A4 pages, starting on the
+    canvas's current page (already set to A4). Continuation pages get
+    `running_header`; every page gets a page number. The last page is left
+    open for the caller's showPage(). Returns the number of pages drawn.
+
+    Page numbers count from the start of the document (the wheel page is 1).
+    """
+    story = _flowables(title, sections)
+    frame_width = PAGE_WIDTH - 2 * MARGIN
+
+    pages = 0
+    while story:
+        if pages:
+            c.showPage()
+            c.setPageSize(A4)
+        pages += 1
+        top = PAGE_HEIGHT - MARGIN
+        if pages > 1 and running_header:
+            c.setFont(FONT, 8)
+            c.setFillColor(MUTED)
+            c.drawString(MARGIN, top - 8, running_header)
+            c.setFillColor(colors.black)
+            top -= RUNNING_HEADER_HEIGHT
+        c.setFont(FONT, 8)
+        c.setFillColor(MUTED)
+        c.drawRightString(PAGE_WIDTH - MARGIN, MARGIN - 4, f"Page {c.getPageNumber()}")
+        c.setFillColor(colors.black)
+
+        bottom = MARGIN + FOOTER_HEIGHT
+        frame = Frame(
+            MARGIN,
+            bottom,
+            frame_width,
+            top - bottom,
+            leftPadding=0,
+            rightPadding=0,
+            topPadding=0,
+            bottomPadding=0,
+            showBoundary=0,
+        )
+        _fill_frame(frame, c, story)
+    return pages
@@ -0,0 +1,313 @@
+# app/services/pdf/reports.py
+#
+# Report bodies (page 2+) of the natal, synastry, transit and composite
+# PDFs, declared as section lists for report_engine.draw_report.
+#
+# `data` is the chart's ChartDataModel dump (see chart_generator): single
+# charts carry one `subject`, dual charts `first_subject` / `second_subject`
+# plus the cross aspects and house overlays.
+
+from typing import Any, Callable, Dict
+
+from reportlab.pdfgen import canvas
+
+from app.services.pdf.report_engine import Fields, Heading, Section, Table, Text, draw_report
+
+SIGN_NAMES = {
+    "Ari": "Aries",
+    "Tau": "Taurus",
+    "Gem": "Gemini",
+    "Can": "Cancer",
+    "Leo": "Leo",
+    "Vir": "Virgo",
+    "Lib": "Libra",
+    "Sco": "Scorpio",
+    "Sag": "Sagittarius",
+    "Cap": "Capricorn",
+    "Aqu": "Aquarius",
+    "Pis": "Pisces",
+}
+
+HOUSE_KEYS = (
+    "first_house",
+    "second_house",
+    "third_house",
+    "fourth_house",
+    "fifth_house",
+    "sixth_house",
+    "seventh_house",
+    "eighth_house",
+    "ninth_house",
+    "tenth_house",
+    "eleventh_house",
+    "twelfth_house",
+)
+HOUSE_NUMBERS = {key.title(): n for n, key in enumerate(HOUSE_KEYS, start=1)}
+
+POSITION_COLUMNS = ("Point", "Sign", "Position", "House", "Motion")
+POSITION_WIDTHS = (0.32, 0.2, 0.16, 0.12, 0.2)
+ASPECT_WIDTHS = (0.3, 0.18, 0.3, 0.1, 0.12)
+
+
+def _dms(degrees: float | None) -> str:
+    """14.3281 -> 14°19'"""
+    if degrees is None:
+        return ""
+    d = int(degrees)
+    m = round((degrees - d) * 60)
+    if m == 60:
+        d, m = d + 1, 0
+    return f"{d}°{m:02d}'"
+
+
+def _label(name: str | None) -> str:
+    return (name or "").replace("_", " ")
+
+
+def _sign(abbr: str | None) -> str:
+    return SIGN_NAMES.get(abbr or "", abbr or "")
+
+
+def _points(subject: dict) -> list[dict]:
+    """The subject's active points (planets, nodes, angles) in Kerykeion's order."""
+    points = []
+    for name in subject.get("active_points") or []:
+        point = subject.get(name.lower())
+        if point:
+            points.append(point)
+    return points
+
+
+def _birth_fields(subject: dict) -> Fields:
+    local = subject.get("iso_formatted_local_datetime") or ""
+    when = local[:16].replace("T", " ")
+    if subject.get("day_of_week"):
+        when += f" ({subject['day_of_week']})"
+    lat, lng = subject.get("lat"), subject.get("lng")
+    coords = (
+        f"{abs(lat):.4f}° {'N' if lat >= 0 else 'S'}, {abs(lng):.4f}° {'E' if lng >= 0 else 'W'}"
+        if lat is not None and lng is not None
+        else ""
+    )
+    system = " / ".join(
+        p for p in (subject.get("zodiac_type"), subject.get("houses_system_name")) if p
+    )
+    rows = [
+        ("Name", subject.get("name") or ""),
+        ("Date & time", when),
+        ("Location", ", ".join(p for p in (subject.get("city"), subject.get("nation")) if p)),
+        ("Coordinates", coords),
+        ("Time zone", subject.get("tz_str") or ""),
+        ("Zodiac / houses", system),
+    ]
+    return Fields([(label, value) for label, value in rows if value])
+
+
+def _positions_table(subject: dict) -> Table:
+    rows = []
+    for p in _points(subject):
+        motion = ""
+        if p.get("retrograde"):
+            motion = "Retrograde"
+        elif p.get("speed") is not None:
+            motion = "Direct"
+        rows.append(
+            (
+                _label(p.get("name")),
+                _sign(p.get("sign")),
+                _dms(p.get("position")),
+                str(HOUSE_NUMBERS.get(p.get("house"), "")),
+                motion,
+            )
+        )
+    return Table(POSITION_COLUMNS, rows, POSITION_WIDTHS, align_right=frozenset({2}))
+
+
+def _houses_table(subject: dict) -> Table:
+    rows = [
+        (str(n), _sign(h.get("sign")), _dms(h.get("position")))
+        for n, h in enumerate((subject.get(k) for k in HOUSE_KEYS), start=1)
+        if h
+    ]
+    return Table(("House", "Sign", "Cusp"), rows, (0.2, 0.3, 0.2), align_right=frozenset({2}))
+
+
+def _aspects_table(aspects: list[dict], *, owners: bool = False) -> Table:
+    def point(a: dict, side: str) -> str:
+        name = _label(a.get(f"{side}_name"))
+        return f"{name} ({a[f'{side}_owner']})" if owners and a.get(f"{side}_owner") else name
+
+    rows = [
+        (
+            point(a, "p1"),
+            (a.get("aspect") or "").capitalize(),
+            point(a, "p2"),
+            _dms(a.get("orbit")),
+            a.get("aspect_movement") or "",
+        )
+        for a in aspects
+    ]
+    return Table(("Point", "Aspect", "Point", "Orb", "Movement"), rows, ASPECT_WIDTHS, align_right=frozenset({3}))
+
+
+def _distribution_fields(data: dict) -> Fields:
+    elements = data.get("element_distribution") or {}
+    qualities = data.get("quality_distribution") or {}
+    rows = []
+    if elements:
+        rows.append(
+            ("Elements", " · ".join(f"{e.title()} {elements.get(f'{e}_percentage', 0)}%" for e in ("fire", "earth", "air", "water")))
+        )
+    if qualities:
+        rows.append(
+            ("Qualities", " · ".join(f"{q.title()} {qualities.get(f'{q}_percentage', 0)}%" for q in ("cardinal", "fixed", "mutable")))
+        )
+    return Fields(rows)
+
+
+def _lunar_phase(subject: dict) -> list[Section]:
+    phase = subject.get("lunar_phase") or {}
+    if not phase.get("moon_phase_name"):
+        return []
+    return [Text(f"Lunar phase: {phase['moon_phase_name']} (day {phase.get('moon_phase', '?')} of 28).")]
+
+
+def _overlay_table(points: list[dict], house_owner: str) -> Table:
+    rows = [
+        (
+            _label(p.get("point_name")),
+            _sign(p.get("point_sign")),
+            _dms(p.get("point_degree")),
+            str(p.get("point_owner_house_number") or ""),
+            str(p.get("projected_house_number") or ""),
+        )
+        for p in points
+    ]
+    return Table(
+        ("Point", "Sign", "Position", "Own house", f"In {house_owner}'s house"),
+        rows,
+        (0.3, 0.18, 0.14, 0.14, 0.24),
+        align_right=frozenset({2}),
+    )
+
+
+# ──────────────────────────────────────────────────────────────
+# Section lists per chart type
+# ──────────────────────────────────────────────────────────────
+
+
+def natal_sections(data: Dict[str, Any]) -> list[Section]:
+    subject = data.get("subject") or {}
+    return [
+        Heading("Birth Data"),
+        _birth_fields(subject),
+        *_lunar_phase(subject),
+        Heading("Planet Positions"),
+        _positions_table(subject),
+        Heading("House Cusps"),
+        _houses_table(subject),
+        Heading("Elements & Qualities"),
+        _distribution_fields(data),
+        Heading("Aspects"),
+        _aspects_table(data.get("aspects") or []),
+    ]
+
+
+def composite_sections(data: Dict[str, Any]) -> list[Section]:
+    subject = data.get("subject") or {}
+    return [
+        Text("Midpoint composite of both charts: every point sits halfway between the two partners' positions."),
+        Heading("Composite Positions"),
+        _positions_table(subject),
+        Heading("Composite House Cusps"),
+        _houses_table(subject),
+        Heading("Elements & Qualities"),
+        _distribution_fields(data),
+        Heading("Composite Aspects"),
+        _aspects_table(data.get("aspects") or []),
+    ]
+
+
+def _dual_sections(data: Dict[str, Any], first_label: str, second_label: str, aspects_heading: str) -> list[Section]:
+    first = data.get("first_subject") or {}
+    second = data.get("second_subject") or {}
+    first_name = first.get("name") or first_label
+    second_name = second.get("name") or second_label
+    overlays = data.get("house_comparison") or {}
+    return [
+        Heading(f"{first_label}: {first_name}"),
+        _birth_fields(first),
+        Heading(f"{second_label}: {second_name}"),
+        _birth_fields(second),
+        Heading(aspects_heading),
+        _aspects_table(data.get("aspects") or [], owners=True),
+        Heading(f"{first_name}: Positions", 2),
+        _positions_table(first),
+        Heading(f"{second_name}: Positions", 2),
+        _positions_table(second),
+        Heading("House Overlays"),
+        Heading(f"{second_name}'s points in {first_name}'s houses", 2),
+        _overlay_table(overlays.get("second_points_in_first_houses") or [], first_name),
+        Heading(f"{first_name}'s points in {second_name}'s houses", 2),
+        _overlay_table(overlays.get("first_points_in_second_houses") or [], second_name),
+    ]
+
+
+def synastry_sections(data: Dict[str, Any]) -> list[Section]:
+    sections = _dual_sections(data, "First", "Second", "Synastry Aspects")
+    score = data.get("relationship_score") or {}
+    if score.get("score_value") is not None:
+        rows = [("Score", f"{score['score_value']} ({score.get('score_description') or ''})".strip())]
+        if score.get("is_destiny_sign"):
+            rows.append(("Destiny sign", "Yes"))
+        sections[4:4] = [Heading("Relationship Score"), Fields(rows)]
+    return sections
+
+
+def transit_sections(data: Dict[str, Any]) -> list[Section]:
+    return _dual_sections(data, "Natal", "Transit", "Transits to Natal")
+
+
+# ──────────────────────────────────────────────────────────────
+# Report bodies
+# ──────────────────────────────────────────────────────────────
+
+
+def _title_name(subject: dict, req_subject: Any, fallback: str) -> str:
+    return subject.get("name") or getattr(req_subject, "name", None) or fallback
+
+
+def draw_natal_report_body(c: canvas.Canvas, data: Dict[str, Any], req) -> int:
+    name = _title_name(data.get("subject") or {}, req, "Natal Chart")
+    return draw_report(c, natal_sections(data), title=f"Natal Chart for {name}", running_header=f"Natal Chart Report · {name}")
+
+
+def draw_synastry_report_body(c: canvas.Canvas, data: Dict[str, Any], req) -> int:
+    first = _title_name(data.get("first_subject") or {}, getattr(req, "first", None), "First")
+    second = _title_name(data.get("second_subject") or {}, getattr(req, "second", None), "Second")
+    title = f"Synastry: {first} & {second}"
+    return draw_report(c, synastry_sections(data), title=title, running_header=f"Synastry Report · {first} & {second}")
+
+
+def draw_transit_report_body(c: canvas.Canvas, data: Dict[str, Any], req) -> int:
+    natal = _title_name(data.get("first_subject") or {}, getattr(req, "natal", None), "Natal")
+    transit = data.get("second_subject") or {}
+    when = (transit.get("iso_formatted_local_datetime") or "")[:16].replace("T", " ")
+    title = f"Transits for {natal}" + (f" on {when}" if when else "")
+    return draw_report(c, transit_sections(data), title=title, running_header=f"Transit Report · {natal}")
+
+
+def draw_composite_report_body(c: canvas.Canvas, data: Dict[str, Any], req) -> int:
+    first = getattr(getattr(req, "first", None), "name", None) or "First"
+    second = getattr(getattr(req, "second", None), "name", None) or "Second"
+    title = f"Composite Chart: {first} & {second}"
+    return draw_report(c, composite_sections(data), title=title, running_header=f"Composite Report · {first} & {second}")
+
+
+# Report body (page 2+) per chart type
+REPORT_BODIES: dict[str, Callable[[canvas.Canvas, Dict[str, Any], Any], int]] = {
+    "natal": draw_natal_report_body,
+    "synastry": draw_synastry_report_body,
+    "transit": draw_transit_report_body,
+    "composite": draw_composite_report_body,
+}
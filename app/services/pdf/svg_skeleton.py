@@ -0,0 +1,182 @@
+# app/services/pdf/svg_skeleton.py
+#
+# svg2rlg with a cache for the static skeleton of Kerykeion charts.
+#
+# Much of every chart SVG does not depend on the subject: the glyph
+# <symbol>s in <defs> (one planet / sign glyph is converted again for each
+# of its ~180 <use>s per chart) and the fixed rings. Plain svg2rlg converts
+# all of it on every call. SkeletonRenderer converts those parts once and
+# reuses the ReportLab nodes; only the dynamic groups (planets, cusps,
+# aspects, grids) are converted per request.
+#
+# Entries are content-addressed: the key hashes the element's XML, the
+# document's <style> rules, and the inherited presentation attributes at
+# the point of use. A theme or chart-type change therefore produces new
+# entries and never a stale drawing. Cached nodes are shared between
+# drawings and must not be mutated (renderPDF only reads them).
+
+import hashlib
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+from lxml import etree
+from reportlab.graphics.shapes import Drawing, Group
+from svglib.svglib import SvgRenderer, load_svg_file
+
+from app.core.config import settings
+from app.core.metrics import SKELETON_LOOKUPS, incr
+
+XLINK_HREF = "{http://www.w3.org/1999/xlink}href"
+KR_NODE = "{https://www.kerykeion.net/}node"
+
+# kr:node groups whose content depends only on theme and chart type
+STATIC_NODES = frozenset({
+    "Background_Circle",
+    "First_Circle",
+    "Second_Circle",
+    "Third_Circle",
+})
+
+# Attributes svglib resolves through ancestors; part of every cache key
+INHERITED_ATTRS = (
+    "fill",
+    "fill-opacity",
+    "stroke",
+    "stroke-width",
+    "stroke-opacity",
+    "font-family",
+    "font-size",
+)
+
+class _SkeletonCache:
+    """Bounded LRU of converted ReportLab nodes by content key."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, Group] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Group | None:
+        with self._lock:
+            node = self._entries.get(key)
+            if node is not None:
+                self._entries.move_to_end(key)
+            return node
+
+    def put(self, key: tuple, node: Group) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = node
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_cache = _SkeletonCache(settings.svg_skeleton_cache_size)
+
+
+def _digest(element) -> bytes:
+    return hashlib.blake2b(etree.tostring(element), digest_size=16).digest()
+
+
+class SkeletonRenderer(SvgRenderer):
+    """SvgRenderer that reuses converted glyphs and static groups."""
+
+    def __init__(self, path, style_digest: bytes, **kwargs):
+        super().__init__(path, **kwargs)
+        self.style_digest = style_digest
+        self.target_digests: dict[str, bytes] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, element_digest: bytes, context) -> tuple:
+        find = self.attrConverter.findAttr
+        box = self.attrConverter.main_box
+        return (
+            self.style_digest,
+            element_digest,
+            tuple(box) if box is not None else None,
+            tuple(find(context, name) for name in INHERITED_ATTRS),
+        )
+
+    def _lookup(self, key: tuple) -> Group | None:
+        node = _cache.get(key)
+        if node is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return node
+
+    def renderSymbol(self, node):
+        # svglib converts every symbol once in the <defs> pass and throws the
+        # result away; the real conversion happens per <use> (cached below).
+        if not node.attrib.get("_rendered"):
+            return Group()
+        return super().renderSymbol(node)
+
+    def renderUse(self, node, group=None, clipping=None):
+        href = node.attrib.get(XLINK_HREF) or node.attrib.get("href") or ""
+        target = self.definitions.get(href[1:]) if href.startswith("#") else None
+        if target is None or len(node.getchildren()):
+            return super().renderUse(node, group=group, clipping=clipping)
+
+        fragment = href[1:]
+        digest = self.target_digests.get(fragment)
+        if digest is None:
+            digest = self.target_digests[fragment] = _digest(target.etree_element)
+        key = self._key(digest, node)
+
+        cached = self._lookup(key)
+        if cached is None:
+            group = super().renderUse(node, group=group, clipping=clipping)
+            if group is not None and group.contents:
+                _cache.put(key, group.contents[-1])
+            return group
+
+        if group is None:
+            group = Group()
+        if clipping:
+            group.add(clipping)
+        group.add(cached)
+        self.apply_node_attr_to_group(node, group)
+        return group
+
+    def renderG(self, node, clipping=None):
+        if clipping is not None or node.attrib.get(KR_NODE) not in STATIC_NODES:
+            return super().renderG(node, clipping=clipping)
+
+        key = self._key(_digest(node.etree_element), node.parent)
+        cached = self._lookup(key)
+        if cached is None:
+            cached = super().renderG(node)
+            _cache.put(key, cached)
+        return cached
+
+
+def svg_to_drawing(svg: str) -> Drawing | None:
+    """svg2rlg for an SVG string, reusing cached skeleton nodes."""
+    svg_root = load_svg_file(BytesIO(svg.encode("utf-8")))
+    if svg_root is None:
+        return None
+
+    styles = b"".join(etree.tostring(el) for el in svg_root.iter("{*}style"))
+    renderer = SkeletonRenderer(None, hashlib.blake2b(styles, digest_size=16).digest())
+    drawing = renderer.render(svg_root)
+    if renderer.hits:
+        incr(SKELETON_LOOKUPS, "hit", renderer.hits)
+    if renderer.misses:
+        incr(SKELETON_LOOKUPS, "miss", renderer.misses)
+    return drawing
+
+
+def skeleton_cache_clear() -> None:
+    _cache.clear()
@@ -4,13 +4,14 @@
 # landscape A4 wheel on a ReportLab canvas, using pure SVG→PDF
 # via svglib and your CSS var → hex color map.
 
-from io import BytesIO
 import re
 
-from reportlab.graphics import renderPDF
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4, landscape
-from svglib.svglib import svg2rlg
+
+from app.core.metrics import span
+from app.services.pdf.output_profile import draw_drawing
+from app.services.pdf.svg_skeleton import svg_to_drawing
 
 # ---- COLOR MAP: copied from test_wheel_perfection.py ----
 COLOR_MAP = {
@@ -142,7 +143,8 @@ def draw_wheel_page(c: canvas.Canvas, svg_string: str) -> None:
     svg_resolved = resolve_css_vars(svg_string)
 
     # Convert SVG → ReportLab Drawing
-    drawing = svg2rlg(BytesIO(svg_resolved.encode("utf-8")))
+    with span("svg_parse"):
+        drawing = svg_to_drawing(svg_resolved)
     if drawing is None:
         raise ValueError("svglib failed to parse wheel SVG")
 
@@ -164,4 +166,5 @@ def draw_wheel_page(c: canvas.Canvas, svg_string: str) -> None:
     x = (page_width - scaled_width) / 2.0
     y = (page_height - scaled_height) / 2.0
 
-    renderPDF.draw(drawing, c, x, y)
\ No newline at end of file
+    with span("pdf_draw"):
+        draw_drawing(drawing, c, x, y)
\ No newline at end of file
@@ -1,7 +1,10 @@
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 
+from app.core.metrics import span
+
 logger = logging.getLogger("phoenix_charts.wheel")
 
 # Matches: var(--kerykeion-foo-bar)
@@ -88,13 +91,130 @@ def _load_theme_vars(theme: str) -> dict[str, str]:
     return resolved
 
 
-# Load all themes once at import
-THEME_VARS: dict[str, dict[str, str]] = {
-    theme: _load_theme_vars(theme) for theme in THEME_FILES.keys()
+@lru_cache(maxsize=None)
+def theme_vars(theme: str) -> dict[str, str]:
+    """The --kerykeion-* variables of a (normalized) theme, read on first use."""
+    return _load_theme_vars(theme)
+
+
+# Explicit fallbacks for common base vars that might not be defined in the
+# theme CSS (e.g. --kerykeion-color-neutral-content).
+FALLBACK_ALIASES: dict[str, str] = {
+    # If neutral-content isn't defined, fall back to paper-0, then paper-1.
+    "--kerykeion-color-neutral-content": "--kerykeion-chart-color-paper-0",
+    # You can add more aliases here if upstream adds new base vars.
 }
 
+SVG_OPEN_TAG_PATTERN = re.compile(r"<svg[^>]*>", re.IGNORECASE)
+
+PAPER_BG_MARKER = 'data-phoenix-paper-bg="1"'
+
+VAR_PREFIX = "--kerykeion-"
+
+
+class RecolorPlan:
+    """
+    Precompiled recoloring for a single theme.
+
+    One combined regex matches, left to right:
+      - `def`:   a --kerykeion-* definition for a var the theme defines
+      - `label`: a sign-name / planet-name <text> element
+      - `var`:   a var(--kerykeion-...) usage
+    so the whole SVG is rewritten in a single linear pass.
+    """
+
+    def __init__(self, theme: str, theme_colors: dict[str, str]):
+        self.theme = theme
+        self.theme_colors = theme_colors
+
+        # var(...) name -> inlined value. Names missing here are unknown vars
+        # and are left as-is so it's obvious something's missing.
+        self.var_values: dict[str, str] = {}
+
+        # As a last resort, hard-code a reasonable neutral gray just so that
+        # svglib doesn't see a raw "var(...)" and scream.
+        self.var_values["--kerykeion-color-neutral-content"] = "#9ca3af"
+
+        # If we have an alias (e.g. neutral-content -> paper-0), try that.
+        for name, alias in FALLBACK_ALIASES.items():
+            if alias in theme_colors:
+                self.var_values[name] = theme_colors[alias]
+
+        # If the theme defines this var, use it.
+        self.var_values.update(theme_colors)
+
+        # Definitions are rewritten to "name: color;" with any var(...) in the
+        # color already inlined, exactly as the old def-then-inline passes did.
+        # Keyed by the name without its "--kerykeion-" prefix (see below).
+        self.def_values: dict[str, str] = {
+            name[len(VAR_PREFIX):]: VAR_PATTERN.sub(
+                lambda m: self.var_values.get(m.group(1), m.group(0)),
+                f"{name}: {color};",
+            )
+            for name, color in theme_colors.items()
+        }
+
+        # Every alternative starts with a bare literal so the regex engine can
+        # skip ahead to candidate positions instead of trying each alternative
+        # at every offset of the SVG.
+        alternatives = [
+            # sign-name / planet-name text labels are stripped (keeps the
+            # wheel cleaner like the examples)
+            r'<text(?P<label>[^>]*class="(?:sign-name|planet-name)"[^>]*>.*?</text>)',
+            r"var\(\s*(?P<var>--kerykeion-[^)]+?)\s*\)",
+        ]
+        if self.def_values:
+            suffixes = "|".join(re.escape(n) for n in self.def_values)
+            alternatives.insert(0, rf"{VAR_PREFIX}(?P<def>{suffixes})\s*:[^;]+;")
+        self.pattern = re.compile("|".join(alternatives), re.DOTALL)
+
+        paper_hex = (
+            theme_colors.get("--kerykeion-chart-color-paper-1")
+            or theme_colors.get("--kerykeion-chart-color-paper-0")
+        )
+        self.paper_rect = (
+            f'<rect width="100%" height="100%" '
+            f'fill="{paper_hex.strip()}" {PAPER_BG_MARKER}/>'
+            if paper_hex
+            else None
+        )
+
+    def _replace(self, m: re.Match) -> str:
+        kind = m.lastgroup
+        if kind == "var":
+            return self.var_values.get(m.group("var"), m.group(0))
+        if kind == "def":
+            return self.def_values[m.group("def")]
+        return ""  # label
+
+    def resolve(self, value: str) -> str:
+        """Inline the var(--kerykeion-...) usages of a single style value."""
+        return VAR_PATTERN.sub(lambda m: self.var_values.get(m.group(1), m.group(0)), value)
+
+    def apply(self, svg: str) -> str:
+        svg = self.pattern.sub(self._replace, svg)
+
+        # Ensure the SVG has a "paper" background rect inside <svg>, but
+        # do NOT touch the PDF page background.
+        if self.paper_rect and PAPER_BG_MARKER not in svg:
+            m = SVG_OPEN_TAG_PATTERN.search(svg)
+            if m:
+                insert_pos = m.end()
+                svg = svg[:insert_pos] + self.paper_rect + svg[insert_pos:]
+        return svg
+
+
+@lru_cache(maxsize=None)
+def recolor_plan(theme: str) -> RecolorPlan:
+    """The precompiled RecolorPlan of a (normalized) theme, built on first use."""
+    return RecolorPlan(theme, theme_vars(theme))
+
+
+def load_themes() -> None:
+    """Read every theme CSS and build its plan now (warm-up hook)."""
+    for theme in THEME_FILES:
+        recolor_plan(theme)
 
-# … everything above stays exactly as you pasted …
 
 def apply_phoenix_perfection(svg: str, theme: str = "classic") -> str:
     """
@@ -105,6 +225,9 @@ def apply_phoenix_perfection(svg: str, theme: str = "classic") -> str:
     - Inlines var(--kerykeion-...) usages in attributes.
     - Strips sign-name / planet-name text labels (for a cleaner wheel).
     - Ensures a chart "paper" background rect exists using paper-1.
+
+    All of the above runs as a single pass of the theme's precompiled
+    RecolorPlan (see recolor_plan).
     """
     raw_theme = theme
     theme = _normalize_theme_name(theme)
@@ -114,85 +237,11 @@ def apply_phoenix_perfection(svg: str, theme: str = "classic") -> str:
         theme,
     )
 
-    theme_colors = THEME_VARS.get(theme, {})
-    if not theme_colors:
+    plan = recolor_plan(theme)
+    if not plan.theme_colors:
         logger.warning(
             "[phoenix_theme] No theme vars loaded for %s; using SVG as-is", theme
         )
 
-    # 1) Override CSS variable definitions in the SVG's <style> block
-    for var_name, color in theme_colors.items():
-        svg = re.sub(
-            rf"{re.escape(var_name)}\s*:[^;]+;",
-            f"{var_name}: {color};",
-            svg,
-        )
-
-    # 2) Strip text labels (optional – keeps your wheel cleaner like examples)
-    svg = re.sub(
-        r'<text[^>]*class="sign-name"[^>]*>.*?</text>',
-        "",
-        svg,
-        flags=re.DOTALL,
-    )
-    svg = re.sub(
-        r'<text[^>]*class="planet-name"[^>]*>.*?</text>',
-        "",
-        svg,
-        flags=re.DOTALL,
-    )
-
-    # 3) Inline any remaining var(--kerykeion-...) usages in attributes / styles
-    #    with some explicit fallbacks for common base vars that might not be
-    #    defined in the theme CSS (e.g. --kerykeion-color-neutral-content).
-    FALLBACK_ALIASES: dict[str, str] = {
-        # If neutral-content isn't defined, fall back to paper-0, then paper-1.
-        "--kerykeion-color-neutral-content": "--kerykeion-chart-color-paper-0",
-        # You can add more aliases here if upstream adds new base vars.
-    }
-
-    def _inline_var(m: re.Match) -> str:
-        name = m.group(1)
-
-        # If the theme defines this var, use it.
-        if name in theme_colors:
-            return theme_colors[name]
-
-        # If we have an alias (e.g. neutral-content -> paper-0), try that.
-        alias = FALLBACK_ALIASES.get(name)
-        if alias and alias in theme_colors:
-            return theme_colors[alias]
-
-        # As a last resort, hard-code a reasonable neutral gray just so that
-        # svglib doesn't see a raw "var(...)" and scream.
-        if name == "--kerykeion-color-neutral-content":
-            return "#9ca3af"  # tweak if you want a different neutral
-
-        # Unknown var: leave it as-is so it's obvious something's missing.
-        return m.group(0)
-
-    svg = VAR_PATTERN.sub(_inline_var, svg)
-
-    # 4) Ensure the SVG has a "paper" background rect inside <svg>, but
-    #    do NOT touch the PDF page background.
-    try:
-        paper_hex = (
-            theme_colors.get("--kerykeion-chart-color-paper-1")
-            or theme_colors.get("--kerykeion-chart-color-paper-0")
-        )
-
-        if paper_hex:
-            paper_hex = paper_hex.strip()
-            if 'data-phoenix-paper-bg="1"' not in svg:
-                m = re.search(r"<svg[^>]*>", svg, flags=re.IGNORECASE)
-                if m:
-                    insert_pos = m.end()
-                    bg_rect = (
-                        f'<rect width="100%" height="100%" '
-                        f'fill="{paper_hex}" data-phoenix-paper-bg="1"/>'
-                    )
-                    svg = svg[:insert_pos] + bg_rect + svg[insert_pos:]
-    except Exception as e:
-        logger.warning("[phoenix_theme] failed to inject paper background: %s", e)
-
-    return svg
\ No newline at end of file
+    with span("theme"):
+        return plan.apply(svg)
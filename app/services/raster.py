@@ -0,0 +1,265 @@
+# app/services/raster.py
+#
+# Raster images of themed chart SVGs, as a pyramid of sizes from one render.
+#
+# The largest requested size is rendered once and every smaller size is a
+# Lanczos downscale of it, so a 256/512/1024 pyramid costs one rasterization
+# plus two cheap resizes. Sizes are the longest side in pixels; the chart's
+# aspect ratio is kept.
+#
+# Backends:
+#   cairo   cairosvg, when it is installed and libcairo loads
+#   pillow  fallback: the SVG goes through svglib (with the skeleton cache)
+#           to a ReportLab Drawing, which a small Pillow walker paints at 2x
+#           (curves flattened to polygons, even-odd fills), then downscales
+#
+# The Pillow backend covers what Kerykeion charts use (rects, circles,
+# lines, paths, single-line text) and ignores clip paths and images.
+
+import math
+from io import BytesIO
+
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+from reportlab.graphics import shapes
+
+from app.core.config import settings
+from app.core.metrics import span
+from app.services.pdf.svg_skeleton import svg_to_drawing
+
+try:
+    import cairosvg
+except (ImportError, OSError):
+    # OSError: cairosvg installed but libcairo missing
+    cairosvg = None
+
+BACKEND = "cairo" if cairosvg is not None else "pillow"
+
+IMAGE_FORMATS = ("png", "webp")
+
+SUPERSAMPLE = 2
+CURVE_STEPS = 8
+FONT_PATHS = (
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+)
+
+
+# ──────────────────────────────────────────────────────────────
+# Pillow backend
+# ──────────────────────────────────────────────────────────────
+
+
+def _apply(m, x, y):
+    return m[0] * x + m[2] * y + m[4], m[1] * x + m[3] * y + m[5]
+
+
+def _scale(m) -> float:
+    return math.sqrt(abs(m[0] * m[3] - m[1] * m[2]))
+
+
+def _rgba(color, opacity) -> tuple | None:
+    if color is None:
+        return None
+    # renderPDF semantics: an explicit opacity replaces the color's own alpha
+    alpha = getattr(color, "alpha", 1.0) if opacity is None else opacity
+    return (round(color.red * 255), round(color.green * 255), round(color.blue * 255), round(alpha * 255))
+
+
+def _subpaths(node) -> list[list[tuple[float, float]]]:
+    """Flatten a shape to point lists (curves sampled, arcs as polygons)."""
+    if isinstance(node, shapes.Rect):
+        x, y, w, h = node.x, node.y, node.width, node.height
+        return [[(x, y), (x + w, y), (x + w, y + h), (x, y + h), (x, y)]]
+    if isinstance(node, (shapes.Circle, shapes.Ellipse)):
+        rx = getattr(node, "rx", None) or node.r
+        ry = getattr(node, "ry", None) or node.r
+        steps = 96
+        return [[
+            (node.cx + rx * math.cos(2 * math.pi * t / steps), node.cy + ry * math.sin(2 * math.pi * t / steps))
+            for t in range(steps + 1)
+        ]]
+    if isinstance(node, shapes.Wedge):
+        return _subpaths(node.asPolygon())
+    if isinstance(node, shapes.Line):
+        return [[(node.x1, node.y1), (node.x2, node.y2)]]
+    if isinstance(node, (shapes.PolyLine, shapes.Polygon)):
+        pts = node.points
+        poly = [(pts[i], pts[i + 1]) for i in range(0, len(pts), 2)]
+        if isinstance(node, shapes.Polygon) and poly:
+            poly.append(poly[0])
+        return [poly]
+    if isinstance(node, shapes.Path):
+        out, current, i = [], [], 0
+        pts = node.points
+        for op in node.operators:
+            if op == 0:  # moveTo
+                if len(current) > 1:
+                    out.append(current)
+                current = [(pts[i], pts[i + 1])]
+                i += 2
+            elif op == 1:  # lineTo
+                current.append((pts[i], pts[i + 1]))
+                i += 2
+            elif op == 2:  # curveTo
+                x0, y0 = current[-1] if current else (pts[i], pts[i + 1])
+                x1, y1, x2, y2, x3, y3 = pts[i:i + 6]
+                for step in range(1, CURVE_STEPS + 1):
+                    t = step / CURVE_STEPS
+                    u = 1 - t
+                    current.append((
+                        u * u * u * x0 + 3 * u * u * t * x1 + 3 * u * t * t * x2 + t * t * t * x3,
+                        u * u * u * y0 + 3 * u * u * t * y1 + 3 * u * t * t * y2 + t * t * t * y3,
+                    ))
+                i += 6
+            elif op == 3 and current:  # closePath
+                current.append(current[0])
+        if len(current) > 1:
+            out.append(current)
+        return out
+    return []
+
+
+class _PillowRasterizer:
+    """Paints a ReportLab Drawing onto an RGB image with alpha-blended ink."""
+
+    def __init__(self, width: int, height: int):
+        self.image = Image.new("RGB", (width, height), (255, 255, 255))
+        self.draw_ = ImageDraw.Draw(self.image, "RGBA")
+        self.fonts: dict[int, ImageFont.ImageFont] = {}
+
+    def _font(self, size: float):
+        px = max(1, round(size))
+        font = self.fonts.get(px)
+        if font is None:
+            for path in FONT_PATHS:
+                try:
+                    font = ImageFont.truetype(path, px)
+                    break
+                except OSError:
+                    continue
+            else:
+                font = ImageFont.load_default(px)
+            self.fonts[px] = font
+        return font
+
+    def draw(self, node, m) -> None:
+        if isinstance(node, shapes.Group):
+            if node.transform:
+                m = shapes.mmult(m, node.transform)
+            for child in node.contents:
+                self.draw(child, m)
+            return
+        if isinstance(node, shapes.String):
+            self._string(node, m)
+            return
+        if getattr(node, "isClipPath", False):
+            return
+
+        paths = [[_apply(m, x, y) for x, y in sub] for sub in _subpaths(node)]
+        if not paths:
+            return
+        fill = None
+        if not isinstance(node, (shapes.Line, shapes.PolyLine)):
+            fill = _rgba(getattr(node, "fillColor", None), getattr(node, "fillOpacity", None))
+        stroke = _rgba(getattr(node, "strokeColor", None), getattr(node, "strokeOpacity", None))
+
+        if fill and fill[3]:
+            self._fill(paths, fill)
+        stroke_width = getattr(node, "strokeWidth", 1) or 0
+        if stroke and stroke[3] and stroke_width:
+            width = max(1, round(stroke_width * _scale(m)))
+            for sub in paths:
+                self.draw_.line(sub, fill=stroke, width=width)
+
+    def _fill(self, paths, color) -> None:
+        polygons = [sub for sub in paths if len(sub) > 2]
+        if len(polygons) == 1:
+            self.draw_.polygon(polygons[0], fill=color)
+            return
+        if not polygons:
+            return
+        # Even-odd fill: XOR the subpath masks (bbox-sized) so glyph counters stay open
+        xs = [x for sub in polygons for x, _ in sub]
+        ys = [y for sub in polygons for _, y in sub]
+        left, top = max(0, math.floor(min(xs))), max(0, math.floor(min(ys)))
+        right = min(self.image.width, math.ceil(max(xs)) + 1)
+        bottom = min(self.image.height, math.ceil(max(ys)) + 1)
+        if right <= left or bottom <= top:
+            return
+        size = (right - left, bottom - top)
+        mask = Image.new("1", size, 0)
+        for sub in polygons:
+            part = Image.new("1", size, 0)
+            ImageDraw.Draw(part).polygon([(x - left, y - top) for x, y in sub], fill=1)
+            mask = ImageChops.logical_xor(mask, part)
+        alpha = mask.convert("L").point(lambda v, a=color[3]: v * a // 255)
+        self.image.paste(color[:3], (left, top, right, bottom), alpha)
+
+    def _string(self, node, m) -> None:
+        color = _rgba(node.fillColor, getattr(node, "fillOpacity", None))
+        if not color or not color[3] or not node.text:
+            return
+        x, y = _apply(m, node.x, node.y)
+        anchor = {"start": "ls", "middle": "ms", "end": "rs"}.get(node.textAnchor, "ls")
+        self.draw_.text((x, y), node.text, fill=color, font=self._font(node.fontSize * _scale(m)), anchor=anchor)
+
+
+def rasterize_drawing(drawing, longest: int) -> Image.Image:
+    """RGB image of a ReportLab Drawing whose longest side is `longest` px."""
+    k = longest * SUPERSAMPLE / max(drawing.width, drawing.height)
+    width, height = max(1, round(drawing.width * k)), max(1, round(drawing.height * k))
+    raster = _PillowRasterizer(width, height)
+    # Drawing space is y-up; image rows run down
+    raster.draw(drawing, (k, 0, 0, -k, 0, drawing.height * k))
+    return raster.image.resize(_fit(width, height, longest), Image.LANCZOS)
+
+
+def _pillow_render(themed_svg: str, longest: int) -> Image.Image:
+    with span("svg_parse"):
+        drawing = svg_to_drawing(themed_svg)
+    if drawing is None:
+        raise ValueError("SVG parse failed")
+    return rasterize_drawing(drawing, longest)
+
+
+def _cairo_render(themed_svg: str, longest: int) -> Image.Image:
+    png = cairosvg.svg2png(bytestring=themed_svg.encode("utf-8"), output_width=longest)
+    image = Image.open(BytesIO(png))
+    if max(image.size) != longest:
+        image = image.resize(_fit(*image.size, longest), Image.LANCZOS)
+    return image.convert("RGBA")
+
+
+# ──────────────────────────────────────────────────────────────
+# Pyramid
+# ──────────────────────────────────────────────────────────────
+
+
+def _fit(width: int, height: int, longest: int) -> tuple[int, int]:
+    k = longest / max(width, height)
+    return max(1, round(width * k)), max(1, round(height * k))
+
+
+def render_pyramid(themed_svg: str, sizes: list[int]) -> dict[int, Image.Image]:
+    """Images of `themed_svg` at each of `sizes` (longest side, px) from one render."""
+    sizes = sorted(set(sizes), reverse=True)
+    with span("rasterize"):
+        largest = (_cairo_render if cairosvg is not None else _pillow_render)(themed_svg, sizes[0])
+        images = {sizes[0]: largest}
+        # Each level from the one above it: less work than from the top
+        previous = largest
+        for size in sizes[1:]:
+            previous = images[size] = previous.resize(_fit(*previous.size, size), Image.LANCZOS)
+    return images
+
+
+def encode_image(image: Image.Image, image_format: str) -> bytes:
+    buf = BytesIO()
+    with span("encode_image"):
+        if image_format == "webp":
+            image.save(buf, "WEBP", quality=settings.webp_quality, method=4)
+        elif image_format == "png":
+            image.save(buf, "PNG", compress_level=6)
+        else:
+            raise ValueError(f"Unknown image format {image_format!r} (choose from {', '.join(IMAGE_FORMATS)})")
+    return buf.getvalue()
@@ -0,0 +1,87 @@
+# app/services/render_jobs.py
+#
+# Render entry points for the routers, importable without the render stack.
+#
+# chart_generator pulls in kerykeion, reportlab, svglib and lxml (about half
+# a second of imports). The API process only needs these names to hand them
+# to run_render(), so each one imports its implementation on first call:
+# on the render pool workers (which import everything in their initializer)
+# that is free, and the API process starts without ever loading it.
+#
+# The functions are module-level, so the process backend pickles them by
+# reference like the originals.
+
+# Fields a chart JSON response can carry; `fields` narrows what is built
+CHART_FIELDS = frozenset({"svg", "svg_base64", "data"})
+# Fields that need the chart SVG drawn
+SVG_FIELDS = frozenset({"svg", "svg_base64"})
+
+
+def generate_chart_json_bytes(
+    chart_type: str,
+    req,
+    fields: frozenset = CHART_FIELDS,
+    data_include: dict | None = None,
+) -> bytes:
+    from app.services.chart_generator import generate_chart_json_bytes
+
+    return generate_chart_json_bytes(chart_type, req, fields, data_include)
+
+
+def generate_chart_msgpack_bytes(
+    chart_type: str,
+    req,
+    fields: frozenset = CHART_FIELDS,
+    data_include: dict | None = None,
+) -> bytes:
+    from app.services.chart_generator import generate_chart_msgpack_bytes
+
+    return generate_chart_msgpack_bytes(chart_type, req, fields, data_include)
+
+
+def generate_chart_svg_bytes(chart_type: str, req) -> bytes:
+    from app.services.chart_generator import generate_chart_svg_bytes
+
+    return generate_chart_svg_bytes(chart_type, req)
+
+
+def generate_chart_pdf_bytes(chart_type: str, req, profile: str | None = None) -> bytes:
+    from app.services.chart_generator import generate_chart_pdf_bytes
+
+    return generate_chart_pdf_bytes(chart_type, req, profile)
+
+
+def image_output_format(image_format: str, size: int) -> str:
+    """Cache key format of one chart image, e.g. "png:512"."""
+    return f"{image_format}:{size}"
+
+
+def generate_chart_image_bytes(chart_type: str, req, image_format: str, sizes: tuple[int, ...]) -> dict[str, bytes]:
+    from app.services.chart_generator import generate_chart_image_bytes
+
+    return generate_chart_image_bytes(chart_type, req, image_format, sizes)
+
+
+def generate_wheel_pdf_bytes(req, profile: str | None = None) -> bytes:
+    from app.services.chart_generator import generate_wheel_pdf_bytes
+
+    return generate_wheel_pdf_bytes(req, profile)
+
+
+def generate_transit_series_json_bytes(req) -> bytes:
+    from app.services.transit_series import generate_transit_series_json_bytes
+
+    return generate_transit_series_json_bytes(req)
+
+
+def generate_transit_series_msgpack_bytes(req) -> bytes:
+    from app.services.transit_series import generate_transit_series_msgpack_bytes
+
+    return generate_transit_series_msgpack_bytes(req)
+
+
+def data_projection(chart_type: str, spec: str) -> dict:
+    # Needs the Kerykeion chart data models; only loaded for data_fields requests
+    from app.services.chart_generator import data_projection
+
+    return data_projection(chart_type, spec)
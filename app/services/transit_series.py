@@ -0,0 +1,228 @@
+# app/services/transit_series.py
+#
+# Transit timelines: transiting longitudes on a regular time grid and the
+# entry / exact / exit times of their aspects to a natal chart.
+#
+# Instead of building an AstrologicalSubject + ChartData per step (what
+# N x ChartDataFactory.create_transit_chart_data would do), each transiting
+# point is computed as one column over the whole grid: a tight loop of bare
+# swe.calc_ut calls (pyswisseph has no array API, and one call is about a
+# microsecond of C). Aspect events are then found on those columns by
+# interpolating between grid steps, which relies on steps of at most a day
+# (TransitSeriesRequest.step_minutes).
+
+import json
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import kerykeion
+import swisseph as swe
+from kerykeion.settings.config_constants import DEFAULT_ACTIVE_ASPECTS, DEFAULT_ACTIVE_POINTS
+
+from app.core.metrics import span
+from app.core.msgpack_codec import packb
+from app.schemas.transit_series import TransitSeriesRequest, series_steps
+from app.services.chart_generator import _subject_from_input
+
+# Ephemeris files shipped with Kerykeion (same as its subject factory uses)
+EPHE_PATH = str(Path(kerykeion.__file__).parent / "sweph")
+SWE_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+# Swiss Ephemeris body per point; south nodes are the north node + 180
+SWE_BODIES = {
+    "Sun": swe.SUN,
+    "Moon": swe.MOON,
+    "Mercury": swe.MERCURY,
+    "Venus": swe.VENUS,
+    "Mars": swe.MARS,
+    "Jupiter": swe.JUPITER,
+    "Saturn": swe.SATURN,
+    "Uranus": swe.URANUS,
+    "Neptune": swe.NEPTUNE,
+    "Pluto": swe.PLUTO,
+    "Mean_North_Lunar_Node": swe.MEAN_NODE,
+    "True_North_Lunar_Node": swe.TRUE_NODE,
+    "Chiron": swe.CHIRON,
+    "Mean_Lilith": swe.MEAN_APOG,
+    "True_Lilith": swe.OSCU_APOG,
+}
+SOUTH_NODES = {
+    "Mean_South_Lunar_Node": "Mean_North_Lunar_Node",
+    "True_South_Lunar_Node": "True_North_Lunar_Node",
+}
+
+ASPECT_ANGLES = {
+    "conjunction": 0.0,
+    "semi-sextile": 30.0,
+    "semi-square": 45.0,
+    "sextile": 60.0,
+    "quintile": 72.0,
+    "square": 90.0,
+    "trine": 120.0,
+    "sesquiquadrate": 135.0,
+    "biquintile": 144.0,
+    "quincunx": 150.0,
+    "opposition": 180.0,
+}
+
+# Kerykeion's default points; the angles only exist on the natal side
+DEFAULT_TRANSIT_POINTS = [p for p in DEFAULT_ACTIVE_POINTS if p in SWE_BODIES or p in SOUTH_NODES]
+DEFAULT_NATAL_POINTS = list(DEFAULT_ACTIVE_POINTS)
+
+
+def _utc(dt: datetime) -> datetime:
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _julian_day(dt: datetime) -> float:
+    return swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute / 60.0 + dt.second / 3600.0)
+
+
+def transit_columns(jds: list[float], points: list[str]) -> tuple[dict, dict]:
+    """(longitudes, speeds) per point over the whole Julian day grid."""
+    swe.set_ephe_path(EPHE_PATH)
+    calc = swe.calc_ut
+    lons: dict[str, list[float]] = {}
+    speeds: dict[str, list[float]] = {}
+
+    bodies = {SOUTH_NODES.get(p, p) for p in points}
+    for point in bodies:
+        body = SWE_BODIES[point]
+        rows = [calc(jd, body, SWE_FLAGS)[0] for jd in jds]
+        lons[point] = [r[0] for r in rows]
+        speeds[point] = [r[3] for r in rows]
+
+    for south, north in SOUTH_NODES.items():
+        if south in points:
+            lons[south] = [(lon + 180.0) % 360.0 for lon in lons[north]]
+            speeds[south] = speeds[north]
+    return lons, speeds
+
+
+def _aspect_levels(aspects: list[dict]) -> tuple[list[float], list[tuple[str, str]]]:
+    """
+    Sorted separation angles (transit - natal, degrees) at which an aspect
+    event can happen, with (aspect, kind) per angle. Kinds: "lower" /
+    "upper" orb boundary or "exact". Copies at -360 / +360 cover segments
+    that wrap through 0.
+    """
+    table = []
+    for aspect in aspects:
+        angle, orb = ASPECT_ANGLES[aspect["name"]], aspect["orb"]
+        # Both sides of the natal point (a single centre for 0 and 180)
+        for centre in {angle, (360.0 - angle) % 360.0}:
+            for offset, kind in ((-orb, "lower"), (0.0, "exact"), (orb, "upper")):
+                for shift in (-360.0, 0.0, 360.0):
+                    table.append((centre + offset + shift, aspect["name"], kind))
+    table.sort()
+    return [t[0] for t in table], [(t[1], t[2]) for t in table]
+
+
+def aspect_events(
+    lons: dict[str, list[float]],
+    speeds: dict[str, list[float]],
+    natal_lons: dict[str, float],
+    aspects: list[dict],
+) -> list[tuple]:
+    """
+    (step position, transit point, natal point, aspect, event, retrograde)
+    tuples, found where the linearly interpolated separation crosses an
+    aspect's orb boundary (entry / exit) or exact angle.
+    """
+    values, labels = _aspect_levels(aspects)
+    events = []
+    for t_point, column in lons.items():
+        t_speeds = speeds[t_point]
+        for n_point, n_lon in natal_lons.items():
+            separation = [(lon - n_lon) % 360.0 for lon in column]
+            for k in range(1, len(separation)):
+                d0, d1 = separation[k - 1], separation[k]
+                # Unwrap moves through 0 / 360 (steps of at most a day keep
+                # every body far below 180 degrees per step)
+                if d1 - d0 > 180.0:
+                    d1 -= 360.0
+                elif d0 - d1 > 180.0:
+                    d1 += 360.0
+                if d1 > d0:
+                    hits = range(bisect_right(values, d0), bisect_right(values, d1))
+                elif d1 < d0:
+                    hits = reversed(range(bisect_left(values, d1), bisect_left(values, d0)))
+                else:
+                    continue
+                for i in hits:
+                    name, kind = labels[i]
+                    if kind == "exact":
+                        event = "exact"
+                    else:
+                        # Moving towards the centre of the orb is an entry
+                        event = "entry" if (kind == "lower") == (d1 > d0) else "exit"
+                    fraction = (values[i] - d0) / (d1 - d0)
+                    retrograde = (t_speeds[k - 1] if fraction < 0.5 else t_speeds[k]) < 0
+                    events.append((k - 1 + fraction, t_point, n_point, name, event, retrograde))
+    events.sort(key=lambda e: e[0])
+    return events
+
+
+def generate_transit_series(req: TransitSeriesRequest) -> dict:
+    start = _utc(req.start)
+    steps = series_steps(req)
+    step = timedelta(minutes=req.step_minutes)
+    times = [start + step * k for k in range(steps)]
+    jd0 = _julian_day(start)
+    step_days = req.step_minutes / 1440.0
+    jds = [jd0 + step_days * k for k in range(steps)]
+
+    transit_points = list(req.transit_points or DEFAULT_TRANSIT_POINTS)
+    natal_points = list(req.natal_points or DEFAULT_NATAL_POINTS)
+    aspects = [a.model_dump() for a in req.aspects] if req.aspects else DEFAULT_ACTIVE_ASPECTS
+
+    natal = _subject_from_input(req.natal)
+    natal_lons = {p: getattr(natal, p.lower()).abs_pos for p in natal_points}
+
+    with span("ephemeris"):
+        lons, speeds = transit_columns(jds, transit_points)
+    lons = {p: lons[p] for p in transit_points}
+
+    with span("aspects"):
+        events = aspect_events(lons, speeds, natal_lons, aspects)
+
+    return {
+        "success": True,
+        "chart_type": "transit_series",
+        "natal": {
+            "name": req.natal.name,
+            "points": {p: round(lon, 4) for p, lon in natal_lons.items()},
+        },
+        "start": _iso(start),
+        "step_minutes": req.step_minutes,
+        "steps": steps,
+        "time": [_iso(t) for t in times],
+        "positions": {p: [round(lon, 4) for lon in column] for p, column in lons.items()},
+        "events": {
+            "time": [_iso(start + step * e[0]) for e in events],
+            "transit": [e[1] for e in events],
+            "natal": [e[2] for e in events],
+            "aspect": [e[3] for e in events],
+            "event": [e[4] for e in events],
+            "retrograde": [e[5] for e in events],
+        },
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+    }
+
+
+def generate_transit_series_json_bytes(req: TransitSeriesRequest) -> bytes:
+    return json.dumps(
+        generate_transit_series(req),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def generate_transit_series_msgpack_bytes(req: TransitSeriesRequest) -> bytes:
+    return packb(generate_transit_series(req))
@@ -1,21 +1,17 @@
-from io import BytesIO
-
-from reportlab.graphics import renderPDF
-from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4, landscape
 from reportlab.lib.units import inch
-from reportlab.lib.utils import ImageReader
-from pathlib import Path
-from svglib.svglib import svg2rlg
+
+from app.core.metrics import span
 
 from app.services.phoenix_theme import apply_phoenix_perfection
+from app.services.pdf.native_wheel import build_wheel_drawing
+from app.services.pdf.output_profile import draw_drawing, get_profile, new_canvas
+from app.services.pdf.svg_skeleton import svg_to_drawing
+from app.services.pdf.assets import PRIMARY_LOGO_PATH as LOGO_PATH, WHEEL_LOGO_SIZE, get_image
 
 import logging
 logger = logging.getLogger("phoenix_charts.wheel")
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-LOGO_PATH = REPO_ROOT / "images" / "PhoenixLogo.png"
-
 
 def svg_to_pdf_bytes(
     svg: str,
@@ -23,17 +19,64 @@ def svg_to_pdf_bytes(
     *,
     name: str = "",
     chart_type: str = "",
+    profile: str | None = None,
 ) -> bytes:
-
+    """
+    Theme a Kerykeion SVG and lay it out on a landscape A4 wheel page.
+    `profile` names the PDF output profile (see pdf.output_profile).
+    """
     themed_svg = apply_phoenix_perfection(svg, theme)
+    return themed_svg_to_pdf_bytes(themed_svg, name=name, chart_type=chart_type, profile=profile)
+
 
-    drawing = svg2rlg(BytesIO(themed_svg.encode("utf-8")))
+def themed_svg_to_pdf_bytes(
+    themed_svg: str,
+    *,
+    name: str = "",
+    chart_type: str = "",
+    profile: str | None = None,
+) -> bytes:
+    """
+    Rasterize an already Phoenix-themed SVG (see apply_phoenix_perfection)
+    onto a landscape A4 wheel page.
+    """
+    with span("svg_parse"):
+        drawing = svg_to_drawing(themed_svg)
     if drawing is None:
         raise ValueError("SVG parse failed")
+    return drawing_to_pdf_bytes(drawing, name=name, chart_type=chart_type, profile=profile)
+
 
-    buffer = BytesIO()
+def chart_data_to_pdf_bytes(
+    chart_data,
+    theme: str = "classic",
+    *,
+    name: str = "",
+    chart_type: str = "",
+    profile: str | None = None,
+) -> bytes:
+    """
+    Native alternative to svg_to_pdf_bytes: draw the wheel of a
+    single-subject ChartDataModel directly (see pdf.native_wheel), without
+    the Kerykeion SVG and svglib. The page shows the wheel only, without
+    the SVG's position / aspect grids.
+    """
+    with span("native_draw"):
+        drawing = build_wheel_drawing(chart_data, theme)
+    return drawing_to_pdf_bytes(drawing, name=name, chart_type=chart_type, profile=profile)
+
+
+def drawing_to_pdf_bytes(
+    drawing,
+    *,
+    name: str = "",
+    chart_type: str = "",
+    profile: str | None = None,
+) -> bytes:
+    """Lay a wheel Drawing out on a landscape A4 page with header and logo."""
+    pdf_profile = get_profile(profile)
     page_width, page_height = landscape(A4)
-    c = canvas.Canvas(buffer, pagesize=(page_width, page_height))
+    c = new_canvas("wheel.pdf", (page_width, page_height), pdf_profile)
 
     # ────────────────────────────────────────
     # NO PAGE-WIDE BACKGROUND FILL ANYMORE
@@ -62,9 +105,9 @@ def svg_to_pdf_bytes(
 
     # Logo
     try:
-        if LOGO_PATH.exists():
-            img = ImageReader(str(LOGO_PATH))
-            size = 0.9 * inch
+        img = get_image(LOGO_PATH, WHEEL_LOGO_SIZE, pdf_profile.logo_dpi)
+        if img is not None:
+            size = WHEEL_LOGO_SIZE
             c.drawImage(
                 img,
                 page_width - size - 0.4 * inch,
@@ -79,7 +122,7 @@ def svg_to_pdf_bytes(
 
     # -----------------------------
     # -----------------------------
-    # 3) Draw wheel SVG (slightly larger than original)
+    # 3) Draw wheel (slightly larger than original)
     # -----------------------------
     # Use the smaller of width/height, but with a smaller margin than before.
     # Original was: min(page_width, page_height) - 80
@@ -88,14 +131,16 @@ def svg_to_pdf_bytes(
     scale = max_size / max(drawing.width, drawing.height)
     drawing.scale(scale, scale)
 
-    renderPDF.draw(
-        drawing,
-        c,
-        (page_width - drawing.width * scale) / 2,
-        (page_height - drawing.height * scale) / 2,
-    )
+    with span("pdf_draw"):
+        draw_drawing(
+            drawing,
+            c,
+            (page_width - drawing.width * scale) / 2,
+            (page_height - drawing.height * scale) / 2,
+        )
 
     c.showPage()
-    c.save()
-    buffer.seek(0)
-    return buffer.read()
\ No newline at end of file
+    # getpdfdata() returns the serialized document without the BytesIO
+    # write + read-back copies of c.save()
+    with span("pdf_save"):
+        return c.getpdfdata()
\ No newline at end of file
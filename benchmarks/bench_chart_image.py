@@ -0,0 +1,100 @@
+# benchmarks/bench_chart_image.py
+#
+# Chart images (/{chart_type}/image): render time and bytes per size and
+# format, against the SVG they are rasterized from.
+#
+# For the natal and synastry charts of the fixed subjects, the themed SVG is
+# rasterized as one pyramid (largest size rendered, smaller ones downscaled)
+# and, for comparison, once per size. Chart computation and theming happen
+# before the timed part, so the times are rasterize + encode only. The
+# rasterizer backend (cairo or the Pillow fallback) is printed first.
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_chart_image [--repeat N] [--out DIR]
+# Exits non-zero when the pyramid is not faster than rendering each size.
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from app.core.config import settings
+from app.schemas.natal import NatalRequest
+from app.schemas.synastry import SynastryRequest
+from app.services.chart_generator import generate_chart_svg_bytes
+from app.services.phoenix_theme import apply_phoenix_perfection
+from app.services.raster import BACKEND, IMAGE_FORMATS, encode_image, render_pyramid
+
+# The subjects of all_charts_final_perfect.py
+FIRST = dict(name="Matthew Mikos", year=1976, month=2, day=2, hour=14, minute=28, lat=47.6588, lng=-117.4259,
+             tz_str="America/Los_Angeles", city="Spokane", country="US")
+SECOND = dict(name="Soulmate", year=1980, month=7, day=15, hour=9, minute=30, lat=37.7749, lng=-122.4194,
+              tz_str="America/Los_Angeles", city="San Francisco", country="US")
+
+
+def _median_ms(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", type=Path, help="write the images here")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    sizes = list(settings.image_sizes)
+    print(f"backend: {BACKEND}; sizes: {', '.join(map(str, sizes))}")
+    header = f"{'chart':<10} {'format':<6} {'SVG KB':>7} {'pyramid ms':>11} {'per-size ms':>12} " + " ".join(
+        f"{str(size) + ' KB':>8}" for size in sizes
+    )
+    print(header)
+    print("-" * len(header))
+
+    failed = False
+    cases = [
+        ("natal", NatalRequest(**FIRST, theme="classic")),
+        ("synastry", SynastryRequest(first=FIRST, second=SECOND, theme="classic")),
+    ]
+    for chart_type, req in cases:
+        svg = generate_chart_svg_bytes(chart_type, req).decode("utf-8")
+        themed_svg = apply_phoenix_perfection(svg, req.theme)
+        render_pyramid(themed_svg, sizes[:1])  # warm the skeleton cache and fonts
+
+        for image_format in IMAGE_FORMATS:
+            def pyramid():
+                return {size: encode_image(image, image_format)
+                        for size, image in render_pyramid(themed_svg, sizes).items()}
+
+            def per_size():
+                return [encode_image(render_pyramid(themed_svg, [size])[size], image_format) for size in sizes]
+
+            pyramid_ms = _median_ms(pyramid, args.repeat)
+            per_size_ms = _median_ms(per_size, args.repeat)
+            images = pyramid()
+            if args.out:
+                args.out.mkdir(parents=True, exist_ok=True)
+                for size, body in images.items():
+                    (args.out / f"{chart_type}_{size}.{image_format}").write_bytes(body)
+
+            print(
+                f"{chart_type:<10} {image_format:<6} {len(themed_svg.encode()) / 1024:>7.1f} "
+                f"{pyramid_ms:>11.0f} {per_size_ms:>12.0f} "
+                + " ".join(f"{len(images[size]) / 1024:>8.1f}" for size in sizes)
+            )
+            if len(sizes) > 1 and pyramid_ms >= per_size_ms:
+                print(f"FAIL: {chart_type} {image_format}: pyramid is not faster than one render per size")
+                failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/bench_compression.py
+#
+# Bytes on the wire and CPU cost per Content-Encoding for the sample wheel
+# SVGs in the repo root (and the chart JSON that embeds them as svg +
+# svg_base64).
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_compression [--repeat N]
+
+import argparse
+import base64
+import gzip
+import json
+import statistics
+import time
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SAMPLE_SVGS = sorted(REPO_ROOT.glob("*.svg"))
+
+GZIP_LEVELS = (1, 6, 9)
+BROTLI_QUALITIES = (1, 5, 9, 11)
+
+
+def _timed_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+
+def _codecs():
+    for level in GZIP_LEVELS:
+        yield f"gzip-{level}", (lambda b, l=level: gzip.compress(b, compresslevel=l, mtime=0)), gzip.decompress
+    if brotli is not None:
+        for quality in BROTLI_QUALITIES:
+            yield f"br-{quality}", (lambda b, q=quality: brotli.compress(b, quality=q)), brotli.decompress
+
+
+def _chart_json(svg: bytes) -> bytes:
+    """Shape of a default chart response body (svg + svg_base64, no data)."""
+    text = svg.decode("utf-8")
+    return json.dumps(
+        {
+            "svg": text,
+            "svg_base64": "data:image/svg+xml;base64," + base64.b64encode(svg).decode("ascii"),
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if brotli is None:
+        print("brotli not installed: only gzip is measured")
+
+    header = f"{'body':<28} {'encoding':<8} {'bytes':>9} {'ratio':>6} {'comp ms':>8} {'decomp ms':>9}"
+    print(header)
+    print("-" * len(header))
+    for path in SAMPLE_SVGS:
+        svg = path.read_bytes()
+        for label, body in ((path.name, svg), (path.stem + ".json", _chart_json(svg))):
+            print(f"{label:<28} {'identity':<8} {len(body):>9} {1.0:>6.2f} {0.0:>8.2f} {0.0:>9.2f}")
+            for name, comp, decomp in _codecs():
+                encoded = comp(body)
+                comp_ms = _timed_ms(lambda: comp(body), args.repeat)
+                decomp_ms = _timed_ms(lambda: decomp(encoded), args.repeat)
+                ratio = len(body) / len(encoded)
+                print(f"{'':<28} {name:<8} {len(encoded):>9} {ratio:>6.2f} {comp_ms:>8.2f} {decomp_ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# benchmarks/bench_import_time.py
+#
+# Import-time budget for the API process.
+#
+# Runs `python -X importtime -c "import app.main"` in fresh interpreters and
+# reports the median cumulative import time of app.main, the whole process
+# start (interpreter + imports), and the slowest modules by self time. The
+# render stack (kerykeion, reportlab, svglib, lxml) and the openai SDK must
+# not be imported by app.main at all: they load on first use / warm-up.
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_import_time [--repeat N] [--budget-ms MS]
+# Exits non-zero when app.main is over budget or imports a deferred module.
+# The default budget leaves about 15% over the slowest of the 450-570 ms
+# measured on the reference machine (run-to-run noise), so a regression of a
+# third fails; pass --budget-ms on slower hardware.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+DEFERRED_MODULES = ("kerykeion", "reportlab", "svglib", "lxml", "openai", "swisseph")
+TARGET = "app.main"
+
+# Cumulative import time of app.main allowed by default, ms
+BUDGET_MS = 650.0
+
+
+def _importtime(module: str) -> tuple[float, list[tuple[str, int, int]]]:
+    """(wall seconds of the whole process, [(module, self us, cumulative us)])."""
+    env = {**os.environ, "PYTHONPATH": os.getcwd()}
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - t0
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return wall, rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS, help="allowed cumulative import time of app.main")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    walls, totals, runs = [], [], []
+    for _ in range(args.repeat):
+        wall, rows = _importtime(TARGET)
+        walls.append(wall * 1000.0)
+        totals.append(next(cum for name, _, cum in rows if name == TARGET) / 1000.0)
+        runs.append(rows)
+
+    total_ms = statistics.median(totals)
+    print(f"import {TARGET}: {total_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"process start + import: {statistics.median(walls):.0f} ms")
+
+    rows = runs[totals.index(sorted(totals)[len(totals) // 2])]
+    print(f"\n{'module':<48} {'self ms':>8} {'cumul ms':>9}")
+    for name, self_us, cumulative_us in sorted(rows, key=lambda r: r[1], reverse=True)[: args.top]:
+        print(f"{name:<48} {self_us / 1000.0:>8.1f} {cumulative_us / 1000.0:>9.1f}")
+
+    loaded = sorted({name.split(".")[0] for name, _, _ in rows} & set(DEFERRED_MODULES))
+    failed = False
+    if loaded:
+        print(f"\nFAIL: {TARGET} imports deferred modules: {', '.join(loaded)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"\nFAIL: {TARGET} import over budget ({total_ms:.0f} > {args.budget_ms:.0f} ms)")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
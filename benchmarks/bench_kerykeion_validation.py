@@ -0,0 +1,120 @@
+# benchmarks/bench_kerykeion_validation.py
+#
+# kerykeion_data -> chart model time per validation mode (full / cached /
+# trusted), the `validate` stage of /wheel/pdf-bytes.
+#
+# Payloads are the chart data models of the fixed subjects, dumped to JSON
+# and parsed back, as Astro-Bot sends them: natal and composite
+# (SingleChartDataModel), synastry and transit (DualChartDataModel). For
+# cached, "miss" is the first sight of a payload (hash + validate + store)
+# and "hit" a repeat (hash + lookup); the content hash alone is shown too.
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_kerykeion_validation [--repeat N]
+# Exits non-zero when a mode builds a model that differs from full
+# validation, or when trusted accepts a payload with a missing field.
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+
+from app.schemas.composite import CompositeRequest
+from app.schemas.natal import NatalRequest
+from app.schemas.synastry import SynastryRequest
+from app.schemas.transit import TransitRequest
+from app.services.chart_generator import (
+    generate_composite_chart,
+    generate_natal_chart,
+    generate_synastry_chart,
+    generate_transit_chart,
+)
+from app.services.kerykeion_model_utils import build_chart_model_from_kerykeion_data, clear_model_cache, payload_hash
+
+# The subjects of all_charts_final_perfect.py
+FIRST = dict(name="Matthew Mikos", year=1976, month=2, day=2, hour=14, minute=28, lat=47.6588, lng=-117.4259,
+             tz_str="America/Los_Angeles", city="Spokane", country="US")
+SECOND = dict(name="Soulmate", year=1980, month=7, day=15, hour=9, minute=30, lat=37.7749, lng=-122.4194,
+              tz_str="America/Los_Angeles", city="San Francisco", country="US")
+
+
+def _payloads():
+    """(chart type, kerykeion_data JSON) as Astro-Bot would send it."""
+    for chart_type, generate, req in (
+        ("natal", generate_natal_chart, NatalRequest(**FIRST, theme="classic")),
+        ("composite", generate_composite_chart, CompositeRequest(first=FIRST, second=SECOND, theme="classic")),
+        ("synastry", generate_synastry_chart, SynastryRequest(first=FIRST, second=SECOND, theme="classic")),
+        ("transit", generate_transit_chart, TransitRequest(natal=FIRST, transit=SECOND, theme="classic")),
+    ):
+        yield chart_type, json.dumps(generate(req, frozenset({"data"}))["data"])
+
+
+def _median_ms(fn, repeat: int, setup=None) -> float:
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(times)
+
+
+def _dump(model) -> str:
+    return json.dumps(model.model_dump(mode="json"), sort_keys=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    header = (
+        f"{'payload':<10} {'KB':>6} {'full ms':>8} {'miss ms':>8} {'hit ms':>7} "
+        f"{'hash ms':>8} {'trusted ms':>11} {'hit speedup':>12}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    failed = False
+    for chart_type, body in _payloads():
+        kdata = json.loads(body)
+
+        def build(mode):
+            return build_chart_model_from_kerykeion_data(kdata, mode)
+
+        reference = _dump(build("full"))
+        for mode in ("cached", "trusted"):
+            if _dump(build(mode)) != reference:
+                print(f"FAIL: {chart_type}: {mode} model differs from full validation")
+                failed = True
+
+        broken = json.loads(body)
+        subject = broken.get("subject") or broken["first_subject"]
+        del subject["sun"]["abs_pos"]
+        try:
+            build_chart_model_from_kerykeion_data(broken, "trusted")
+            print(f"FAIL: {chart_type}: trusted accepted a payload without subject.sun.abs_pos")
+            failed = True
+        except ValueError:
+            pass
+
+        full_ms = _median_ms(lambda: build("full"), args.repeat)
+        miss_ms = _median_ms(lambda: build("cached"), args.repeat, setup=clear_model_cache)
+        build("cached")
+        hit_ms = _median_ms(lambda: build("cached"), args.repeat)
+        hash_ms = _median_ms(lambda: payload_hash(kdata), args.repeat)
+        trusted_ms = _median_ms(lambda: build("trusted"), args.repeat)
+        print(
+            f"{chart_type:<10} {len(body) / 1024:>6.1f} {full_ms:>8.3f} {miss_ms:>8.3f} {hit_ms:>7.3f} "
+            f"{hash_ms:>8.3f} {trusted_ms:>11.3f} {full_ms / hit_ms:>11.1f}x"
+        )
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# benchmarks/bench_msgpack.py
+#
+# JSON vs MessagePack for a synastry chart (Matthew / Soulmate, see
+# all_charts_final_perfect.py), on both directions of the wire:
+#
+#   request   a /wheel/pdf-bytes body carrying the synastry kerykeion_data:
+#             client encode + server decode
+#   response  the full /synastry response (SVG + chart data): the server's
+#             serialize stage + client decode
+#   http      /synastry requests per second through TestClient, served from
+#             the render cache (no compression), decoded by the client
+#
+# Throughput is operations per second of the median run; the encode and
+# decode figures are single-threaded CPU only.
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_msgpack [--repeat N] [--requests N]
+# Exits non-zero when msgpack is not installed or a msgpack body decodes to
+# different data than its JSON twin.
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+
+from fastapi.testclient import TestClient
+
+from app.core.metrics import collect_spans
+from app.core.msgpack_codec import msgpack_available, packb, unpackb
+from app.main import app
+from app.schemas.synastry import SynastryRequest
+from app.services.chart_generator import generate_chart_json_bytes, generate_chart_msgpack_bytes
+
+# The subjects of all_charts_final_perfect.py
+FIRST = dict(name="Matthew Mikos", year=1976, month=2, day=2, hour=14, minute=28, lat=47.6588, lng=-117.4259,
+             tz_str="America/Los_Angeles", city="Spokane", country="US")
+SECOND = dict(name="Soulmate", year=1980, month=7, day=15, hour=9, minute=30, lat=37.7749, lng=-122.4194,
+              tz_str="America/Los_Angeles", city="San Francisco", country="US")
+BODY = {"first": FIRST, "second": SECOND, "theme": "classic"}
+
+
+def _ops(fn, repeat: int) -> float:
+    """Operations per second of the median run."""
+    fn()
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return 1.0 / statistics.median(times)
+
+
+def _serialize_ops(render, repeat: int) -> float:
+    """Operations per second of the serialize stage alone."""
+    times = []
+    for _ in range(repeat):
+        _, spans = collect_spans(render)
+        times.append(sum(item[1] for item in spans if len(item) == 2 and item[0] == "serialize"))
+    return 1.0 / statistics.median(times)
+
+
+def _row(label: str, json_ops: float, msgpack_ops: float, json_size: int, msgpack_size: int) -> None:
+    print(
+        f"{label:<26} {json_ops:>9.0f} {msgpack_ops:>9.0f} {msgpack_ops / json_ops:>7.1f}x "
+        f"{json_size / 1024:>9.1f} {msgpack_size / 1024:>9.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    if not msgpack_available():
+        print("FAIL: the msgpack package is not installed")
+        sys.exit(1)
+    logging.disable(logging.INFO)
+
+    req = SynastryRequest(**BODY)
+    json_body = generate_chart_json_bytes("synastry", req)
+    msgpack_body = generate_chart_msgpack_bytes("synastry", req)
+    as_json, as_msgpack = json.loads(json_body), unpackb(msgpack_body)
+
+    failed = False
+    if as_msgpack["data"] != as_json["data"] or as_msgpack["svg"].decode("utf-8") != as_json["svg"]:
+        print("FAIL: the msgpack response decodes to different data than the JSON one")
+        failed = True
+
+    wheel_request = {**FIRST, "theme": "classic", "kerykeion_data": as_json["data"]}
+    json_request = json.dumps(wheel_request).encode("utf-8")
+    msgpack_request = packb(wheel_request)
+    if unpackb(msgpack_request) != json.loads(json_request):
+        print("FAIL: the msgpack request decodes to different data than the JSON one")
+        failed = True
+
+    header = f"{'ops/s (synastry)':<26} {'json':>9} {'msgpack':>9} {'ratio':>8} {'json KB':>9} {'mp KB':>9}"
+    print(header)
+    print("-" * len(header))
+    _row(
+        "request encode (client)",
+        _ops(lambda: json.dumps(wheel_request).encode("utf-8"), args.repeat),
+        _ops(lambda: packb(wheel_request), args.repeat),
+        len(json_request), len(msgpack_request),
+    )
+    _row(
+        "request decode (server)",
+        _ops(lambda: json.loads(json_request), args.repeat),
+        _ops(lambda: unpackb(msgpack_request), args.repeat),
+        len(json_request), len(msgpack_request),
+    )
+    _row(
+        "response serialize (server)",
+        _serialize_ops(lambda: generate_chart_json_bytes("synastry", req), args.repeat),
+        _serialize_ops(lambda: generate_chart_msgpack_bytes("synastry", req), args.repeat),
+        len(json_body), len(msgpack_body),
+    )
+    _row(
+        "response decode (client)",
+        _ops(lambda: json.loads(json_body), args.repeat),
+        _ops(lambda: unpackb(msgpack_body), args.repeat),
+        len(json_body), len(msgpack_body),
+    )
+
+    with TestClient(app) as client:
+        rates = {}
+        for label, headers, decode in (
+            ("json", {"accept": "application/json"}, lambda r: r.json()),
+            ("msgpack", {"accept": "application/msgpack"}, lambda r: unpackb(r.content)),
+        ):
+            headers["accept-encoding"] = "identity"
+            client.post("/api/v1/synastry", json=BODY, headers=headers)  # fill the cache
+            t0 = time.perf_counter()
+            for _ in range(args.requests):
+                response = client.post("/api/v1/synastry", json=BODY, headers=headers)
+                decode(response)
+            rates[label] = args.requests / (time.perf_counter() - t0)
+            if response.headers.get("x-cache") != "HIT":
+                print(f"FAIL: {label} responses are not served from the cache")
+                failed = True
+        _row("http /synastry (cached)", rates["json"], rates["msgpack"], len(json_body), len(msgpack_body))
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+# benchmarks/bench_native_wheel.py
+#
+# Native wheel renderer vs. the svglib pipeline:
+#   - timing: ChartDrawer SVG -> theme -> svg2rlg -> PDF page, against
+#     build_wheel_drawing -> PDF page, for the same ChartDataModel
+#   - visual diff: the native Drawing against svglib's Drawing of
+#     Kerykeion's wheel-only SVG, rasterized side by side
+#
+# ReportLab's raster backend (renderPM) needs rlPyCairo, so the drawings are
+# rasterized by the Pillow walker the chart image endpoints fall back to
+# (app/services/raster.py: paths flattened to polygons, 2x supersampled).
+# Both sides go through the same walker, so the diff measures the drawings,
+# not the rasterizer.
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_native_wheel [--repeat N] [--max-diff PCT] [--out DIR]
+# Exits non-zero when, for any subject / theme, the native wheel differs from
+# the svglib wheel in more than --max-diff percent of the disc's pixels
+# (default MAX_DIFF_PCT), or either side rasterizes to an empty disc.
+# --repeat 0 skips the timings and only runs the visual check.
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+from kerykeion import AstrologicalSubjectFactory, ChartDataFactory, ChartDrawer
+from PIL import Image, ImageChops, ImageDraw
+from svglib.svglib import svg2rlg
+
+from app.services.pdf.native_wheel import MARGIN, RADIUS, build_wheel_drawing
+from app.services.phoenix_theme import apply_phoenix_perfection
+from app.services.raster import rasterize_drawing
+from app.services.wheel_generator import chart_data_to_pdf_bytes, svg_to_pdf_bytes
+
+SUBJECTS = [
+    ("London 1990", 1990, 2, 3, 10, 20, -0.1278, 51.5074, "Europe/London"),
+    ("New York 1985", 1985, 7, 14, 6, 45, -74.006, 40.7128, "America/New_York"),
+    ("Tokyo 2001", 2001, 11, 28, 23, 5, 139.6917, 35.6895, "Asia/Tokyo"),
+]
+THEMES = ("classic", "dark")
+
+RASTER_SIZE = 600
+# Per-channel difference below this counts as antialiasing noise
+PIXEL_TOLERANCE = 48
+# Allowed differing pixels inside the disc, percent. The fixtures measure
+# 0.1-1.0% (glyph antialiasing, label placement within a pixel); a missing
+# ring, glyph set or colour shows up as several percent.
+MAX_DIFF_PCT = 2.0
+# A rasterized wheel with fewer drawn pixels than this (percent of the
+# disc) is empty, and would otherwise "match" another empty one
+MIN_INK_PCT = 5.0
+
+
+# ──────────────────────────────────────────────────────────────
+# Visual diff
+# ──────────────────────────────────────────────────────────────
+
+
+def rasterize(drawing, size: int = RASTER_SIZE) -> Image.Image:
+    """RGB image of a (square) wheel Drawing, size x size pixels."""
+    return rasterize_drawing(drawing, size)
+
+
+def visual_diff(a: Image.Image, b: Image.Image) -> tuple[float, Image.Image]:
+    """
+    (percent of differing pixels inside the wheel disc, diff image with
+    differences in red). Outside the disc there is only the paper margin,
+    which svglib sizes inconsistently for the percentage-sized paper rect.
+    """
+    size = a.width
+    r = size * (RADIUS + 2) / (2 * RADIUS + 2 * MARGIN)
+    disc = Image.new("L", a.size, 0)
+    ImageDraw.Draw(disc).ellipse((size / 2 - r, size / 2 - r, size / 2 + r, size / 2 + r), fill=255)
+
+    delta = ImageChops.difference(a, b).convert("L").point(lambda v: 255 if v > PIXEL_TOLERANCE else 0)
+    delta = ImageChops.multiply(delta, disc)
+    changed = delta.histogram()[255]
+    overlay = Image.blend(a, Image.new("RGB", a.size, (255, 255, 255)), 0.7)
+    overlay.paste((255, 0, 0), mask=delta)
+    return 100.0 * changed / disc.histogram()[255], overlay
+
+
+def ink_pct(image: Image.Image) -> float:
+    """Percent of pixels that differ from the image's background (its corner pixel)."""
+    background = Image.new("RGB", image.size, image.getpixel((0, 0)))
+    delta = ImageChops.difference(image, background).convert("L").point(lambda v: 255 if v > PIXEL_TOLERANCE else 0)
+    return 100.0 * delta.histogram()[255] / (image.width * image.height)
+
+
+# ──────────────────────────────────────────────────────────────
+# Benchmark
+# ──────────────────────────────────────────────────────────────
+
+
+def _median_ms(fn, repeat: int) -> float:
+    if repeat <= 0:
+        return float("nan")
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+
+def _chart_data(name, year, month, day, hour, minute, lng, lat, tz_str):
+    subject = AstrologicalSubjectFactory.from_birth_data(
+        name, year, month, day, hour, minute, lng=lng, lat=lat, tz_str=tz_str, online=False
+    )
+    return ChartDataFactory.create_natal_chart_data(subject)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--max-diff", type=float, default=MAX_DIFF_PCT, help="allowed differing pixels, percent")
+    parser.add_argument("--out", type=Path, default=None, help="write side-by-side diff PNGs here")
+    args = parser.parse_args()
+
+    # The theme / wheel code logs at INFO on every call
+    logging.disable(logging.INFO)
+    if args.out:
+        args.out.mkdir(parents=True, exist_ok=True)
+
+    header = f"{'subject':<15} {'theme':<8} {'svglib ms':>10} {'native ms':>10} {'speedup':>8} {'wheel svglib':>13} {'wheel native':>13} {'diff %':>7}"
+    print(header)
+    print("-" * len(header))
+
+    failures = []
+    for fixture in SUBJECTS:
+        chart_data = _chart_data(*fixture)
+        for theme in THEMES:
+            drawer = ChartDrawer(chart_data=chart_data, theme="classic")
+
+            def svglib_pdf():
+                svg_to_pdf_bytes(drawer.generate_svg_string(), theme)
+
+            def native_pdf():
+                chart_data_to_pdf_bytes(chart_data, theme)
+
+            def svglib_wheel():
+                return svg2rlg(BytesIO(apply_phoenix_perfection(drawer.generate_wheel_only_svg_string(), theme).encode("utf-8")))
+
+            def native_wheel():
+                return build_wheel_drawing(chart_data, theme)
+
+            native_wheel()  # glyphs are parsed once per theme
+            svglib_ms = _median_ms(svglib_pdf, args.repeat)
+            native_ms = _median_ms(native_pdf, args.repeat)
+            svglib_wheel_ms = _median_ms(svglib_wheel, args.repeat)
+            native_wheel_ms = _median_ms(native_wheel, args.repeat)
+
+            reference, candidate = rasterize(svglib_wheel()), rasterize(native_wheel())
+            diff_pct, overlay = visual_diff(reference, candidate)
+            case = f"{fixture[0]} / {theme}"
+            if diff_pct > args.max_diff:
+                failures.append(f"{case}: {diff_pct:.2f}% of the wheel differs (max {args.max_diff:g}%)")
+            for side, image in (("svglib", reference), ("native", candidate)):
+                if ink_pct(image) < MIN_INK_PCT:
+                    failures.append(f"{case}: the {side} wheel rasterizes empty")
+            if args.out:
+                sheet = Image.new("RGB", (reference.width * 3, reference.height), "white")
+                for i, img in enumerate((reference, candidate, overlay)):
+                    sheet.paste(img, (i * reference.width, 0))
+                sheet.save(args.out / f"{fixture[0].replace(' ', '_').lower()}_{theme}.png")
+
+            print(
+                f"{fixture[0]:<15} {theme:<8} {svglib_ms:>10.1f} {native_ms:>10.1f} "
+                f"{svglib_ms / native_ms:>7.1f}x {svglib_wheel_ms:>13.1f} {native_wheel_ms:>13.1f} {diff_pct:>7.2f}"
+            )
+
+    for message in failures:
+        print(f"FAIL: {message}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
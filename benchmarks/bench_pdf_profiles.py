@@ -0,0 +1,105 @@
+# benchmarks/bench_pdf_profiles.py
+#
+# PDF size vs. render time per output profile (fast / balanced / small).
+#
+# Renders the sample chart SVGs in the repo root through svg_to_pdf_bytes
+# (wheel page with logo), the natal one through convert_svg_to_pdf_bytes,
+# and a natal and a synastry chart PDF (wheel + report) through
+# generate_chart_pdf_bytes. Times are medians of warm renders, so the
+# skeleton cache and the decoded logos are shared by every profile. "out ms"
+# is the part a profile changes: the pdf_draw and pdf_save stages (drawing
+# onto the canvas, then compressing and serializing the document); the
+# chart computation and SVG parse before them are the same for every
+# profile and only add noise to the totals.
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_pdf_profiles [--repeat N]
+# Exits non-zero when a profile meant to be smaller produces a larger PDF.
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from app.core.metrics import collect_spans
+from app.schemas.natal import NatalRequest
+from app.schemas.synastry import SynastryRequest
+from app.services.chart_generator import convert_svg_to_pdf_bytes, generate_chart_pdf_bytes
+from app.services.pdf.assets import PRIMARY_LOGO_PATH
+from app.services.pdf.output_profile import PROFILES
+from app.services.wheel_generator import svg_to_pdf_bytes
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SAMPLE_SVGS = sorted(REPO_ROOT.glob("*.svg"))
+
+# The subjects of all_charts_final_perfect.py
+FIRST = dict(name="Matthew Mikos", year=1976, month=2, day=2, hour=14, minute=28, lat=47.6588, lng=-117.4259,
+             tz_str="America/Los_Angeles", city="Spokane", country="US")
+SECOND = dict(name="Soulmate", year=1980, month=7, day=15, hour=9, minute=30, lat=37.7749, lng=-122.4194,
+              tz_str="America/Los_Angeles", city="San Francisco", country="US")
+
+
+def _cases():
+    for path in SAMPLE_SVGS:
+        svg = path.read_text(encoding="utf-8")
+        yield f"wheel {path.stem}", lambda profile, svg=svg: svg_to_pdf_bytes(svg, "classic", profile=profile)
+    natal_svg = next((p for p in SAMPLE_SVGS if "natal" in p.stem), None)
+    if natal_svg is not None:
+        svg = natal_svg.read_text(encoding="utf-8")
+        yield "convert natal", lambda profile: convert_svg_to_pdf_bytes(
+            svg, title="Natal Chart", logo_path=PRIMARY_LOGO_PATH, profile=profile
+        )
+    natal = NatalRequest(**FIRST, theme="classic")
+    synastry = SynastryRequest(first=FIRST, second=SECOND, theme="classic")
+    yield "report natal", lambda profile: generate_chart_pdf_bytes("natal", natal, profile)
+    yield "report synastry", lambda profile: generate_chart_pdf_bytes("synastry", synastry, profile)
+
+
+OUTPUT_STAGES = ("pdf_draw", "pdf_save")
+
+
+def _measure(fn, repeat: int) -> tuple[float, float, int]:
+    """(median total ms, median output-stage ms, PDF bytes)."""
+    size = len(fn())  # warm-up
+    totals, outputs = [], []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        _, spans = collect_spans(fn)
+        totals.append((time.perf_counter() - t0) * 1000.0)
+        # Counter increments ride along as 3-tuples
+        outputs.append(sum(item[1] for item in spans if len(item) == 2 and item[0] in OUTPUT_STAGES) * 1000.0)
+    return statistics.median(totals), statistics.median(outputs), size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    names = list(PROFILES)
+    header = f"{'case':<22}" + "".join(
+        f" | {name + ' ms':>12} {'out ms':>7} {'KB':>6}" for name in names
+    )
+    print(header)
+    print("-" * len(header))
+
+    failed = False
+    for label, render in _cases():
+        results = [_measure(lambda: render(name), args.repeat) for name in names]
+        print(
+            f"{label:<22}"
+            + "".join(f" | {ms:>12.0f} {out:>7.0f} {size / 1024:>6.1f}" for ms, out, size in results)
+        )
+        sizes = [size for _, _, size in results]
+        if sizes != sorted(sizes, reverse=True):
+            print(f"FAIL: {label}: sizes do not shrink from {names[0]} to {names[-1]}")
+            failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# benchmarks/bench_phoenix_theme.py
+#
+# Microbenchmark: single-pass RecolorPlan vs. the old multi-pass
+# apply_phoenix_perfection (one re.sub per theme var + 3 more passes).
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_phoenix_theme [--repeat N]
+
+import argparse
+import logging
+import re
+import statistics
+import time
+from pathlib import Path
+
+from app.services.phoenix_theme import (
+    FALLBACK_ALIASES,
+    THEME_FILES,
+    VAR_PATTERN,
+    apply_phoenix_perfection,
+    theme_vars,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SAMPLE_SVGS = ["matthew_natal.svg", "matthew_synastry.svg"]
+
+
+def legacy_apply_phoenix_perfection(svg: str, theme: str) -> str:
+    """The pre-RecolorPlan implementation, kept as the reference output."""
+    theme_colors = theme_vars(theme)
+
+    for var_name, color in theme_colors.items():
+        svg = re.sub(rf"{re.escape(var_name)}\s*:[^;]+;", f"{var_name}: {color};", svg)
+
+    svg = re.sub(r'<text[^>]*class="sign-name"[^>]*>.*?</text>', "", svg, flags=re.DOTALL)
+    svg = re.sub(r'<text[^>]*class="planet-name"[^>]*>.*?</text>', "", svg, flags=re.DOTALL)
+
+    def _inline_var(m: re.Match) -> str:
+        name = m.group(1)
+        if name in theme_colors:
+            return theme_colors[name]
+        alias = FALLBACK_ALIASES.get(name)
+        if alias and alias in theme_colors:
+            return theme_colors[alias]
+        if name == "--kerykeion-color-neutral-content":
+            return "#9ca3af"
+        return m.group(0)
+
+    svg = VAR_PATTERN.sub(_inline_var, svg)
+
+    paper_hex = (
+        theme_colors.get("--kerykeion-chart-color-paper-1")
+        or theme_colors.get("--kerykeion-chart-color-paper-0")
+    )
+    if paper_hex and 'data-phoenix-paper-bg="1"' not in svg:
+        m = re.search(r"<svg[^>]*>", svg, flags=re.IGNORECASE)
+        if m:
+            bg_rect = (
+                f'<rect width="100%" height="100%" '
+                f'fill="{paper_hex.strip()}" data-phoenix-paper-bg="1"/>'
+            )
+            svg = svg[: m.end()] + bg_rect + svg[m.end():]
+    return svg
+
+
+def _time_ms(fn, svg: str, theme: str, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(svg, theme)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    # apply_phoenix_perfection logs at INFO on every call
+    logging.getLogger("phoenix_charts.wheel").setLevel(logging.WARNING)
+
+    print(f"{'svg':<22} {'theme':<20} {'legacy p50':>11} {'plan p50':>10} {'speedup':>8}")
+    for filename in SAMPLE_SVGS:
+        svg = (REPO_ROOT / filename).read_text(encoding="utf-8")
+        for theme in THEME_FILES:
+            expected = legacy_apply_phoenix_perfection(svg, theme)
+            actual = apply_phoenix_perfection(svg, theme)
+            if actual != expected:
+                raise SystemExit(f"output mismatch for {filename} theme={theme}")
+
+            legacy = statistics.median(
+                _time_ms(legacy_apply_phoenix_perfection, svg, theme, args.repeat)
+            )
+            plan = statistics.median(
+                _time_ms(apply_phoenix_perfection, svg, theme, args.repeat)
+            )
+            print(
+                f"{filename:<22} {theme:<20} {legacy:>9.2f}ms {plan:>8.2f}ms "
+                f"{legacy / plan:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
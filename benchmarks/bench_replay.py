@@ -0,0 +1,233 @@
+# benchmarks/bench_replay.py
+#
+# Load test with captured traffic: replays the requests recorded by the
+# capture middleware (PHOENIX_CAPTURE_PATH, see app/core/capture.py) against
+# an app instance and reports per endpoint the throughput, latency
+# percentiles and error rates.
+#
+# Target: a running server (--url http://127.0.0.1:8001), or by default the
+# app in this process through httpx's ASGI transport (no network, no
+# capture; renders use PHOENIX_RENDER_BACKEND as usual).
+#
+# Pacing:
+#   --concurrency N   closed loop, N requests in flight at all times
+#   --rate R          open loop, R requests per second started on schedule
+#                     (at most --concurrency in flight). Latency counts from
+#                     the scheduled start, so a server falling behind shows
+#                     up as latency instead of a lower send rate.
+# Requests go out in capture order; --loops repeats the capture.
+#
+# "4xx" and "5xx" are responses with those statuses, "err" transport errors
+# and timeouts, and "!=cap" responses whose status differs from the one
+# recorded at capture time.
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_replay CAPTURE.jsonl [CAPTURE.jsonl.1 ...]
+#       [--url URL] [--concurrency N | --rate R] [--loops K] [--limit N]
+# Exits non-zero when 5xx + transport errors exceed --max-error-rate percent.
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import httpx
+
+from app.core.msgpack_codec import MSGPACK_REQUEST_TYPES, msgpack_available, packb
+
+
+def load_capture(paths: list[Path]) -> list[dict]:
+    """Captured requests ready to send: method, url, headers, content, endpoint, status."""
+    requests = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    print(f"{path}:{number}: skipped, not JSON")
+                    continue
+                headers = {}
+                content = b""
+                media_type = record.get("content_type", "").split(";")[0].strip().lower()
+                if record.get("body") is not None:
+                    if media_type in MSGPACK_REQUEST_TYPES:
+                        if not msgpack_available():
+                            print(f"{path}:{number}: skipped, msgpack is not installed")
+                            continue
+                        content = packb(record["body"])
+                    else:
+                        content = json.dumps(record["body"]).encode("utf-8")
+                    headers["content-type"] = record.get("content_type") or "application/json"
+                if record.get("accept"):
+                    headers["accept"] = record["accept"]
+                query = record.get("query")
+                requests.append({
+                    "method": record.get("method", "POST"),
+                    "url": record["path"] + (f"?{query}" if query else ""),
+                    "headers": headers,
+                    "content": content,
+                    "endpoint": f"{record.get('method', 'POST')} {record['path']}",
+                    "status": record.get("status"),
+                })
+    return requests
+
+
+class Stats:
+    def __init__(self):
+        self.latencies: list[float] = []
+        self.status_4xx = 0
+        self.status_5xx = 0
+        self.errors = 0
+        self.mismatched = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+async def _send(client: httpx.AsyncClient, request: dict, scheduled: float, stats: dict[str, Stats]) -> None:
+    endpoint = stats[request["endpoint"]]
+    try:
+        response = await client.request(
+            request["method"], request["url"], headers=request["headers"], content=request["content"]
+        )
+        await response.aread()
+        status = response.status_code
+    except httpx.HTTPError:
+        status = None
+    endpoint.latencies.append((time.perf_counter() - scheduled) * 1000.0)
+    if status is None:
+        endpoint.errors += 1
+        return
+    if 400 <= status < 500:
+        endpoint.status_4xx += 1
+    elif status >= 500:
+        endpoint.status_5xx += 1
+    if request["status"] and status != request["status"]:
+        endpoint.mismatched += 1
+
+
+async def replay(client: httpx.AsyncClient, requests: list[dict], concurrency: int, rate: float | None):
+    stats: dict[str, Stats] = defaultdict(Stats)
+    slots = asyncio.Semaphore(concurrency)
+    start = time.perf_counter()
+
+    if rate:
+        async def paced(request: dict, scheduled: float):
+            async with slots:
+                await _send(client, request, scheduled, stats)
+
+        tasks = []
+        for i, request in enumerate(requests):
+            scheduled = start + i / rate
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(paced(request, scheduled)))
+        await asyncio.gather(*tasks)
+    else:
+        queue = iter(requests)
+
+        async def worker():
+            for request in queue:
+                await _send(client, request, time.perf_counter(), stats)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return stats, time.perf_counter() - start
+
+
+async def run(args, requests: list[dict]):
+    timeout = httpx.Timeout(args.timeout)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, timeout=timeout, limits=limits) as client:
+            return await replay(client, requests, args.concurrency, args.rate)
+
+    # Replayed traffic must not be captured again
+    os.environ.pop("PHOENIX_CAPTURE_PATH", None)
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://replay", timeout=timeout) as client:
+            return await replay(client, requests, args.concurrency, args.rate)
+
+
+def _row(label: str, stats: Stats, elapsed: float) -> str:
+    if not stats.count:
+        return f"{label:<32} {0:>6}"
+    return (
+        f"{label:<32} {stats.count:>6} {stats.count / elapsed:>7.1f} "
+        f"{_percentile(stats.latencies, 50):>8.1f} {_percentile(stats.latencies, 95):>8.1f} "
+        f"{_percentile(stats.latencies, 99):>8.1f} {stats.status_4xx:>5} {stats.status_5xx:>5} "
+        f"{stats.errors:>5} {stats.mismatched:>6}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("capture", type=Path, nargs="+", help="capture JSONL files, replayed in the given order")
+    parser.add_argument("--url", help="base URL of a running server (default: the app in this process)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rate", type=float, help="requests per second (open loop)")
+    parser.add_argument("--loops", type=int, default=1)
+    parser.add_argument("--limit", type=int, help="replay at most this many requests")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--max-error-rate", type=float, default=1.0, help="percent of 5xx + transport errors")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    requests = load_capture(args.capture) * args.loops
+    if args.limit:
+        requests = requests[: args.limit]
+    if not requests:
+        print("FAIL: no requests to replay")
+        sys.exit(1)
+
+    target = args.url or "in-process app"
+    pacing = f"{args.rate:g} req/s" if args.rate else f"concurrency {args.concurrency}"
+    print(f"replaying {len(requests)} requests against {target}, {pacing}")
+
+    stats, elapsed = asyncio.run(run(args, requests))
+
+    total = Stats()
+    for endpoint in stats.values():
+        total.latencies += endpoint.latencies
+        total.status_4xx += endpoint.status_4xx
+        total.status_5xx += endpoint.status_5xx
+        total.errors += endpoint.errors
+        total.mismatched += endpoint.mismatched
+
+    header = (f"{'endpoint':<32} {'reqs':>6} {'req/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+              f"{'4xx':>5} {'5xx':>5} {'err':>5} {'!=cap':>6}")
+    print(header)
+    print("-" * len(header))
+    for name in sorted(stats):
+        print(_row(name, stats[name], elapsed))
+    print("-" * len(header))
+    print(_row("total", total, elapsed))
+    print(f"{elapsed:.1f} s")
+
+    error_rate = (total.status_5xx + total.errors) / total.count * 100.0
+    if error_rate > args.max_error_rate:
+        print(f"FAIL: error rate {error_rate:.1f}% is over {args.max_error_rate:g}%")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# benchmarks/bench_report_engine.py
+#
+# Report engine layout time for 2- to 20-page reports.
+#
+# Each report is a synthetic aspects-style section list (birth fields, a
+# positions table and one long aspects table) sized to roughly the target
+# page count. draw_report lays it out on a fresh canvas; the same rows go
+# through platypus.Table under a SimpleDocTemplate (header row repeated on
+# every page) for comparison. Times are median ms per report and per page;
+# sizes are the finished PDF.
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_report_engine [--repeat N] [--pages 2,5,10,20]
+# Exits non-zero when a report fails to lay out.
+
+import argparse
+import statistics
+import sys
+import time
+from io import BytesIO
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+from reportlab.platypus import LongTable, Paragraph, SimpleDocTemplate, TableStyle
+
+from app.services.pdf.report_engine import (
+    FONT,
+    FONT_BOLD,
+    MARGIN,
+    STRIPE,
+    TABLE_FONT_SIZE,
+    TABLE_LEADING,
+    TITLE_STYLE,
+    Fields,
+    Heading,
+    Table,
+    draw_report,
+)
+
+POINTS = ("Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto", "Chiron")
+ASPECTS = ("Conjunction", "Opposition", "Trine", "Square", "Sextile", "Quincunx")
+ASPECT_COLUMNS = ("Point", "Aspect", "Point", "Orb", "Movement")
+ASPECT_WIDTHS = (0.3, 0.18, 0.3, 0.1, 0.12)
+# Body rows on a continuation page, rounded down
+ROWS_PER_PAGE = 54
+
+
+def _aspect_rows(n: int) -> list[tuple[str, ...]]:
+    return [
+        (
+            f"{POINTS[i % len(POINTS)]} (First)",
+            ASPECTS[i % len(ASPECTS)],
+            f"{POINTS[(i * 7 + 3) % len(POINTS)]} (Second)",
+            f"{i % 9}°{(i * 13) % 60:02d}'",
+            "Applying" if i % 2 else "Separating",
+        )
+        for i in range(n)
+    ]
+
+
+def _sections(pages: int) -> list:
+    return [
+        Heading("Birth Data"),
+        Fields([("Name", "Benchmark"), ("Date & time", "1990-02-03 10:20"), ("Location", "London, GB")]),
+        Heading("Aspects"),
+        Table(ASPECT_COLUMNS, _aspect_rows(pages * ROWS_PER_PAGE), ASPECT_WIDTHS, align_right=frozenset({3})),
+    ]
+
+
+def _engine_pdf(pages: int) -> tuple[bytes, int]:
+    buf = BytesIO()
+    c = canvas.Canvas(buf, pagesize=A4)
+    drawn = draw_report(c, _sections(pages), title="Benchmark Report", running_header="Benchmark Report")
+    c.showPage()
+    c.save()
+    return buf.getvalue(), drawn
+
+
+def _platypus_pdf(pages: int) -> tuple[bytes, int]:
+    buf = BytesIO()
+    doc = SimpleDocTemplate(buf, pagesize=A4, leftMargin=MARGIN, rightMargin=MARGIN, topMargin=MARGIN, bottomMargin=MARGIN)
+    width = A4[0] - 2 * MARGIN
+    table = LongTable(
+        [ASPECT_COLUMNS, *_aspect_rows(pages * ROWS_PER_PAGE)],
+        colWidths=[f * width for f in ASPECT_WIDTHS],
+        rowHeights=TABLE_LEADING,
+        repeatRows=1,
+    )
+    table.setStyle(
+        TableStyle(
+            [
+                ("FONT", (0, 0), (-1, -1), FONT, TABLE_FONT_SIZE),
+                ("FONT", (0, 0), (-1, 0), FONT_BOLD, TABLE_FONT_SIZE),
+                ("ALIGN", (3, 0), (3, -1), "RIGHT"),
+                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [None, STRIPE]),
+                ("TOPPADDING", (0, 0), (-1, -1), 0),
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+            ]
+        )
+    )
+    doc.build([Paragraph("Benchmark Report", TITLE_STYLE), table])
+    return buf.getvalue(), doc.page
+
+
+def _median_ms(fn, repeat: int) -> tuple[float, tuple[bytes, int]]:
+    samples, result = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--pages", default="2,5,10,20", help="comma-separated target page counts")
+    args = parser.parse_args()
+    targets = [int(p) for p in args.pages.split(",") if p.strip()]
+
+    # Warm fonts, styles and imports
+    _engine_pdf(1)
+    _platypus_pdf(1)
+
+    header = (
+        f"{'target':>6} {'pages':>5} {'engine ms':>9} {'ms/page':>7} {'KB':>6}"
+        f" {'platypus ms':>11} {'ms/page':>7} {'KB':>6} {'speedup':>7}"
+    )
+    print(header)
+    print("-" * len(header))
+    failed = False
+    for target in targets:
+        try:
+            engine_ms, (engine_pdf, engine_pages) = _median_ms(lambda: _engine_pdf(target), args.repeat)
+        except Exception as e:
+            print(f"{target:>6} FAIL: {e}")
+            failed = True
+            continue
+        table_ms, (table_pdf, table_pages) = _median_ms(lambda: _platypus_pdf(target), args.repeat)
+        print(
+            f"{target:>6} {engine_pages:>5} {engine_ms:>9.1f} {engine_ms / engine_pages:>7.2f} {len(engine_pdf) / 1024:>6.1f}"
+            f" {table_ms:>11.1f} {table_ms / table_pages:>7.2f} {len(table_pdf) / 1024:>6.1f}"
+            f" {table_ms / engine_ms:>6.1f}x"
+        )
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# benchmarks/bench_server_start.py
+#
+# Cold start and memory of the server entry points:
+#   - prefork: python -m app.server (warm-up in the parent, forked workers)
+#   - uvicorn: uvicorn app.main:app (single process, background warm-up)
+#
+# For each mode: seconds from launch until /health answers 200, latency of
+# the first and a later /wheel/pdf-bytes render, and per-process RSS / PSS /
+# private dirty memory (from /proc/<pid>/smaps_rollup, Linux only). PSS
+# splits shared copy-on-write pages between the processes sharing them.
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_server_start [--workers N] [--port P]
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+WHEEL_BODY = {
+    "name": "Bench",
+    "year": 1985,
+    "month": 3,
+    "day": 1,
+    "hour": 8,
+    "minute": 0,
+    "lat": 40.7128,
+    "lng": -74.006,
+    "tz_str": "America/New_York",
+    "theme": "dark",
+}
+
+
+def _get_status(url: str) -> int:
+    try:
+        with urllib.request.urlopen(url, timeout=1) as resp:
+            return resp.status
+    except urllib.error.HTTPError as exc:
+        return exc.code
+    except OSError:
+        return 0
+
+
+def _render_ms(base: str, name: str) -> float:
+    body = json.dumps({**WHEEL_BODY, "name": name}).encode("utf-8")
+    req = urllib.request.Request(
+        f"{base}/api/v1/wheel/pdf-bytes", data=body, headers={"Content-Type": "application/json"}
+    )
+    t0 = time.perf_counter()
+    with urllib.request.urlopen(req, timeout=60) as resp:
+        resp.read()
+    return (time.perf_counter() - t0) * 1000.0
+
+
+def _memory_kb(pid: int) -> dict[str, int]:
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Pss:", "Private_Dirty:"):
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return fields
+
+
+def _children(pid: int) -> list[int]:
+    kids = []
+    for tid in os.listdir(f"/proc/{pid}/task"):
+        with open(f"/proc/{pid}/task/{tid}/children") as f:
+            kids += [int(p) for p in f.read().split()]
+    return kids
+
+
+def _measure(label: str, cmd: list[str], port: int, env: dict) -> None:
+    base = f"http://127.0.0.1:{port}"
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while _get_status(f"{base}/health") != 200:
+            if proc.poll() is not None:
+                raise RuntimeError(f"{label} exited with {proc.returncode}")
+            time.sleep(0.05)
+        ready_s = time.perf_counter() - t0
+
+        first_ms = _render_ms(base, "Bench first")
+        later_ms = min(_render_ms(base, f"Bench {i}") for i in range(3))
+
+        print(f"\n{label}: ready {ready_s:.2f}s, first render {first_ms:.0f} ms, later {later_ms:.0f} ms")
+        print(f"  {'pid':>7} {'role':<8} {'RSS MB':>7} {'PSS MB':>7} {'private MB':>10}")
+        for role, pid in [("parent", proc.pid)] + [("worker", p) for p in _children(proc.pid)]:
+            mem = _memory_kb(pid)
+            print(
+                f"  {pid:>7} {role:<8} {mem['Rss'] / 1024:>7.1f} {mem['Pss'] / 1024:>7.1f} "
+                f"{mem['Private_Dirty'] / 1024:>10.1f}"
+            )
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=60)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    env = {**os.environ, "PYTHONPATH": os.getcwd()}
+    _measure(
+        f"prefork ({args.workers} workers)",
+        [sys.executable, "-m", "app.server", "--port", str(args.port), "--workers", str(args.workers), "--log-level", "warning"],
+        args.port,
+        env,
+    )
+    _measure(
+        "uvicorn (1 process, thread backend)",
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port), "--log-level", "warning"],
+        args.port,
+        {**env, "PHOENIX_RENDER_BACKEND": "thread", "PHOENIX_RENDER_WORKERS": "2"},
+    )
+    _measure(
+        "uvicorn (1 process, no warm-up)",
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port), "--log-level", "warning"],
+        args.port,
+        {**env, "PHOENIX_RENDER_BACKEND": "thread", "PHOENIX_RENDER_WORKERS": "2", "PHOENIX_WARMUP": "0"},
+    )
+
+
+if __name__ == "__main__":
+    main()
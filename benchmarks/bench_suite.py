@@ -0,0 +1,267 @@
+# benchmarks/bench_suite.py
+#
+# In-process benchmark suite: latency, allocations and peak RSS per pipeline
+# stage, compared against a saved JSON baseline.
+#
+# Everything runs in this process, no server needed (unlike
+# test_wheel_perfection.py, which needs one on port 8001). Stages:
+#   - the chart generators (generate_natal_chart, generate_synastry_chart,
+#     generate_transit_chart, generate_composite_chart) for the fixed subjects
+#   - apply_phoenix_perfection, svg_to_pdf_bytes, draw_wheel_page and
+#     draw_natal_report_body on the natal chart
+#   - the /api/v1 endpoints through FastAPI's TestClient, with the render
+#     cache off and the thread render backend, so every request renders
+#
+# Per stage: p50 / p95 wall time over --repeat runs (after one warm-up run),
+# peak traced allocation of one run under tracemalloc (measured apart from
+# the timed runs, which it would slow down), and peak RSS while the stage
+# ran (VmHWM, reset before each stage on Linux; elsewhere the process-wide
+# high-water mark). The subject cache stays warm, as in a running server.
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_suite [--repeat N] [--stages PATTERN ...]
+#                                    [--save PATH] [--baseline PATH] [--threshold PCT]
+# --save writes the results as a JSON baseline. With --baseline, exits
+# non-zero when a stage's p50 or peak allocation grew past --threshold
+# percent of the baseline (p50 changes under --min-delta-ms are noise).
+
+import argparse
+import fnmatch
+import gc
+import json
+import logging
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Renders run on threads of this process (tracemalloc sees them) and are
+# never served from the cache
+os.environ["PHOENIX_RENDER_BACKEND"] = "thread"
+os.environ["PHOENIX_CACHE_MAX_BYTES"] = "0"
+os.environ["PHOENIX_CACHE_DIR"] = ""
+os.environ["PHOENIX_WARMUP"] = "0"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from reportlab.lib.pagesizes import A4, landscape  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.schemas.composite import CompositeRequest  # noqa: E402
+from app.schemas.natal import NatalRequest  # noqa: E402
+from app.schemas.synastry import SynastryRequest  # noqa: E402
+from app.schemas.transit import TransitRequest  # noqa: E402
+from app.services.chart_generator import (  # noqa: E402
+    generate_composite_chart,
+    generate_natal_chart,
+    generate_synastry_chart,
+    generate_transit_chart,
+)
+from app.services.pdf.output_profile import new_canvas  # noqa: E402
+from app.services.pdf.reports import draw_natal_report_body  # noqa: E402
+from app.services.pdf.wheel_page import draw_wheel_page  # noqa: E402
+from app.services.phoenix_theme import apply_phoenix_perfection  # noqa: E402
+from app.services.wheel_generator import svg_to_pdf_bytes  # noqa: E402
+
+# The subjects of all_charts_final_perfect.py; its transit chart is cast
+# for now at the natal place, so transit stage timings follow the clock
+FIRST = dict(name="Matthew Mikos", year=1976, month=2, day=2, hour=14, minute=28, lat=47.6588, lng=-117.4259,
+             tz_str="America/Los_Angeles", city="Spokane", country="US")
+SECOND = dict(name="Soulmate", year=1980, month=7, day=15, hour=9, minute=30, lat=37.7749, lng=-122.4194,
+              tz_str="America/Los_Angeles", city="San Francisco", country="US")
+_NOW = datetime.now()
+TRANSIT = dict(name="Transit", year=_NOW.year, month=_NOW.month, day=_NOW.day, hour=_NOW.hour, minute=_NOW.minute,
+               lat=47.6588, lng=-117.4259, tz_str="America/Los_Angeles", city="Spokane", country="US")
+THEME = "classic"
+
+# Baseline metrics that fail the run when they regress
+GATED = ("p50_ms", "alloc_peak_kib")
+
+
+def _read_hwm_kib() -> int | None:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _reset_hwm() -> bool:
+    # Writing 5 to clear_refs resets the peak RSS (VmHWM) to the current RSS
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _max_rss_kib() -> int:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss  # bytes on macOS
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def measure(fn, repeat: int) -> dict:
+    fn()  # warm-up: imports, font and skeleton caches, subject cache
+
+    gc.collect()
+    per_stage_rss = _reset_hwm()
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000.0)
+    peak_rss = (_read_hwm_kib() if per_stage_rss else None) or _max_rss_kib()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, alloc_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "p50_ms": round(statistics.median(times), 3),
+        "p95_ms": round(_percentile(times, 95), 3),
+        "alloc_peak_kib": round(alloc_peak / 1024, 1),
+        "peak_rss_mib": round(peak_rss / 1024, 1),
+    }
+
+
+def build_stages(client: TestClient) -> dict:
+    natal_req = NatalRequest(**FIRST, theme=THEME)
+    synastry_req = SynastryRequest(first=FIRST, second=SECOND, theme=THEME)
+    transit_req = TransitRequest(natal=FIRST, transit=TRANSIT, theme=THEME)
+    composite_req = CompositeRequest(first=FIRST, second=SECOND, theme=THEME)
+
+    natal = generate_natal_chart(natal_req)
+    natal_svg = natal["svg"]
+    natal_data = natal["data"]
+
+    def draw_wheel():
+        draw_wheel_page(new_canvas("natal.pdf", landscape(A4)), natal_svg)
+
+    def draw_report():
+        draw_natal_report_body(new_canvas("natal.pdf", A4), natal_data, natal_req)
+
+    def post(path: str, body: dict):
+        def call():
+            response = client.post(path, json=body)
+            if response.status_code != 200:
+                raise RuntimeError(f"{path}: HTTP {response.status_code} {response.text[:200]}")
+        return call
+
+    pair = {"first": FIRST, "second": SECOND, "theme": THEME}
+    return {
+        "generate_natal_chart": lambda: generate_natal_chart(natal_req),
+        "generate_synastry_chart": lambda: generate_synastry_chart(synastry_req),
+        "generate_transit_chart": lambda: generate_transit_chart(transit_req),
+        "generate_composite_chart": lambda: generate_composite_chart(composite_req),
+        "apply_phoenix_perfection": lambda: apply_phoenix_perfection(natal_svg, THEME),
+        "svg_to_pdf_bytes": lambda: svg_to_pdf_bytes(natal_svg, THEME, name=FIRST["name"], chart_type="natal"),
+        "draw_wheel_page": draw_wheel,
+        "draw_natal_report_body": draw_report,
+        "http /natal": post("/api/v1/natal", {**FIRST, "theme": THEME}),
+        "http /synastry": post("/api/v1/synastry", pair),
+        "http /transit": post("/api/v1/transit", {"natal": FIRST, "transit": TRANSIT, "theme": THEME}),
+        "http /composite": post("/api/v1/composite", pair),
+        "http /natal/pdf": post("/api/v1/natal/pdf", {**FIRST, "theme": THEME}),
+        "http /synastry/pdf": post("/api/v1/synastry/pdf", pair),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float, min_delta_ms: float) -> list[str]:
+    """Regressions of `results` against `baseline`, as messages."""
+    regressions = []
+    for stage, current in results.items():
+        before = baseline.get(stage)
+        if before is None:
+            continue
+        for metric in GATED:
+            old, new = before.get(metric), current[metric]
+            if not old:
+                continue
+            if metric == "p50_ms" and new - old < min_delta_ms:
+                continue
+            if new > old * (1 + threshold / 100.0):
+                regressions.append(f"{stage}: {metric} {old:g} -> {new:g} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def _delta(current: dict, before: dict | None, metric: str) -> str:
+    if not before or not before.get(metric):
+        return ""
+    return f"{(current[metric] / before[metric] - 1) * 100:+.0f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--stages", nargs="*", default=["*"], help="glob patterns of the stages to run")
+    parser.add_argument("--save", type=Path, help="write the results here as a JSON baseline")
+    parser.add_argument("--baseline", type=Path, help="compare against this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=25.0, help="allowed growth in percent")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    baseline = json.loads(args.baseline.read_text())["stages"] if args.baseline else {}
+
+    results = {}
+    with TestClient(app) as client:
+        stages = build_stages(client)
+        selected = [name for name in stages if any(fnmatch.fnmatch(name, p) for p in args.stages)]
+        if not selected:
+            print(f"FAIL: no stage matches {' '.join(args.stages)}")
+            sys.exit(1)
+
+        header = (f"{'stage':<26} {'p50 ms':>8} {'p95 ms':>8} {'alloc KiB':>10} {'peak RSS MiB':>13}"
+                  + (f" {'p50':>6} {'alloc':>6}" if baseline else ""))
+        print(header)
+        print("-" * len(header))
+        for name in selected:
+            result = results[name] = measure(stages[name], args.repeat)
+            line = (f"{name:<26} {result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} "
+                    f"{result['alloc_peak_kib']:>10.0f} {result['peak_rss_mib']:>13.1f}")
+            if baseline:
+                before = baseline.get(name)
+                line += f" {_delta(result, before, 'p50_ms'):>6} {_delta(result, before, 'alloc_peak_kib'):>6}"
+            print(line)
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps({
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "stages": results,
+        }, indent=2) + "\n")
+        print(f"baseline written to {args.save}")
+
+    if args.baseline:
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+        for message in regressions:
+            print(f"FAIL: {message}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
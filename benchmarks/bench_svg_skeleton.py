@@ -0,0 +1,82 @@
+# benchmarks/bench_svg_skeleton.py
+#
+# svg2rlg vs. svg_to_drawing (svg2rlg with the skeleton cache) on the sample
+# chart SVGs in the repo root, themed per theme. The first svg_to_drawing
+# call per SVG fills the cache; the timed calls are warm.
+#
+# Parity is exact: both drawings are rendered to PDF with ReportLab's
+# invariant mode and the bytes compared.
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_svg_skeleton [--repeat N]
+# Exits non-zero when any PDF differs.
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+from reportlab import rl_config
+from reportlab.graphics import renderPDF
+from svglib.svglib import svg2rlg
+
+from app.services.pdf.svg_skeleton import SKELETON_LOOKUPS, skeleton_cache_clear, svg_to_drawing
+from app.services.phoenix_theme import apply_phoenix_perfection
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SAMPLE_SVGS = sorted(REPO_ROOT.glob("*.svg"))
+THEMES = ("classic", "dark")
+
+
+def _median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rl_config.invariant = 1
+    skeleton_cache_clear()
+
+    header = f"{'svg':<24} {'theme':<8} {'svg2rlg ms':>10} {'cold ms':>8} {'warm ms':>8} {'speedup':>7} {'same pdf':>8}"
+    print(header)
+    print("-" * len(header))
+    failed = False
+    for path in SAMPLE_SVGS:
+        for theme in THEMES:
+            svg = apply_phoenix_perfection(path.read_text(encoding="utf-8"), theme)
+
+            t0 = time.perf_counter()
+            cold = svg_to_drawing(svg)
+            cold_ms = (time.perf_counter() - t0) * 1000.0
+
+            same = renderPDF.drawToString(svg2rlg(BytesIO(svg.encode("utf-8")))) == renderPDF.drawToString(cold)
+            same = same and renderPDF.drawToString(svg_to_drawing(svg)) == renderPDF.drawToString(cold)
+            failed |= not same
+
+            base_ms = _median_ms(lambda: svg2rlg(BytesIO(svg.encode("utf-8"))), args.repeat)
+            warm_ms = _median_ms(lambda: svg_to_drawing(svg), args.repeat)
+            print(
+                f"{path.name:<24} {theme:<8} {base_ms:>10.1f} {cold_ms:>8.1f} {warm_ms:>8.1f} "
+                f"{base_ms / warm_ms:>6.2f}x {'yes' if same else 'NO':>8}"
+            )
+
+    hits, misses = SKELETON_LOOKUPS.get("hit"), SKELETON_LOOKUPS.get("miss")
+    print(f"\nskeleton lookups: {hits} hits, {misses} misses")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
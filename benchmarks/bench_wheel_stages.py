@@ -0,0 +1,114 @@
+# benchmarks/bench_wheel_stages.py
+#
+# Stage-count check of the kerykeion_data wheel pipeline
+# (render_wheel_pdf_from_kerykeion_data): for a natal and a synastry
+# payload, in every validation mode, each stage must run exactly once:
+#   build_chart_model_from_kerykeion_data -> ChartDrawer.generate_svg_string
+#   -> apply_phoenix_perfection -> themed_svg_to_pdf_bytes
+# The stages are wrapped with call counters for the run; the render time of
+# each case is printed alongside.
+#
+# Run from the repo root:
+#   python -m benchmarks.bench_wheel_stages
+# Exits non-zero when a stage runs more or less than once.
+
+import argparse
+import logging
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from kerykeion import ChartDrawer
+
+import app.services.chart_generator as chart_generator
+import app.services.wheel_generator as wheel_generator
+from app.core.config import settings
+from app.schemas.natal import NatalRequest
+from app.schemas.synastry import SynastryRequest
+from app.schemas.wheel import WheelPdfRequest
+from app.services.chart_generator import generate_natal_chart, generate_synastry_chart, generate_wheel_pdf_bytes
+from app.services.kerykeion_model_utils import VALIDATION_MODES, clear_model_cache
+
+# The subjects of all_charts_final_perfect.py
+FIRST = dict(name="Matthew Mikos", year=1976, month=2, day=2, hour=14, minute=28, lat=47.6588, lng=-117.4259,
+             tz_str="America/Los_Angeles", city="Spokane", country="US")
+SECOND = dict(name="Soulmate", year=1980, month=7, day=15, hour=9, minute=30, lat=37.7749, lng=-122.4194,
+              tz_str="America/Los_Angeles", city="San Francisco", country="US")
+
+STAGES = (
+    "build_chart_model_from_kerykeion_data",
+    "generate_svg_string",
+    "apply_phoenix_perfection",
+    "themed_svg_to_pdf_bytes",
+)
+
+
+def _counting(calls: Counter, name: str, fn):
+    def wrapper(*args, **kwargs):
+        calls[name] += 1
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+@contextmanager
+def count_stage_calls():
+    """Counter of stage calls while the block runs; the originals come back afterwards."""
+    calls: Counter = Counter()
+    patches = [
+        (chart_generator, "build_chart_model_from_kerykeion_data"),
+        (chart_generator, "apply_phoenix_perfection"),
+        (wheel_generator, "apply_phoenix_perfection"),
+        (chart_generator, "themed_svg_to_pdf_bytes"),
+        (wheel_generator, "themed_svg_to_pdf_bytes"),
+        (ChartDrawer, "generate_svg_string"),
+    ]
+    originals = [(owner, attr, getattr(owner, attr)) for owner, attr in patches]
+    try:
+        for owner, attr, fn in originals:
+            setattr(owner, attr, _counting(calls, attr, fn))
+        yield calls
+    finally:
+        for owner, attr, fn in originals:
+            setattr(owner, attr, fn)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.parse_args()
+
+    logging.disable(logging.INFO)
+    payloads = {
+        "natal": generate_natal_chart(NatalRequest(**FIRST, theme="classic"), frozenset({"data"}))["data"],
+        "synastry": generate_synastry_chart(
+            SynastryRequest(first=FIRST, second=SECOND, theme="classic"), frozenset({"data"})
+        )["data"],
+    }
+
+    header = f"{'payload':<10} {'mode':<8} {'ms':>7}  " + " ".join(f"{stage.split('_')[0]:>6}" for stage in STAGES)
+    print(header)
+    print("-" * len(header))
+    failed = False
+    for chart_type, kdata in payloads.items():
+        for mode in VALIDATION_MODES:
+            settings.kerykeion_validation = mode
+            clear_model_cache()
+            req = WheelPdfRequest(name=FIRST["name"], theme="classic", chart_type=chart_type, kerykeion_data=kdata)
+            with count_stage_calls() as calls:
+                t0 = time.perf_counter()
+                pdf = generate_wheel_pdf_bytes(req)
+                ms = (time.perf_counter() - t0) * 1000.0
+            print(f"{chart_type:<10} {mode:<8} {ms:>7.0f}  " + " ".join(f"{calls[stage]:>6}" for stage in STAGES))
+            if not pdf.startswith(b"%PDF"):
+                print(f"FAIL: {chart_type} / {mode}: no PDF")
+                failed = True
+            for stage in STAGES:
+                if calls[stage] != 1:
+                    print(f"FAIL: {chart_type} / {mode}: {stage} ran {calls[stage]} times")
+                    failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()